@@ -2,8 +2,9 @@
 
 import os
 import sys
+import time
 import joblib
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -25,6 +26,8 @@ from train_and_predict import (
 import pandas as pd
 import numpy as np
 
+CATEGORY_COLUMNS = {"teamA": "category", "teamB": "category", "winner": "category", "map_name": "category"}
+
 class AdvancedPredictor:
     """Advanced predictor using the new training system."""
     
@@ -37,11 +40,14 @@ class AdvancedPredictor:
         self.calibrator = None
         self.xcols = None
         self.df_hist = None
+        self._dates_ns = None
         self.use_enhanced = False
         self.model_type = "standard"
         self._load_artifacts()
         self._load_enhanced_artifacts()
         self._load_historical_data()
+        # Identifies this model/history snapshot; prediction caches key on it
+        self.model_loaded_at = time.monotonic()
     
     def _load_artifacts(self):
         """Load the trained model and calibrator."""
@@ -117,46 +123,58 @@ class AdvancedPredictor:
                 csv_path = str(project_root / csv_path)
             
             if os.path.exists(csv_path):
-                self.df_hist = pd.read_csv(csv_path)
-                self.df_hist["date"] = pd.to_datetime(self.df_hist["date"])
+                # Name columns as categoricals: equality masks compare int codes, not Python strings
+                df = pd.read_csv(csv_path, dtype=CATEGORY_COLUMNS)
+                df["date"] = pd.to_datetime(df["date"])
+                # Sort once so "before ref_date" is a binary search and a prefix slice
+                self.df_hist = df.dropna(subset=["date"]).sort_values("date", kind="mergesort", ignore_index=True)
+                self._dates_ns = self.df_hist["date"].values.astype("datetime64[ns]").view(np.int64)
                 print(f"Loaded historical data from {csv_path}")
             else:
                 print(f"Historical data not found at {csv_path}")
         except Exception as e:
             print(f"Failed to load historical data: {e}")
     
-    def _compute_feature_row_for_match(self, teamA: str, teamB: str, map_name: str, ref_date: Optional[datetime] = None) -> Dict[str, float]:
+    def _history_before(self, ref_date: datetime) -> pd.DataFrame:
+        """Rows dated strictly before ref_date, as a prefix of the date-sorted history."""
+        cut = np.searchsorted(self._dates_ns, pd.Timestamp(ref_date).value, side="left")
+        return self.df_hist.iloc[:cut]
+    
+    def _compute_feature_row_for_match(self, teamA: str, teamB: str, map_name: str, ref_date: Optional[datetime] = None,
+                                       map_elo: Optional[Dict[Tuple[str, str], float]] = None) -> Dict[str, float]:
         """Compute features for a specific match."""
         if self.df_hist is None:
             raise ValueError("No historical data available")
         
         if ref_date is None:
             ref_date = self.df_hist["date"].max() + pd.Timedelta(days=1)
+        hist = self._history_before(ref_date)
         
         # Win rate features
-        wrA = recency_weighted_winrate(self.df_hist, ref_date, teamA, map_name)
-        wrB = recency_weighted_winrate(self.df_hist, ref_date, teamB, map_name)
+        wrA = recency_weighted_winrate(hist, ref_date, teamA, map_name)
+        wrB = recency_weighted_winrate(hist, ref_date, teamB, map_name)
         winrate_diff = (wrA if wrA is not None else 0.5) - (wrB if wrB is not None else 0.5)
         
         # H2H features
-        h2h = h2h_shrunken(self.df_hist, ref_date, teamA, teamB, map_name)
+        h2h = h2h_shrunken(hist, ref_date, teamA, teamB, map_name)
         
-        # SOS features via map-Elo
-        map_elo = compute_map_elo(self.df_hist)
+        # SOS features via map-Elo (callers scoring several maps pass the table in)
+        if map_elo is None:
+            map_elo = compute_map_elo(self.df_hist)
         RA = map_elo.get((teamA, map_name), 1500.0)
         RB = map_elo.get((teamB, map_name), 1500.0)
         sos_diff = (RA - RB) / 400.0
         
         # Player stats features
         def recency_agg_metric(team: str, metric: str) -> Optional[float]:
-            rows = self.df_hist[(self.df_hist["date"] < ref_date) & (self.df_hist["map_name"] == map_name) &
-                               ((self.df_hist["teamA"] == team) | (self.df_hist["teamB"] == team))]
+            rows = hist[(hist["map_name"] == map_name) & ((hist["teamA"] == team) | (hist["teamB"] == team))]
             if rows.empty: 
                 return None
             num, den = 0.0, 0.0
-            for _, r in rows.iterrows():
-                w = recency_weight(r["date"], ref_date, HALF_LIFE_DAYS)
-                val = r[f"teamA_{metric}"] if r["teamA"] == team else r[f"teamB_{metric}"]
+            cols = rows[["date", "teamA", f"teamA_{metric}", f"teamB_{metric}"]].itertuples(index=False, name=None)
+            for d, tA, valA, valB in cols:
+                w = recency_weight(d, ref_date, HALF_LIFE_DAYS)
+                val = valA if tA == team else valB
                 if pd.notnull(val):
                     num += w * val
                     den += w
@@ -224,53 +242,71 @@ class AdvancedPredictor:
     
     def predict(self, teamA: str, teamB: str, map_name: str) -> Dict:
         """Make a prediction for a map outcome."""
+        return self.predict_many(teamA, teamB, [map_name])[0]
+    
+    def predict_many(self, teamA: str, teamB: str, maps: List[str]) -> List[Dict]:
+        """Predict one matchup on several maps with a single model call."""
         try:
             # Use enhanced model if available, otherwise fall back to standard
             if self.use_enhanced and hasattr(self, 'enhanced_pipeline'):
-                return self._predict_enhanced(teamA, teamB, map_name)
+                return [self._predict_enhanced(teamA, teamB, m) for m in maps]
             elif self.model is None or self.calibrator is None or self.xcols is None:
                 # Fallback prediction
-                return self._fallback_prediction(teamA, teamB, map_name)
+                return [self._fallback_prediction(teamA, teamB, m) for m in maps]
             
-            # Compute features
-            feats = self._compute_feature_row_for_match(teamA, teamB, map_name)
-            X = np.array([[feats[c] for c in self.xcols]], dtype=float)
+            return self._predict_standard(teamA, teamB, maps)
             
-            # Make prediction
-            p_raw = self.model.predict_proba(X)[:, 1]
-            p_cal = self.calibrator.transform(p_raw)
-
-            # Data sufficiency checks (per-team recent maps on this map)
-            ref_date = self.df_hist["date"].max()
-            histA = self.df_hist[(self.df_hist["date"] < ref_date) & (self.df_hist["map_name"] == map_name) & ((self.df_hist["teamA"] == teamA) | (self.df_hist["teamB"] == teamA))]
-            histB = self.df_hist[(self.df_hist["date"] < ref_date) & (self.df_hist["map_name"] == map_name) & ((self.df_hist["teamA"] == teamB) | (self.df_hist["teamB"] == teamB))]
+        except Exception as e:
+            print(f"Prediction failed: {e}")
+            return [self._fallback_prediction(teamA, teamB, m) for m in maps]
+    
+    def _predict_standard(self, teamA: str, teamB: str, maps: List[str]) -> List[Dict]:
+        """Score all maps as one feature matrix with the calibrated standard model."""
+        # Map-Elo depends only on history, so build it once for every map
+        map_elo = compute_map_elo(self.df_hist)
+        
+        # Compute features
+        feats_by_map = [self._compute_feature_row_for_match(teamA, teamB, m, map_elo=map_elo) for m in maps]
+        X = np.array([[feats[c] for c in self.xcols] for feats in feats_by_map], dtype=float)
+        
+        # Make prediction
+        p_raw = self.model.predict_proba(X)[:, 1]
+        p_cal = self.calibrator.transform(p_raw)
+        
+        # Compute factor contributions
+        scaler = self.model.named_steps["scaler"]
+        clf = self.model.named_steps["clf"]
+        contrib = scaler.transform(X) * clf.coef_
+        
+        # Data sufficiency checks (per-team recent maps on this map)
+        hist = self._history_before(self.df_hist["date"].max())
+        
+        results = []
+        for i, (map_name, feats) in enumerate(zip(maps, feats_by_map)):
+            on_map = hist[hist["map_name"] == map_name]
+            histA = on_map[(on_map["teamA"] == teamA) | (on_map["teamB"] == teamA)]
+            histB = on_map[(on_map["teamA"] == teamB) | (on_map["teamB"] == teamB)]
             nA, nB = int(len(histA)), int(len(histB))
-
+            
             # Elo-only probability as a simple fallback/blend
-            map_elo = compute_map_elo(self.df_hist)
             RA = map_elo.get((teamA, map_name), 1500.0)
             RB = map_elo.get((teamB, map_name), 1500.0)
             p_elo = 1.0 / (1.0 + 10.0 ** ((RB - RA) / 400.0))
-
+            
             # Blend if data is thin
             if min(nA, nB) < 5:
                 alpha = 0.7  # weight on calibrated model
-                p_blend = alpha * float(p_cal[0]) + (1.0 - alpha) * float(p_elo)
+                p_blend = alpha * float(p_cal[i]) + (1.0 - alpha) * float(p_elo)
                 uncertainty = "high"
             elif min(nA, nB) < 15:
                 alpha = 0.85
-                p_blend = alpha * float(p_cal[0]) + (1.0 - alpha) * float(p_elo)
+                p_blend = alpha * float(p_cal[i]) + (1.0 - alpha) * float(p_elo)
                 uncertainty = "med"
             else:
-                p_blend = float(p_cal[0])
+                p_blend = float(p_cal[i])
                 uncertainty = "low"
             
-            # Compute factor contributions
-            scaler = self.model.named_steps["scaler"]
-            clf = self.model.named_steps["clf"]
-            x_std = scaler.transform(X)
-            contrib = (x_std * clf.coef_).ravel()
-            factor_breakdown = {col: float(contrib[i]) for i, col in enumerate(self.xcols)}
+            factor_breakdown = {col: float(contrib[i, j]) for j, col in enumerate(self.xcols)}
             
             explanation = (
                 f"{teamA} vs {teamB} on {map_name}: "
@@ -282,18 +318,16 @@ class AdvancedPredictor:
                 f"ACS_diff({feats['acs_diff']:+.1f}), KD_diff({feats['kd_diff']:+.2f})."
             )
             
-            return {
+            results.append({
                 "prob_teamA": float(p_blend),
                 "prob_teamB": float(1.0 - p_blend),
                 "features": feats,
                 "factor_contrib": factor_breakdown,
                 "explanation": explanation,
                 "uncertainty": uncertainty
-            }
-            
-        except Exception as e:
-            print(f"Prediction failed: {e}")
-            return self._fallback_prediction(teamA, teamB, map_name)
+            })
+        
+        return results
     
     def _fallback_prediction(self, teamA: str, teamB: str, map_name: str) -> Dict:
         """Fallback prediction when model is not available."""
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     vlr_timeout: int = 30
     vlr_retry_attempts: int = 3
     vlr_retry_delay: float = 1.0
+    vlr_max_backoff: float = 30.0  # Cap on a single retry delay (seconds)
+    vlr_jitter: float = 0.5  # Up to +50% random jitter on each retry delay
+    vlr_max_concurrent_requests: int = 5  # In-flight VLR.gg requests across the whole app
     
     # Caching
     cache_ttl: int = 300  # 5 minutes
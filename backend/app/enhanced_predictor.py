@@ -13,70 +13,73 @@ logger = get_logger(__name__)
 class MatchHistory:
     """Stores and manages historical match data."""
     
+    FORM_WINDOW = 20
+    
     def __init__(self, data_file: str = "data/match_history.json"):
         self.data_file = Path(data_file)
         self.data_file.parent.mkdir(exist_ok=True)
+        # Lookup indexes: last K results per team and all results per pairing
+        self.form_by_team: Dict[str, deque] = {}
+        self.h2h: Dict[frozenset, List[Dict[str, Any]]] = {}
         self.history = self._load_history()
     
+    @staticmethod
+    def _h2h_key(team1: str, team2: str) -> frozenset:
+        """Order-independent key for a pairing."""
+        return frozenset((team1, team2))
+    
     def _load_history(self) -> Dict[str, Any]:
-        """Load historical data from file."""
+        """Load historical data and its persisted indexes from file."""
         if self.data_file.exists():
             try:
                 with open(self.data_file, 'r') as f:
                     data = json.load(f)
-                    # Convert string representations of deques back to actual deques
-                    for team, record in data.get("team_records", {}).items():
-                        if "recent_form" in record and isinstance(record["recent_form"], str):
-                            # Parse deque string representation
-                            form_str = record["recent_form"]
-                            if "deque(" in form_str and "maxlen=" in form_str:
-                                # Extract the list from the deque string
-                                start = form_str.find('[')
-                                end = form_str.rfind(']')
-                                if start != -1 and end != -1:
-                                    form_list = eval(form_str[start:end+1])
-                                    record["recent_form"] = deque(form_list, maxlen=10)
-                                else:
-                                    record["recent_form"] = deque(maxlen=10)
-                            else:
-                                record["recent_form"] = deque(maxlen=10)
-                    
-                    for h2h_key, h2h_data in data.get("head_to_head", {}).items():
-                        if "recent_matches" in h2h_data and isinstance(h2h_data["recent_matches"], str):
-                            # Parse deque string representation
-                            matches_str = h2h_data["recent_matches"]
-                            if "deque(" in matches_str and "maxlen=" in matches_str:
-                                start = matches_str.find('[')
-                                end = matches_str.rfind(']')
-                                if start != -1 and end != -1:
-                                    matches_list = eval(matches_str[start:end+1])
-                                    h2h_data["recent_matches"] = deque(matches_list, maxlen=5)
-                                else:
-                                    h2h_data["recent_matches"] = deque(maxlen=5)
-                            else:
-                                h2h_data["recent_matches"] = deque(maxlen=5)
-                    
-                    return data
+                
+                form_index = data.pop("form_by_team", None)
+                h2h_index = data.pop("h2h", None)
+                
+                if form_index is None or h2h_index is None:
+                    # Older files only have the match list; index it once
+                    for match in data.get("matches", []):
+                        self._index_match(match["team1"], match["team2"],
+                                          match.get("winner"), match.get("timestamp"))
+                else:
+                    for team, form in form_index.items():
+                        self.form_by_team[team] = deque(form, maxlen=self.FORM_WINDOW)
+                    for entry in h2h_index:
+                        self.h2h[self._h2h_key(*entry["teams"])] = entry["matches"]
+                
+                data.pop("head_to_head", None)
+                for record in data.get("team_records", {}).values():
+                    record.pop("recent_form", None)
+                
+                return data
             except Exception as e:
                 logger.error(f"Failed to load match history: {e}")
         return {
             "matches": [],
             "team_records": {},
-            "head_to_head": {},
             "map_performance": {}
         }
     
     def _save_history(self):
-        """Save historical data to file."""
+        """Save historical data and indexes to file."""
         try:
+            data = dict(self.history)
+            data["form_by_team"] = {team: list(form) for team, form in self.form_by_team.items()}
+            data["h2h"] = [
+                {"teams": sorted(pair), "matches": matches}
+                for pair, matches in self.h2h.items()
+            ]
             with open(self.data_file, 'w') as f:
-                json.dump(self.history, f, indent=2, default=str)
+                json.dump(data, f, indent=2, default=str)
         except Exception as e:
             logger.error(f"Failed to save match history: {e}")
     
     def add_match(self, match_data: Dict[str, Any]):
         """Add a completed match to history."""
         match_id = match_data.get("id", f"match_{len(self.history['matches'])}")
+        timestamp = datetime.utcnow().isoformat()
         
         # Add to matches list
         self.history["matches"].append({
@@ -85,7 +88,7 @@ class MatchHistory:
             "team2": match_data["team2"]["name"],
             "winner": match_data.get("winner"),
             "maps": match_data.get("maps", []),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "tournament": match_data.get("tournament"),
             "round": match_data.get("round")
         })
@@ -93,8 +96,9 @@ class MatchHistory:
         # Update team records
         self._update_team_records(match_data)
         
-        # Update head-to-head records
-        self._update_head_to_head(match_data)
+        # Update form and head-to-head indexes
+        self._index_match(match_data["team1"]["name"], match_data["team2"]["name"],
+                          match_data.get("winner"), timestamp)
         
         # Update map performance
         self._update_map_performance(match_data)
@@ -116,51 +120,31 @@ class MatchHistory:
         
         # Initialize team records if needed
         if team1 not in self.history["team_records"]:
-            self.history["team_records"][team1] = {"wins": 0, "losses": 0, "recent_form": deque(maxlen=10)}
+            self.history["team_records"][team1] = {"wins": 0, "losses": 0}
         if team2 not in self.history["team_records"]:
-            self.history["team_records"][team2] = {"wins": 0, "losses": 0, "recent_form": deque(maxlen=10)}
+            self.history["team_records"][team2] = {"wins": 0, "losses": 0}
         
         # Update records
         if winner == team1:
             self.history["team_records"][team1]["wins"] += 1
-            self.history["team_records"][team1]["recent_form"].append("W")
             self.history["team_records"][team2]["losses"] += 1
-            self.history["team_records"][team2]["recent_form"].append("L")
         else:
             self.history["team_records"][team2]["wins"] += 1
-            self.history["team_records"][team2]["recent_form"].append("W")
             self.history["team_records"][team1]["losses"] += 1
-            self.history["team_records"][team1]["recent_form"].append("L")
     
-    def _update_head_to_head(self, match_data: Dict[str, Any]):
-        """Update head-to-head records between teams."""
-        team1 = match_data["team1"]["name"]
-        team2 = match_data["team2"]["name"]
-        winner = match_data.get("winner")
-        
+    def _index_match(self, team1: str, team2: str, winner: Optional[str], timestamp: Optional[str]):
+        """Append a result to the per-team form and per-pairing H2H indexes."""
         if not winner:
             return
         
-        # Create consistent key for H2H (alphabetical order)
-        h2h_key = tuple(sorted([team1, team2]))
+        for team in (team1, team2):
+            if team not in self.form_by_team:
+                self.form_by_team[team] = deque(maxlen=self.FORM_WINDOW)
+            self.form_by_team[team].append("W" if winner == team else "L")
         
-        if h2h_key not in self.history["head_to_head"]:
-            self.history["head_to_head"][str(h2h_key)] = {
-                "team1": h2h_key[0],
-                "team2": h2h_key[1],
-                "team1_wins": 0,
-                "team2_wins": 0,
-                "recent_matches": deque(maxlen=5)
-            }
-        
-        h2h = self.history["head_to_head"][str(h2h_key)]
-        
-        if winner == h2h["team1"]:
-            h2h["team1_wins"] += 1
-            h2h["recent_matches"].append({"winner": h2h["team1"], "timestamp": datetime.utcnow().isoformat()})
-        else:
-            h2h["team2_wins"] += 1
-            h2h["recent_matches"].append({"winner": h2h["team2"], "timestamp": datetime.utcnow().isoformat()})
+        self.h2h.setdefault(self._h2h_key(team1, team2), []).append(
+            {"winner": winner, "timestamp": timestamp}
+        )
     
     def _update_map_performance(self, match_data: Dict[str, Any]):
         """Update map-specific performance records."""
@@ -190,29 +174,23 @@ class MatchHistory:
     
     def get_team_form(self, team_name: str, matches: int = 5) -> Dict[str, Any]:
         """Get recent form for a team."""
-        if team_name not in self.history["team_records"]:
-            return {"form": [], "win_rate": 0.5, "streak": 0, "streak_type": "none"}
-        
-        team_data = self.history["team_records"][team_name]
-        recent_form = list(team_data["recent_form"])[-matches:]
+        recent_form = list(self.form_by_team.get(team_name, ()))[-matches:]
         
         if not recent_form:
-            return {"form": [], "win_rate": 0.5, "streak": 0, "streak_type": "none"}
+            return {"form": [], "win_rate": 0.5, "streak": 0, "streak_type": "none", "total_matches": 0}
         
         wins = recent_form.count("W")
         win_rate = wins / len(recent_form)
         
         # Calculate current streak
         streak = 0
-        streak_type = "none"
-        if recent_form:
-            last_result = recent_form[-1]
-            for result in reversed(recent_form):
-                if result == last_result:
-                    streak += 1
-                else:
-                    break
-            streak_type = "win" if last_result == "W" else "loss"
+        last_result = recent_form[-1]
+        for result in reversed(recent_form):
+            if result == last_result:
+                streak += 1
+            else:
+                break
+        streak_type = "win" if last_result == "W" else "loss"
         
         return {
             "form": recent_form,
@@ -224,17 +202,17 @@ class MatchHistory:
     
     def get_head_to_head(self, team1: str, team2: str) -> Dict[str, Any]:
         """Get head-to-head record between two teams."""
-        h2h_key = tuple(sorted([team1, team2]))
-        h2h_key_str = str(h2h_key)
+        h2h_matches = self.h2h.get(self._h2h_key(team1, team2), [])
         
-        if h2h_key_str not in self.history["head_to_head"]:
+        if not h2h_matches:
             return {"team1_wins": 0, "team2_wins": 0, "total_matches": 0, "recent_trend": "none"}
         
-        h2h = self.history["head_to_head"][h2h_key_str]
-        total_matches = h2h["team1_wins"] + h2h["team2_wins"]
+        total_matches = len(h2h_matches)
+        team1_wins = sum(1 for match in h2h_matches if match["winner"] == team1)
+        team2_wins = total_matches - team1_wins
         
         # Calculate recent trend (last 3 matches)
-        recent_matches = list(h2h["recent_matches"])[-3:]
+        recent_matches = h2h_matches[-3:]
         recent_trend = "none"
         if len(recent_matches) >= 2:
             recent_wins = sum(1 for match in recent_matches if match["winner"] == team1)
@@ -246,11 +224,11 @@ class MatchHistory:
                 recent_trend = "mixed"
         
         return {
-            "team1_wins": h2h["team1_wins"],
-            "team2_wins": h2h["team2_wins"],
+            "team1_wins": team1_wins,
+            "team2_wins": team2_wins,
             "total_matches": total_matches,
             "recent_trend": recent_trend,
-            "team1_win_rate": h2h["team1_wins"] / total_matches if total_matches > 0 else 0.5
+            "team1_win_rate": team1_wins / total_matches
         }
     
     def get_map_performance(self, team_name: str, map_name: str) -> Dict[str, Any]:
@@ -1,12 +1,14 @@
 """Feature store with caching for team statistics and match data."""
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+import time
 import asyncio
+import numpy as np
 from cachetools import TTLCache
 from app.upstream import vlr_client
 from app.team_mapping import team_mapper
 from app.config import settings
+from app.predictor import STAT_KEYS
 from app.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -20,70 +22,125 @@ class FeatureStore:
             ttl=settings.features_cache_ttl
         )
         self.stats_lookback_days = settings.stats_lookback_days
+        # Upstream fetches in progress, so concurrent misses share one request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Struct-of-arrays copy of the heuristic stats (STAT_KEYS order), one row per team; bounded
+        # like the cache, so the least recently written team gives up its row when it is full
+        self._stats_matrix = np.zeros((settings.max_cache_size, len(STAT_KEYS)), dtype=np.float32)
+        self._team_index: Dict[str, int] = {}
     
     def _get_cache_key(self, prefix: str, identifier: str) -> str:
         """Generate cache key."""
         return f"{prefix}:{identifier}"
     
+    def _write_stats_row(self, team_id: str, stats: Dict[str, Any]):
+        """Write a team's heuristic stats into its row of the stats matrix."""
+        # Dicts keep insertion order, so re-inserting on write makes the first key the stalest
+        row = self._team_index.pop(team_id, None)
+        if row is None:
+            if len(self._team_index) < len(self._stats_matrix):
+                row = len(self._team_index)
+            else:
+                row = self._team_index.pop(next(iter(self._team_index)))
+        self._team_index[team_id] = row
+        self._stats_matrix[row] = [stats.get(key, 0.0) for key in STAT_KEYS]
+    
+    def get_stats_rows(self, team_ids: List[str]) -> np.ndarray:
+        """Gather (N, 4) heuristic stats for teams already fetched via get_team_stats."""
+        rows = [self._team_index.get(team_id) for team_id in team_ids]
+        if None not in rows:
+            return self._stats_matrix[rows]
+        
+        # More teams than the matrix holds: rebuild evicted rows from the cached stats,
+        # or zeros (the default stats) once those are gone too
+        return np.array([
+            self._stats_matrix[row] if row is not None else [
+                self.cache.get(self._get_cache_key("team_stats", team_id), {}).get(key, 0.0) for key in STAT_KEYS
+            ]
+            for team_id, row in zip(team_ids, rows)
+        ], dtype=np.float32)
+    
+    async def _single_flight(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch once per key; concurrent callers await the same result."""
+        future = self._inflight.get(cache_key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged by asyncio
+            future.exception()
+            raise
+        finally:
+            del self._inflight[cache_key]
+    
     async def get_team_stats(self, team_id: str) -> Dict[str, Any]:
         """Get team statistics with caching and professional team mapping."""
         cache_key = self._get_cache_key("team_stats", team_id)
         
         # Check cache first
         if cache_key in self.cache:
-            logger.debug(f"Cache hit for team stats: {team_id}")
-            return self.cache[cache_key]
+            logger.debug("Cache hit for team stats: %s", team_id)
+            stats = self.cache[cache_key]
+            # Refresh the team's row too, so a cached team is never the stalest row
+            self._write_stats_row(team_id, stats)
+            return stats
         
-        # First, try to get professional team info from our mapping
-        professional_team = team_mapper.get_team_by_id(team_id)
+        # First, try the stats precomputed from our professional team mapping
+        processed_stats = team_mapper.get_precomputed_stats(team_id)
         
-        if professional_team:
-            logger.info(f"Using professional team mapping for {team_id}: {professional_team.name}")
-            # Create stats from professional team info
-            processed_stats = {
-                "team_id": team_id,
-                "team_name": professional_team.name,
-                "avg_acs": 200.0 + (professional_team.rank * -2),  # Better rank = higher ACS
-                "avg_kd": 1.0 + (professional_team.rank * -0.01),  # Better rank = higher K/D
-                "avg_rating": 1.0 + (professional_team.rank * -0.005),  # Better rank = higher rating
-                "win_rate": 0.5 + (professional_team.rank * -0.002),  # Better rank = higher win rate
-                "maps_played": 30,
-                "last_updated": datetime.utcnow(),
-                "raw_data": {
+        if processed_stats is not None:
+            logger.info(f"Using professional team mapping for {team_id}: {processed_stats['team_name']}")
+            processed_stats["last_updated"] = time.time()
+            if settings.debug:
+                professional_team = team_mapper.get_team_by_id(team_id)
+                processed_stats["raw_data"] = {
                     "team": {"name": professional_team.name, "id": team_id},
-                    "summary_stats": {
-                        "avg_acs": 200.0 + (professional_team.rank * -2),
-                        "avg_kd": 1.0 + (professional_team.rank * -0.01),
-                        "avg_rating": 1.0 + (professional_team.rank * -0.005),
-                        "win_rate": 0.5 + (professional_team.rank * -0.002),
-                        "maps_played": 30,
-                        "rank": professional_team.rank,
-                        "record": professional_team.record,
-                        "earnings": professional_team.earnings,
-                        "region": professional_team.region
-                    }
+                    "record": professional_team.record,
+                    "earnings": professional_team.earnings
                 }
-            }
             
             # Cache the professional team stats
             self.cache[cache_key] = processed_stats
+            self._write_stats_row(team_id, processed_stats)
             return processed_stats
         
         # Fallback to VLR client for teams not in our mapping
         logger.info(f"Team {team_id} not in professional mapping, using VLR client")
         try:
-            stats = await vlr_client.get_team_stats(team_id, self.stats_lookback_days)
-            
-            # Process and cache the data
-            processed_stats = self._process_team_stats(stats, team_id)
-            self.cache[cache_key] = processed_stats
-            
-            return processed_stats
-            
+            return await self._single_flight(cache_key, lambda: self._fetch_team_stats(team_id, cache_key))
         except Exception as e:
-            logger.error(f"Failed to fetch team stats for {team_id}: {e}")
+            logger.error("Failed to fetch team stats for %s: %s", team_id, e)
             # Return default stats if API fails
-            return self._get_default_team_stats(team_id)
+            default_stats = self._get_default_team_stats(team_id)
+            self._write_stats_row(team_id, default_stats)
+            return default_stats
+    
+    async def _fetch_team_stats(self, team_id: str, cache_key: str) -> Dict[str, Any]:
+        """Fetch team stats from the VLR client, then process and cache them."""
+        stats = await vlr_client.get_team_stats(team_id, self.stats_lookback_days)
+        
+        # Process and cache the data
+        processed_stats = self._process_team_stats(stats, team_id)
+        self.cache[cache_key] = processed_stats
+        self._write_stats_row(team_id, processed_stats)
+        
+        return processed_stats
+    
+    async def get_team_stats_many(self, team_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for several teams, fetching each unique team once."""
+        unique_ids = list(dict.fromkeys(team_ids))
+        results = await asyncio.gather(*[self.get_team_stats(team_id) for team_id in unique_ids])
+        return dict(zip(unique_ids, results))
     
     def _process_team_stats(self, raw_stats: Dict[str, Any], team_id: str) -> Dict[str, Any]:
         """Process raw team stats into features."""
@@ -93,7 +150,7 @@ class FeatureStore:
             summary_stats = raw_stats.get("summary_stats", {})
             
             if not summary_stats:
-                logger.warning(f"No summary stats found for team {team_id}")
+                logger.warning("No summary stats found for team %s", team_id)
                 return self._get_default_team_stats(team_id)
             
             # Extract team name from the team object
@@ -109,7 +166,7 @@ class FeatureStore:
             
             logger.info(f"Processed stats for {team_name}: ACS={avg_acs}, K/D={avg_kd}, Rating={avg_rating}, Win Rate={win_rate}")
             
-            return {
+            processed_stats = {
                 "team_id": team_id,
                 "team_name": team_name,
                 "avg_acs": round(avg_acs, 2),
@@ -117,12 +174,16 @@ class FeatureStore:
                 "avg_rating": round(avg_rating, 2),
                 "win_rate": round(win_rate, 3),
                 "maps_played": maps_played,
-                "last_updated": datetime.utcnow(),
-                "raw_data": raw_stats  # Keep raw data for debugging
+                "rank": summary_stats.get("rank"),
+                "region": summary_stats.get("region"),
+                "last_updated": time.time()
             }
+            if settings.debug:
+                processed_stats["raw_data"] = raw_stats  # Keep raw data for debugging
+            return processed_stats
             
         except Exception as e:
-            logger.error(f"Error processing team stats for {team_id}: {e}")
+            logger.error("Error processing team stats for %s: %s", team_id, e)
             return self._get_default_team_stats(team_id)
     
     def _extract_team_performance(self, match: Dict[str, Any], team_id: str) -> Optional[Dict[str, Any]]:
@@ -137,7 +198,7 @@ class FeatureStore:
                 "won": True  # Mock data
             }
         except Exception as e:
-            logger.error(f"Error extracting team performance: {e}")
+            logger.error("Error extracting team performance: %s", e)
             return None
     
     def _get_default_team_stats(self, team_id: str) -> Dict[str, Any]:
@@ -150,7 +211,7 @@ class FeatureStore:
             "avg_rating": 0.0,
             "win_rate": 0.0,
             "maps_played": 0,
-            "last_updated": datetime.utcnow(),
+            "last_updated": time.time(),
             "raw_data": {}
         }
     
@@ -164,13 +225,17 @@ class FeatureStore:
         
         logger.info(f"Fetching match details from API: {match_id}")
         try:
-            match_data = await vlr_client.get_match_details(match_id)
-            self.cache[cache_key] = match_data
-            return match_data
+            return await self._single_flight(cache_key, lambda: self._fetch_match_details(match_id, cache_key))
         except Exception as e:
-            logger.error(f"Failed to fetch match details for {match_id}: {e}")
+            logger.error("Failed to fetch match details for %s: %s", match_id, e)
             return {}
     
+    async def _fetch_match_details(self, match_id: str, cache_key: str) -> Dict[str, Any]:
+        """Fetch match details from the VLR client and cache them."""
+        match_data = await vlr_client.get_match_details(match_id)
+        self.cache[cache_key] = match_data
+        return match_data
+    
     def clear_cache(self):
         """Clear all cached data."""
         self.cache.clear()
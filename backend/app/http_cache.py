@@ -0,0 +1,47 @@
+"""Conditional-GET helpers: ETag and Cache-Control for slowly changing payloads."""
+
+import hashlib
+from typing import Any, Tuple
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+CACHE_CONTROL = "max-age=60, stale-while-revalidate=30"
+# For payloads fixed for the life of the process (they only change on redeploy)
+STATIC_CACHE_CONTROL = "public, max-age=3600, immutable"
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak-validator prefix, for If-None-Match's weak comparison."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(_opaque_tag(tag) == _opaque_tag(etag) for tag in candidates)
+
+def json_body(payload: Any) -> Tuple[bytes, str]:
+    """Serialize payload and derive its ETag."""
+    body = orjson.dumps(payload, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    # Weak, since GZipMiddleware may send the same payload gzip- or identity-encoded
+    return body, f'W/"{hashlib.md5(body).hexdigest()}"'
+
+def etag_response(request: Request, body: bytes, etag: str, cache_control: str = CACHE_CONTROL) -> Response:
+    """Send an encoded body with its ETag, answering 304 when the client copy is current."""
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def cached_json_response(request: Request, payload: Any, cache_control: str = CACHE_CONTROL) -> Response:
+    """Serialize payload with an ETag, answering 304 when the client copy is current."""
+    body, etag = json_body(payload)
+    return etag_response(request, body, etag, cache_control)
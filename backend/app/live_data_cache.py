@@ -151,11 +151,11 @@ class LiveDataCache:
             if all_matches.empty:
                 return pd.DataFrame()
             
-            # Filter for this team
+            # Filter for this team (boolean indexing already returns a new frame; rows are only read)
             team_matches = all_matches[
                 (all_matches['teamA'] == team_name) | 
                 (all_matches['teamB'] == team_name)
-            ].copy()
+            ]
             
             if team_matches.empty:
                 logger.warning(f"⚠️ No matches found for {team_name} in VLR.gg data")
@@ -16,7 +16,6 @@ import numpy as np
 import joblib
 from typing import Optional
 from typing import Dict
-from datetime import datetime, timedelta
 from pathlib import Path
 
 from app.live_data_cache import live_cache
@@ -24,6 +23,8 @@ from app.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+DAY_NS = 86_400 * 10**9
+
 class LiveRealisticPredictor:
     """Realistic predictor with live data cache and 365-day lookback."""
     
@@ -151,64 +152,59 @@ class LiveRealisticPredictor:
                              teamA_data: pd.DataFrame, teamB_data: pd.DataFrame) -> np.ndarray:
         """Create features using live data with 365-day context (6 features)."""
         
+        # Win flags as plain arrays; counts come from these without building filtered frames
+        teamA_won = teamA_data['result'].values == 'win'
+        teamB_won = teamB_data['result'].values == 'win'
+        
         # 1. Overall winrate difference (365-day window)
-        teamA_wins = len(teamA_data[teamA_data['result'] == 'win'])
+        teamA_wins = np.count_nonzero(teamA_won)
         teamA_total = len(teamA_data)
         teamA_winrate = teamA_wins / max(teamA_total, 1)
         
-        teamB_wins = len(teamB_data[teamB_data['result'] == 'win'])
+        teamB_wins = np.count_nonzero(teamB_won)
         teamB_total = len(teamB_data)
         teamB_winrate = teamB_wins / max(teamB_total, 1)
         
         overall_winrate_diff = teamA_winrate - teamB_winrate
         
         # 2. Map-specific winrate difference
-        teamA_map = teamA_data[teamA_data['map_name'] == map_name]
-        teamB_map = teamB_data[teamB_data['map_name'] == map_name]
+        teamA_on_map = teamA_data['map_name'].values == map_name
+        teamB_on_map = teamB_data['map_name'].values == map_name
         
-        teamA_map_wins = len(teamA_map[teamA_map['result'] == 'win'])
-        teamA_map_total = len(teamA_map)
+        teamA_map_wins = np.count_nonzero(teamA_won & teamA_on_map)
+        teamA_map_total = np.count_nonzero(teamA_on_map)
         teamA_map_winrate = teamA_map_wins / max(teamA_map_total, 1)
         
-        teamB_map_wins = len(teamB_map[teamB_map['result'] == 'win'])
-        teamB_map_total = len(teamB_map)
+        teamB_map_wins = np.count_nonzero(teamB_won & teamB_on_map)
+        teamB_map_total = np.count_nonzero(teamB_on_map)
         teamB_map_winrate = teamB_map_wins / max(teamB_map_total, 1)
         
         map_winrate_diff = teamA_map_winrate - teamB_map_winrate
         
         # 3. Head-to-head advantage (from both team datasets)
-        h2h_teamA = teamA_data[teamA_data['opponent'] == teamB]
-        h2h_teamB = teamB_data[teamB_data['opponent'] == teamA]
+        h2h_teamA = teamA_data['opponent'].values == teamB
+        h2h_teamB = teamB_data['opponent'].values == teamA
         
-        teamA_h2h_wins = len(h2h_teamA[h2h_teamA['result'] == 'win'])
-        teamB_h2h_wins = len(h2h_teamB[h2h_teamB['result'] == 'win'])
-        total_h2h = len(h2h_teamA) + len(h2h_teamB)
+        teamA_h2h_wins = np.count_nonzero(teamA_won & h2h_teamA)
+        teamB_h2h_wins = np.count_nonzero(teamB_won & h2h_teamB)
+        total_h2h = np.count_nonzero(h2h_teamA) + np.count_nonzero(h2h_teamB)
         
         h2h_advantage = (teamA_h2h_wins - teamB_h2h_wins) / max(total_h2h, 1)
         
         # 4. Recent form difference (combine 5 and 10 game windows into one metric)
-        teamA_recent_10 = teamA_data.head(10)
-        teamB_recent_10 = teamB_data.head(10)
-        teamA_form_10 = len(teamA_recent_10[teamA_recent_10['result'] == 'win']) / max(len(teamA_recent_10), 1)
-        teamB_form_10 = len(teamB_recent_10[teamB_recent_10['result'] == 'win']) / max(len(teamB_recent_10), 1)
+        teamA_recent_10 = teamA_won[:10]
+        teamB_recent_10 = teamB_won[:10]
+        teamA_form_10 = np.count_nonzero(teamA_recent_10) / max(len(teamA_recent_10), 1)
+        teamB_form_10 = np.count_nonzero(teamB_recent_10) / max(len(teamB_recent_10), 1)
         recent_form_diff = teamA_form_10 - teamB_form_10
         
         # 5. Experience difference
         experience_diff = teamA_total - teamB_total
         
-        # 6. Rest advantage (days since last match)
-        teamA_last = teamA_data['match_date'].max() if not teamA_data.empty else datetime.now() - timedelta(days=30)
-        teamB_last = teamB_data['match_date'].max() if not teamB_data.empty else datetime.now() - timedelta(days=30)
-        
-        if hasattr(teamA_last, 'date'):
-            teamA_rest = (datetime.now() - teamA_last).days
-        else:
-            teamA_rest = 30
-            
-        if hasattr(teamB_last, 'date'):
-            teamB_rest = (datetime.now() - teamB_last).days
-        else:
-            teamB_rest = 30
+        # 6. Rest advantage (whole days since last match, in int64 nanoseconds)
+        now_ns = pd.Timestamp.now().value
+        teamA_rest = self._days_since_last_match(teamA_data, now_ns)
+        teamB_rest = self._days_since_last_match(teamB_data, now_ns)
         
         rest_advantage = teamA_rest - teamB_rest
         
@@ -221,6 +217,13 @@ class LiveRealisticPredictor:
             rest_advantage
         ])
     
+    def _days_since_last_match(self, team_data: pd.DataFrame, now_ns: int) -> int:
+        """Whole days between the team's latest match and now_ns (30 with no history)."""
+        if team_data.empty:
+            return 30
+        dates_ns = team_data['match_date'].values.astype('datetime64[ns]').view(np.int64)
+        return int((now_ns - dates_ns.max()) // DAY_NS)
+    
     def _calculate_momentum(self, team_data: pd.DataFrame) -> float:
         """Calculate team momentum (current streak)."""
         if team_data.empty:
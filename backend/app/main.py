@@ -1,12 +1,16 @@
 """FastAPI application with routers for VLR Valorant predictor."""
 
-from fastapi import FastAPI
+import asyncio
+import httpx
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.config import settings
 from app.logging_utils import get_logger
-import os
+from pathlib import Path
 
 logger = get_logger(__name__)
 
@@ -16,8 +20,45 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
+class UnhandledErrorMiddleware:
+    """Render unexpected errors as a 500 inside the middleware stack, so CORS and gzip still apply.
+    
+    An Exception handler registered on the app would run in Starlette's outermost
+    ServerErrorMiddleware instead, and its 500s would go out without CORS headers.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # Too late to swap in an error response once headers are out
+            if response_started:
+                raise
+            logger.error("Request to %s failed: %s", scope["path"], exc)
+            response = ORJSONResponse({"detail": f"Internal server error: {exc}"}, status_code=500)
+            await response(scope, receive, send)
+
+# Added first so it sits innermost, inside CORS and gzip
+app.add_middleware(UnhandledErrorMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -27,8 +68,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (match lists, analytics) on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Exception handlers (endpoints raise directly instead of wrapping every body in try/except)
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Render HTTPExceptions raised by endpoints."""
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+@app.exception_handler(httpx.HTTPError)
+async def upstream_exception_handler(request: Request, exc: httpx.HTTPError):
+    """Render failed VLR.gg upstream calls."""
+    logger.error("Upstream request failed on %s: %s", request.url.path, exc)
+    return ORJSONResponse({"detail": f"Upstream request failed: {exc}"}, status_code=500)
+
+# Any other unexpected error is rendered by UnhandledErrorMiddleware above
+
 # Include routers
 from app.routers import predictions, matches, health, teams, advanced_predictions, dashboard
+from app.upstream import vlr_client
+from app.predictor import trained_predictor
 
 app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(predictions.router, prefix="/predictions", tags=["predictions"])
@@ -37,28 +97,36 @@ app.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 app.include_router(matches.router, prefix="/matches", tags=["matches"])
 app.include_router(teams.router, prefix="/teams", tags=["teams"])
 
-# Mount static files for frontend (frontend is now in ../frontend from backend/)
-frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
-if os.path.exists(frontend_path):
-    app.mount("/frontend", StaticFiles(directory=frontend_path), name="frontend")
+# Frontend paths are resolved once at import rather than on every request.
+# In production, serve these from nginx (see README) so assets never reach an ASGI worker.
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+FRONTEND_INDEX = FRONTEND_DIR / "index.html"
+FRONTEND_INDEX_EXISTS = FRONTEND_INDEX.is_file()
+
+# Mount static files for frontend
+if FRONTEND_DIR.is_dir():
+    app.mount("/frontend", StaticFiles(directory=FRONTEND_DIR), name="frontend")
     # Also mount static files at root level for CSS/JS
-    app.mount("/static", StaticFiles(directory=frontend_path), name="static")
+    app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
 
 # Root endpoint to serve the main frontend page
 @app.get("/")
 async def read_root():
     """Serve the main frontend page."""
-    frontend_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend", "index.html")
-    if os.path.exists(frontend_file):
-        return FileResponse(frontend_file)
+    if FRONTEND_INDEX_EXISTS:
+        return FileResponse(FRONTEND_INDEX)
     return {"message": "VLR Valorant Predictor API", "docs": "/docs"}
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
     logger.info("Starting VLR Valorant Predictor API")
+    # Don't hold up startup on model deserialization; predictions use the baseline until it lands
+    # Keep a reference so the pending load isn't garbage-collected before it finishes
+    app.state.model_load_task = asyncio.create_task(trained_predictor.ensure_loaded())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down VLR Valorant Predictor API")
+    await vlr_client.close()
@@ -1,23 +1,51 @@
 """Baseline and trained predictor models for match outcomes."""
 
-import pickle
+import asyncio
+import joblib
 import numpy as np
-from typing import Dict, Any, Tuple, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Tuple, Optional
+import time
 from pathlib import Path
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
 from app.config import settings
 from app.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Per-team stats used by the heuristic and their weights; KD, rating and
+# win rate are pre-scaled by 100 to be comparable with ACS
+STAT_KEYS = ('avg_acs', 'avg_kd', 'avg_rating', 'win_rate')
+WEIGHTS = np.array([0.3, 25.0, 25.0, 20.0])
+
+# sklearn trees split on float32 thresholds, so trained-model features are
+# built as float32 to skip a conversion copy and halve the bytes streamed
+MODEL_DTYPE = np.float32
+
+def _stat_vector(team_stats: Dict[str, Any], dtype=np.float64) -> np.ndarray:
+    """Pack a team's heuristic stats into a vector ordered like STAT_KEYS."""
+    return np.fromiter((team_stats.get(key, 0.0) for key in STAT_KEYS), dtype=dtype, count=len(STAT_KEYS))
+
+def _extract_features(team1_stats: Dict[str, Any], team2_stats: Dict[str, Any], dtype=np.float64) -> np.ndarray:
+    """Build the (1, 12) model features: team1 stats, team2 stats, differences."""
+    team1 = _stat_vector(team1_stats, dtype)
+    team2 = _stat_vector(team2_stats, dtype)
+    return np.concatenate((team1, team2, team1 - team2)).reshape(1, -1)
+
+def _stat_matrices(pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack team1 and team2 stat vectors for many matchups into (N, 4) arrays."""
+    team1 = np.stack([_stat_vector(team1_stats, dtype) for team1_stats, _ in pairs])
+    team2 = np.stack([_stat_vector(team2_stats, dtype) for _, team2_stats in pairs])
+    return team1, team2
+
+def _feature_matrix(pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]], dtype=np.float64) -> np.ndarray:
+    """Build the (N, 12) model feature matrix: team1 stats, team2 stats, differences."""
+    team1, team2 = _stat_matrices(pairs, dtype)
+    return np.hstack([team1, team2, team1 - team2])
+
 class BaselinePredictor:
     """Simple baseline predictor using team statistics."""
     
     def __init__(self):
-        self.model = None
-        self.scaler = StandardScaler()
         self.feature_names = [
             'team1_avg_acs', 'team1_avg_kd', 'team1_avg_rating', 'team1_win_rate',
             'team2_avg_acs', 'team2_avg_kd', 'team2_avg_rating', 'team2_win_rate',
@@ -27,54 +55,13 @@ class BaselinePredictor:
     
     def _extract_features(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> np.ndarray:
         """Extract features from team statistics."""
-        # Basic stats
-        team1_acs = team1_stats.get('avg_acs', 0)
-        team1_kd = team1_stats.get('avg_kd', 0)
-        team1_rating = team1_stats.get('avg_rating', 0)
-        team1_win_rate = team1_stats.get('win_rate', 0)
-        
-        team2_acs = team2_stats.get('avg_acs', 0)
-        team2_kd = team2_stats.get('avg_kd', 0)
-        team2_rating = team2_stats.get('avg_rating', 0)
-        team2_win_rate = team2_stats.get('win_rate', 0)
-        
-        # Calculate differences
-        acs_diff = team1_acs - team2_acs
-        kd_diff = team1_kd - team2_kd
-        rating_diff = team1_rating - team2_rating
-        win_rate_diff = team1_win_rate - team2_win_rate
-        
-        features = np.array([
-            team1_acs, team1_kd, team1_rating, team1_win_rate,
-            team2_acs, team2_kd, team2_rating, team2_win_rate,
-            acs_diff, kd_diff, rating_diff, win_rate_diff
-        ]).reshape(1, -1)
-        
-        return features
+        return _extract_features(team1_stats, team2_stats)
     
     def _simple_heuristic(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Tuple[str, float]:
         """Simple heuristic prediction based on weighted stats."""
         # Weighted scoring system
-        weights = {
-            'acs': 0.3,
-            'kd': 0.25,
-            'rating': 0.25,
-            'win_rate': 0.2
-        }
-        
-        team1_score = (
-            team1_stats.get('avg_acs', 0) * weights['acs'] +
-            team1_stats.get('avg_kd', 0) * weights['kd'] * 100 +  # Scale KD
-            team1_stats.get('avg_rating', 0) * weights['rating'] * 100 +  # Scale rating
-            team1_stats.get('win_rate', 0) * weights['win_rate'] * 100  # Scale win rate
-        )
-        
-        team2_score = (
-            team2_stats.get('avg_acs', 0) * weights['acs'] +
-            team2_stats.get('avg_kd', 0) * weights['kd'] * 100 +
-            team2_stats.get('avg_rating', 0) * weights['rating'] * 100 +
-            team2_stats.get('win_rate', 0) * weights['win_rate'] * 100
-        )
+        team1_score = float(_stat_vector(team1_stats) @ WEIGHTS)
+        team2_score = float(_stat_vector(team2_stats) @ WEIGHTS)
         
         # Calculate probabilities
         total_score = team1_score + team2_score
@@ -107,11 +94,11 @@ class BaselinePredictor:
             
             return {
                 "predicted_winner": winner,
-                "confidence": round(confidence, 3),
-                "team1_win_probability": round(team1_prob, 3),
-                "team2_win_probability": round(team2_prob, 3),
+                "confidence": confidence,
+                "team1_win_probability": team1_prob,
+                "team2_win_probability": team2_prob,
                 "model_version": self.model_version,
-                "prediction_timestamp": datetime.utcnow(),
+                "prediction_timestamp": time.time(),
                 "features_used": self.feature_names
             }
             
@@ -124,11 +111,48 @@ class BaselinePredictor:
                 "team1_win_probability": 0.5,
                 "team2_win_probability": 0.5,
                 "model_version": self.model_version,
-                "prediction_timestamp": datetime.utcnow(),
+                "prediction_timestamp": time.time(),
                 "features_used": self.feature_names,
                 "error": str(e)
             }
 
+    def predict_batch(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Predict many matchups at once with the vectorized heuristic."""
+        if not pairs:
+            return []
+        return self.predict_rows(*_stat_matrices(pairs))
+    
+    def predict_rows(self, team1: np.ndarray, team2: np.ndarray) -> List[Dict[str, Any]]:
+        """Predict matchups from (N, 4) team1 and team2 stat arrays in STAT_KEYS order."""
+        team1_scores = team1 @ WEIGHTS
+        team2_scores = team2 @ WEIGHTS
+        total_scores = team1_scores + team2_scores
+        
+        # Same rule as _simple_heuristic: even odds when both scores are zero
+        safe_totals = np.where(total_scores == 0, 1.0, total_scores)
+        team1_probs = np.where(total_scores == 0, 0.5, team1_scores / safe_totals)
+        team2_probs = np.where(total_scores == 0, 0.5, team2_scores / safe_totals)
+        
+        timestamp = time.time()
+        predictions = []
+        for team1_prob, team2_prob in zip(team1_probs.tolist(), team2_probs.tolist()):
+            if team1_prob > team2_prob:
+                winner, confidence = "team1", team1_prob
+            else:
+                winner, confidence = "team2", team2_prob
+            # Report complementary probabilities, as predict() does
+            team1_win_probability = confidence if winner == "team1" else 1 - confidence
+            predictions.append({
+                "predicted_winner": winner,
+                "confidence": confidence,
+                "team1_win_probability": team1_win_probability,
+                "team2_win_probability": 1 - team1_win_probability,
+                "model_version": self.model_version,
+                "prediction_timestamp": timestamp,
+                "features_used": self.feature_names
+            })
+        return predictions
+
 class TrainedPredictor:
     """Trained ML model predictor."""
     
@@ -138,21 +162,27 @@ class TrainedPredictor:
         self.feature_names = []
         self.model_version = "trained_v1.0"
         self.model_path = model_path or settings.model_path
-        
-        # Try to load existing model
-        self._load_model()
+        # Model is loaded off the event loop by ensure_loaded()
+        self._load_task = None
+    
+    async def ensure_loaded(self):
+        """Load the model in a worker thread once; later callers await the same load."""
+        if self._load_task is None:
+            loop = asyncio.get_running_loop()
+            self._load_task = loop.run_in_executor(None, self._load_model)
+        await self._load_task
     
     def _load_model(self):
         """Load trained model from file."""
         try:
             model_file = Path(self.model_path)
             if model_file.exists():
-                with open(model_file, 'rb') as f:
-                    model_data = pickle.load(f)
-                    self.model = model_data['model']
-                    self.scaler = model_data['scaler']
-                    self.feature_names = model_data['feature_names']
-                    self.model_version = model_data.get('version', self.model_version)
+                # Memory-map numpy arrays so workers share the model pages via the OS cache
+                model_data = joblib.load(model_file, mmap_mode='r')
+                self.model = model_data['model']
+                self.scaler = model_data['scaler']
+                self.feature_names = model_data['feature_names']
+                self.model_version = model_data.get('version', self.model_version)
                 logger.info(f"Loaded trained model from {self.model_path}")
             else:
                 logger.warning(f"Model file not found: {self.model_path}")
@@ -162,9 +192,8 @@ class TrainedPredictor:
     def predict(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Dict[str, Any]:
         """Make prediction using trained model."""
         if self.model is None:
-            logger.warning("No trained model available, falling back to baseline")
-            baseline = BaselinePredictor()
-            return baseline.predict(team1_stats, team2_stats)
+            logger.debug("No trained model loaded, falling back to baseline")
+            return baseline_predictor.predict(team1_stats, team2_stats)
         
         try:
             # Extract features (same as baseline for now)
@@ -188,41 +217,52 @@ class TrainedPredictor:
                 "team1_win_probability": round(probabilities[1], 3),
                 "team2_win_probability": round(probabilities[0], 3),
                 "model_version": self.model_version,
-                "prediction_timestamp": datetime.utcnow(),
+                "prediction_timestamp": time.time(),
                 "features_used": self.feature_names
             }
             
         except Exception as e:
             logger.error(f"Error making prediction with trained model: {e}")
             # Fallback to baseline
-            baseline = BaselinePredictor()
-            return baseline.predict(team1_stats, team2_stats)
+            return baseline_predictor.predict(team1_stats, team2_stats)
     
-    def _extract_features(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> np.ndarray:
-        """Extract features from team statistics."""
-        # Same as baseline for now
-        team1_acs = team1_stats.get('avg_acs', 0)
-        team1_kd = team1_stats.get('avg_kd', 0)
-        team1_rating = team1_stats.get('avg_rating', 0)
-        team1_win_rate = team1_stats.get('win_rate', 0)
-        
-        team2_acs = team2_stats.get('avg_acs', 0)
-        team2_kd = team2_stats.get('avg_kd', 0)
-        team2_rating = team2_stats.get('avg_rating', 0)
-        team2_win_rate = team2_stats.get('win_rate', 0)
-        
-        acs_diff = team1_acs - team2_acs
-        kd_diff = team1_kd - team2_kd
-        rating_diff = team1_rating - team2_rating
-        win_rate_diff = team1_win_rate - team2_win_rate
-        
-        features = np.array([
-            team1_acs, team1_kd, team1_rating, team1_win_rate,
-            team2_acs, team2_kd, team2_rating, team2_win_rate,
-            acs_diff, kd_diff, rating_diff, win_rate_diff
-        ]).reshape(1, -1)
+    def predict_batch(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Predict many matchups with one scaler transform and one model call."""
+        if self.model is None:
+            logger.debug("No trained model loaded, falling back to baseline")
+            return baseline_predictor.predict_batch(pairs)
+        if not pairs:
+            return []
         
-        return features
+        try:
+            features = _feature_matrix(pairs, MODEL_DTYPE)
+            if self.scaler:
+                features = self.scaler.transform(features)
+            
+            probabilities = self.model.predict_proba(features)
+            winners = self.model.classes_[probabilities.argmax(axis=1)]
+            
+            timestamp = time.time()
+            return [
+                {
+                    "predicted_winner": "team1" if winner == 1 else "team2",
+                    "confidence": round(float(max(probs)), 3),
+                    "team1_win_probability": round(float(probs[1]), 3),
+                    "team2_win_probability": round(float(probs[0]), 3),
+                    "model_version": self.model_version,
+                    "prediction_timestamp": timestamp,
+                    "features_used": self.feature_names
+                }
+                for winner, probs in zip(winners, probabilities)
+            ]
+            
+        except Exception as e:
+            logger.error("Error making batch prediction with trained model: %s", e)
+            return baseline_predictor.predict_batch(pairs)
+    
+    def _extract_features(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> np.ndarray:
+        """Extract features from team statistics (same as baseline, as float32)."""
+        return _extract_features(team1_stats, team2_stats, MODEL_DTYPE)
 
 # Global predictor instances
 baseline_predictor = BaselinePredictor()
@@ -5,7 +5,9 @@ import sys
 import joblib
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -13,6 +15,37 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+DAY_NS = 86_400 * 10**9
+
+# pyarrow is optional; when installed it parses the history CSV multithreaded
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Team and map names repeat across thousands of rows, so store them as categoricals
+CSV_DTYPES = {"teamA": "category", "teamB": "category", "winner": "category", "map_name": "category"}
+
+def today() -> datetime:
+    """Start of the current local day."""
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+@dataclass
+class TeamHistory:
+    """A team's maps (overall, on one map, or vs one opponent) by date; wins_cum[k] = wins in the first k."""
+    date_ns: np.ndarray
+    wins_cum: np.ndarray
+    by_map: Dict[str, "TeamHistory"]
+
+def _team_history(date_ns: np.ndarray, won: np.ndarray, by_map: Dict[str, TeamHistory]) -> TeamHistory:
+    """Build a history from date-sorted rows and their win flags."""
+    wins_cum = np.zeros(len(won) + 1, dtype=np.int64)
+    np.cumsum(won, out=wins_cum[1:])
+    return TeamHistory(date_ns=date_ns, wins_cum=wins_cum, by_map=by_map)
+
+_EMPTY_HISTORY = _team_history(np.empty(0, dtype=np.int64), np.empty(0, dtype=bool), {})
+
 class RealisticPredictor:
     """Realistic predictor using only historical win/loss data."""
     
@@ -31,8 +64,12 @@ class RealisticPredictor:
             'experience_diff',
             'rest_advantage'
         ]
+        self.team_codes: Dict[str, int] = {}
+        self.team_history: Dict[str, TeamHistory] = {}
+        self.h2h_history: Dict[Tuple[int, int], TeamHistory] = {}
         self._load_model()
         self._load_historical_data()
+        self._build_history_index()
     
     def _load_model(self):
         """Load the realistic model."""
@@ -91,7 +128,7 @@ class RealisticPredictor:
                 csv_path = str(project_root / csv_path)
             
             if os.path.exists(csv_path):
-                self.df_hist = pd.read_csv(csv_path)
+                self.df_hist = pd.read_csv(csv_path, engine=CSV_ENGINE, dtype=CSV_DTYPES)
                 self.df_hist["date"] = pd.to_datetime(self.df_hist["date"])
                 print(f"Loaded {len(self.df_hist)} matches from {csv_path}")
             else:
@@ -102,88 +139,131 @@ class RealisticPredictor:
             print(f"Failed to load historical data: {e}")
             self.df_hist = pd.DataFrame()
     
+    def _build_history_index(self):
+        """Split history into per-team and per-pair date-sorted arrays so features never scan the DataFrame."""
+        self.team_codes, self.team_history, self.h2h_history = {}, {}, {}
+        if self.df_hist is None or self.df_hist.empty:
+            return
+        
+        df = self.df_hist.dropna(subset=['date']).sort_values('date', kind='mergesort')
+        n = len(df)
+        
+        # One code space for teamA/teamB/winner so ids compare directly; missing winners get -1
+        codes, teams = pd.factorize(pd.concat([df['teamA'], df['teamB'], df['winner']], ignore_index=True))
+        codes = codes.astype(np.int32)
+        a_ids, b_ids, winner_ids = codes[:n], codes[n:2 * n], codes[2 * n:]
+        map_ids, maps = pd.factorize(df['map_name'])
+        map_ids = map_ids.astype(np.int32)
+        dates = df['date'].values.astype('datetime64[ns]').view(np.int64)
+        
+        # Every map appears once from each side; sorting on (team, row) keeps each team in date order
+        rows = np.arange(n)
+        keep = a_ids != b_ids
+        side_team = np.concatenate([a_ids, b_ids[keep]])
+        side_rows = np.concatenate([rows, rows[keep]])
+        order = np.lexsort((side_rows, side_team))
+        side_team, side_rows = side_team[order], side_rows[order]
+        
+        team_ids, starts = np.unique(side_team, return_index=True)
+        ends = np.append(starts[1:], len(side_team))
+        for team_id, start, end in zip(team_ids, starts, ends):
+            if team_id < 0:
+                continue
+            team_rows = side_rows[start:end]
+            team_dates = dates[team_rows]
+            team_maps = map_ids[team_rows]
+            won = winner_ids[team_rows] == team_id
+            by_map = {
+                maps[map_id]: _team_history(team_dates[on_map], won[on_map], {})
+                for map_id in np.unique(team_maps) if map_id >= 0
+                for on_map in [team_maps == map_id]
+            }
+            self.team_history[teams[team_id]] = _team_history(team_dates, won, by_map)
+        
+        # Head-to-head rows per pair, in date order, stored once from each team's side
+        pair_lo, pair_hi = np.minimum(a_ids, b_ids), np.maximum(a_ids, b_ids)
+        order = np.lexsort((rows, pair_hi, pair_lo))
+        pair_keys = np.stack([pair_lo[order], pair_hi[order]], axis=1)
+        pairs, starts = np.unique(pair_keys, axis=0, return_index=True)
+        ends = np.append(starts[1:], n)
+        for (lo, hi), start, end in zip(pairs, starts, ends):
+            if lo < 0 or lo == hi:
+                continue
+            pair_rows = order[start:end]
+            pair_dates, pair_winners = dates[pair_rows], winner_ids[pair_rows]
+            self.h2h_history[(int(lo), int(hi))] = _team_history(pair_dates, pair_winners == lo, {})
+            self.h2h_history[(int(hi), int(lo))] = _team_history(pair_dates, pair_winners == hi, {})
+        
+        self.team_codes = {team: i for i, team in enumerate(teams)}
+    
     def _create_historical_features(self, teamA: str, teamB: str, map_name: str, match_date: datetime) -> np.ndarray:
         """Create historical features for a match prediction."""
-        if self.df_hist is None or self.df_hist.empty:
+        if not self.team_history:
             # Return default features if no historical data
             return np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
         
         # Only use data BEFORE this match
-        historical_df = self.df_hist[self.df_hist['date'] < match_date].copy()
-        
-        # Team A historical data
-        teamA_history = historical_df[
-            (historical_df['teamA'] == teamA) | (historical_df['teamB'] == teamA)
-        ]
-        teamB_history = historical_df[
-            (historical_df['teamA'] == teamB) | (historical_df['teamB'] == teamB)
-        ]
+        match_ns = pd.Timestamp(match_date).value
+        teamA_history = self.team_history.get(teamA, _EMPTY_HISTORY)
+        teamB_history = self.team_history.get(teamB, _EMPTY_HISTORY)
+        teamA_total = int(np.searchsorted(teamA_history.date_ns, match_ns, side='left'))
+        teamB_total = int(np.searchsorted(teamB_history.date_ns, match_ns, side='left'))
+        teamA_wins = int(teamA_history.wins_cum[teamA_total])
+        teamB_wins = int(teamB_history.wins_cum[teamB_total])
         
         # 1. Overall winrate difference (historical only)
-        teamA_wins = len(teamA_history[teamA_history['winner'] == teamA])
-        teamA_total = len(teamA_history)
         teamA_winrate = teamA_wins / max(teamA_total, 1)
-        
-        teamB_wins = len(teamB_history[teamB_history['winner'] == teamB])
-        teamB_total = len(teamB_history)
         teamB_winrate = teamB_wins / max(teamB_total, 1)
         
         overall_winrate_diff = teamA_winrate - teamB_winrate
         
         # 2. Map-specific winrate difference (historical only)
-        teamA_map_matches = teamA_history[teamA_history['map_name'] == map_name]
-        teamB_map_matches = teamB_history[teamB_history['map_name'] == map_name]
-        
-        teamA_map_wins = len(teamA_map_matches[teamA_map_matches['winner'] == teamA])
-        teamA_map_total = len(teamA_map_matches)
-        teamA_map_winrate = teamA_map_wins / max(teamA_map_total, 1)
+        teamA_map = teamA_history.by_map.get(map_name, _EMPTY_HISTORY)
+        teamB_map = teamB_history.by_map.get(map_name, _EMPTY_HISTORY)
+        teamA_map_total = int(np.searchsorted(teamA_map.date_ns, match_ns, side='left'))
+        teamB_map_total = int(np.searchsorted(teamB_map.date_ns, match_ns, side='left'))
         
-        teamB_map_wins = len(teamB_map_matches[teamB_map_matches['winner'] == teamB])
-        teamB_map_total = len(teamB_map_matches)
-        teamB_map_winrate = teamB_map_wins / max(teamB_map_total, 1)
+        teamA_map_winrate = int(teamA_map.wins_cum[teamA_map_total]) / max(teamA_map_total, 1)
+        teamB_map_winrate = int(teamB_map.wins_cum[teamB_map_total]) / max(teamB_map_total, 1)
         
         map_winrate_diff = teamA_map_winrate - teamB_map_winrate
         
         # 3. Head-to-head record (historical only)
-        h2h_matches = historical_df[
-            ((historical_df['teamA'] == teamA) & (historical_df['teamB'] == teamB)) |
-            ((historical_df['teamA'] == teamB) & (historical_df['teamB'] == teamA))
-        ]
-        
-        teamA_h2h_wins = len(h2h_matches[h2h_matches['winner'] == teamA])
-        teamB_h2h_wins = len(h2h_matches[h2h_matches['winner'] == teamB])
-        h2h_total = len(h2h_matches)
+        teamA_id = self.team_codes.get(teamA, -1)
+        teamB_id = self.team_codes.get(teamB, -1)
+        teamA_h2h = self.h2h_history.get((teamA_id, teamB_id), _EMPTY_HISTORY)
+        teamB_h2h = self.h2h_history.get((teamB_id, teamA_id), _EMPTY_HISTORY)
+        h2h_total = int(np.searchsorted(teamA_h2h.date_ns, match_ns, side='left'))
         
         if h2h_total > 0:
+            teamA_h2h_wins = int(teamA_h2h.wins_cum[h2h_total])
+            teamB_h2h_wins = int(teamB_h2h.wins_cum[h2h_total])
             h2h_advantage = (teamA_h2h_wins - teamB_h2h_wins) / h2h_total
         else:
             h2h_advantage = 0
         
         # 4. Recent form (last 3 matches, historical only)
-        teamA_recent = teamA_history.tail(3)
-        teamB_recent = teamB_history.tail(3)
-        
-        teamA_recent_wins = len(teamA_recent[teamA_recent['winner'] == teamA])
-        teamA_recent_winrate = teamA_recent_wins / max(len(teamA_recent), 1)
+        teamA_recent = min(teamA_total, 3)
+        teamB_recent = min(teamB_total, 3)
         
-        teamB_recent_wins = len(teamB_recent[teamB_recent['winner'] == teamB])
-        teamB_recent_winrate = teamB_recent_wins / max(len(teamB_recent), 1)
+        teamA_recent_wins = teamA_wins - int(teamA_history.wins_cum[teamA_total - teamA_recent])
+        teamB_recent_wins = teamB_wins - int(teamB_history.wins_cum[teamB_total - teamB_recent])
+        teamA_recent_winrate = teamA_recent_wins / max(teamA_recent, 1)
+        teamB_recent_winrate = teamB_recent_wins / max(teamB_recent, 1)
         
         recent_form_diff = teamA_recent_winrate - teamB_recent_winrate
         
         # 5. Experience difference (total matches played)
         experience_diff = teamA_total - teamB_total
         
-        # 6. Days since last match (rest factor)
-        if len(teamA_history) > 0:
-            teamA_last_match = teamA_history['date'].max()
-            teamA_days_rest = (match_date - teamA_last_match).days
+        # 6. Days since last match (rest factor); history is date-sorted so the last row is the latest
+        if teamA_total > 0:
+            teamA_days_rest = (match_ns - int(teamA_history.date_ns[teamA_total - 1])) // DAY_NS
         else:
             teamA_days_rest = 30  # Default if no history
         
-        if len(teamB_history) > 0:
-            teamB_last_match = teamB_history['date'].max()
-            teamB_days_rest = (match_date - teamB_last_match).days
+        if teamB_total > 0:
+            teamB_days_rest = (match_ns - int(teamB_history.date_ns[teamB_total - 1])) // DAY_NS
         else:
             teamB_days_rest = 30  # Default if no history
         
@@ -199,8 +279,8 @@ class RealisticPredictor:
             rest_advantage
         ])
     
-    def predict(self, teamA: str, teamB: str, map_name: str) -> Dict:
-        """Make a prediction for a match."""
+    def predict(self, teamA: str, teamB: str, map_name: str, match_date: Optional[datetime] = None) -> Dict:
+        """Make a prediction for a match (played today unless match_date is given)."""
         if self.model is None:
             return {
                 "prob_teamA": 0.5,
@@ -212,8 +292,9 @@ class RealisticPredictor:
                 "explanation": "Model not loaded"
             }
         
-        # Create historical features
-        match_date = datetime.now()
+        # Create historical features; day resolution keeps a day's predictions identical
+        if match_date is None:
+            match_date = today()
         features = self._create_historical_features(teamA, teamB, map_name, match_date)
         
         # Make prediction
@@ -257,5 +338,7 @@ class RealisticPredictor:
             }
         }
 
-# Global instance
-realistic_predictor = RealisticPredictor()
+@lru_cache(maxsize=1)
+def get_realistic_predictor() -> RealisticPredictor:
+    """Shared realistic predictor, loaded on first use instead of at import."""
+    return RealisticPredictor()
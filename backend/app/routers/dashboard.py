@@ -5,7 +5,7 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from pydantic import BaseModel
 import pandas as pd
 from app.logging_utils import get_logger
@@ -96,274 +96,244 @@ async def get_system_metrics() -> SystemMetrics:
 @router.get("/metrics/models")
 async def get_model_performance() -> List[ModelPerformance]:
     """Get performance metrics for all available models."""
-    try:
-        models = []
-        
-        # Realistic Model (Primary)
-        models.append(ModelPerformance(
-            model_name="Symmetric Realistic",
-            accuracy=0.643,
-            f1_score=0.713,
-            brier_score=0.256,
-            calibration_error=0.045,
-            prediction_count=89,
-            confidence_distribution={
-                "High (>70%)": 35,
-                "Medium (60-70%)": 42,
-                "Low (<60%)": 12
-            }
-        ))
-        
-        # Advanced Model
-        models.append(ModelPerformance(
-            model_name="Advanced VLR.gg",
-            accuracy=0.554,
-            f1_score=0.667,
-            brier_score=0.260,
-            calibration_error=0.052,
-            prediction_count=138,
-            confidence_distribution={
-                "High (>70%)": 28,
-                "Medium (60-70%)": 67,
-                "Low (<60%)": 43
-            }
-        ))
-        
-        # Live Cache Model
-        models.append(ModelPerformance(
-            model_name="Live Cache (100d)",
-            accuracy=0.612,
-            f1_score=0.689,
-            brier_score=0.251,
-            calibration_error=0.038,
-            prediction_count=73,
-            confidence_distribution={
-                "High (>70%)": 22,
-                "Medium (60-70%)": 35,
-                "Low (<60%)": 16
-            }
-        ))
-        
-        return models
-        
-    except Exception as e:
-        logger.error(f"Failed to get model performance: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get model performance: {str(e)}")
+    models = []
+    
+    # Realistic Model (Primary)
+    models.append(ModelPerformance(
+        model_name="Symmetric Realistic",
+        accuracy=0.643,
+        f1_score=0.713,
+        brier_score=0.256,
+        calibration_error=0.045,
+        prediction_count=89,
+        confidence_distribution={
+            "High (>70%)": 35,
+            "Medium (60-70%)": 42,
+            "Low (<60%)": 12
+        }
+    ))
+    
+    # Advanced Model
+    models.append(ModelPerformance(
+        model_name="Advanced VLR.gg",
+        accuracy=0.554,
+        f1_score=0.667,
+        brier_score=0.260,
+        calibration_error=0.052,
+        prediction_count=138,
+        confidence_distribution={
+            "High (>70%)": 28,
+            "Medium (60-70%)": 67,
+            "Low (<60%)": 43
+        }
+    ))
+    
+    # Live Cache Model
+    models.append(ModelPerformance(
+        model_name="Live Cache (100d)",
+        accuracy=0.612,
+        f1_score=0.689,
+        brier_score=0.251,
+        calibration_error=0.038,
+        prediction_count=73,
+        confidence_distribution={
+            "High (>70%)": 22,
+            "Medium (60-70%)": 35,
+            "Low (<60%)": 16
+        }
+    ))
+    
+    return models
 
 @router.get("/metrics/teams")
 async def get_team_analytics(top_n: int = 10) -> List[TeamAnalytics]:
     """Get analytics for top performing teams."""
-    try:
-        # Load VCT team data
-        vct_teams = [
-            "G2 Esports", "Sentinels", "NRG Esports", "LOUD", "100 Thieves",
-            "Team Vitality", "Team Liquid", "Fnatic", "DRX", "T1", "Edward Gaming"
-        ]
-        
-        analytics = []
-        
-        # G2 Esports (Stage 1 & 2 Winner)
-        analytics.append(TeamAnalytics(
-            team_name="G2 Esports",
-            total_matches=27,
-            win_rate=0.889,
-            map_performance={
-                "Ascent": 1.000,
-                "Bind": 0.875,
-                "Sunset": 0.923,
-                "Haven": 0.857,
-                "Lotus": 0.800
-            },
-            recent_form=["W", "W", "W", "W", "W"],
-            prediction_accuracy=0.923
-        ))
-        
-        # Sentinels (Strong performer)
+    # Load VCT team data
+    vct_teams = [
+        "G2 Esports", "Sentinels", "NRG Esports", "LOUD", "100 Thieves",
+        "Team Vitality", "Team Liquid", "Fnatic", "DRX", "T1", "Edward Gaming"
+    ]
+    
+    analytics = []
+    
+    # G2 Esports (Stage 1 & 2 Winner)
+    analytics.append(TeamAnalytics(
+        team_name="G2 Esports",
+        total_matches=27,
+        win_rate=0.889,
+        map_performance={
+            "Ascent": 1.000,
+            "Bind": 0.875,
+            "Sunset": 0.923,
+            "Haven": 0.857,
+            "Lotus": 0.800
+        },
+        recent_form=["W", "W", "W", "W", "W"],
+        prediction_accuracy=0.923
+    ))
+    
+    # Sentinels (Strong performer)
+    analytics.append(TeamAnalytics(
+        team_name="Sentinels",
+        total_matches=24,
+        win_rate=0.750,
+        map_performance={
+            "Bind": 0.900,
+            "Ascent": 0.714,
+            "Sunset": 0.833,
+            "Haven": 0.667,
+            "Split": 0.800
+        },
+        recent_form=["W", "L", "W", "W", "L"],
+        prediction_accuracy=0.789
+    ))
+    
+    # Edward Gaming (China Champion)
+    analytics.append(TeamAnalytics(
+        team_name="Edward Gaming",
+        total_matches=21,
+        win_rate=0.714,
+        map_performance={
+            "Lotus": 0.857,
+            "Bind": 0.750,
+            "Ascent": 0.692,
+            "Abyss": 0.800,
+            "Haven": 0.600
+        },
+        recent_form=["W", "W", "L", "W", "W"],
+        prediction_accuracy=0.756
+    ))
+    
+    # Add more teams with realistic data
+    for team in ["Team Liquid", "DRX", "LOUD", "100 Thieves"]:
         analytics.append(TeamAnalytics(
-            team_name="Sentinels",
-            total_matches=24,
-            win_rate=0.750,
+            team_name=team,
+            total_matches=18,
+            win_rate=0.611,
             map_performance={
-                "Bind": 0.900,
-                "Ascent": 0.714,
-                "Sunset": 0.833,
-                "Haven": 0.667,
-                "Split": 0.800
+                "Ascent": 0.650,
+                "Bind": 0.571,
+                "Sunset": 0.625,
+                "Haven": 0.600,
+                "Lotus": 0.556
             },
-            recent_form=["W", "L", "W", "W", "L"],
-            prediction_accuracy=0.789
+            recent_form=["W", "L", "W", "L", "W"],
+            prediction_accuracy=0.672
         ))
-        
-        # Edward Gaming (China Champion)
-        analytics.append(TeamAnalytics(
-            team_name="Edward Gaming",
-            total_matches=21,
-            win_rate=0.714,
-            map_performance={
-                "Lotus": 0.857,
-                "Bind": 0.750,
-                "Ascent": 0.692,
-                "Abyss": 0.800,
-                "Haven": 0.600
-            },
-            recent_form=["W", "W", "L", "W", "W"],
-            prediction_accuracy=0.756
-        ))
-        
-        # Add more teams with realistic data
-        for team in ["Team Liquid", "DRX", "LOUD", "100 Thieves"]:
-            analytics.append(TeamAnalytics(
-                team_name=team,
-                total_matches=18,
-                win_rate=0.611,
-                map_performance={
-                    "Ascent": 0.650,
-                    "Bind": 0.571,
-                    "Sunset": 0.625,
-                    "Haven": 0.600,
-                    "Lotus": 0.556
-                },
-                recent_form=["W", "L", "W", "L", "W"],
-                prediction_accuracy=0.672
-            ))
-        
-        return analytics[:top_n]
-        
-    except Exception as e:
-        logger.error(f"Failed to get team analytics: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get team analytics: {str(e)}")
+    
+    return analytics[:top_n]
 
 @router.get("/metrics/data-quality")
 async def get_data_quality() -> DataQuality:
     """Get data quality and coverage metrics."""
-    try:
-        # Check cache database
-        cache_size = 0.023  # 23KB as documented
-        
-        # VCT team coverage
-        vct_teams = 42
-        total_teams = 50
-        vct_coverage = vct_teams / total_teams
-        
-        return DataQuality(
-            total_teams=total_teams,
-            total_matches=353,  # Enhanced dataset size
-            data_coverage_days=100,  # Live cache lookback
-            cache_size_mb=cache_size,
-            last_update=datetime.now() - timedelta(hours=2),
-            vct_team_coverage=vct_coverage,
-            regional_distribution={
-                "Americas": 11,
-                "EMEA": 11,
-                "Pacific": 11,
-                "China": 9,
-                "Others": 8
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to get data quality metrics: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get data quality metrics: {str(e)}")
+    # Check cache database
+    cache_size = 0.023  # 23KB as documented
+    
+    # VCT team coverage
+    vct_teams = 42
+    total_teams = 50
+    vct_coverage = vct_teams / total_teams
+    
+    return DataQuality(
+        total_teams=total_teams,
+        total_matches=353,  # Enhanced dataset size
+        data_coverage_days=100,  # Live cache lookback
+        cache_size_mb=cache_size,
+        last_update=datetime.now() - timedelta(hours=2),
+        vct_team_coverage=vct_coverage,
+        regional_distribution={
+            "Americas": 11,
+            "EMEA": 11,
+            "Pacific": 11,
+            "China": 9,
+            "Others": 8
+        }
+    )
 
 @router.get("/metrics/predictions/recent")
 async def get_recent_predictions(limit: int = 20):
     """Get recent prediction activity."""
-    try:
-        # Mock recent predictions based on logged activity
-        recent_predictions = [
-            {
-                "timestamp": datetime.now() - timedelta(minutes=5),
-                "teamA": "G2 Esports",
-                "teamB": "Sentinels",
-                "map": "Ascent",
-                "predicted_winner": "G2 Esports",
-                "confidence": 0.65,
-                "model": "symmetric_realistic"
-            },
-            {
-                "timestamp": datetime.now() - timedelta(minutes=12),
-                "teamA": "Sentinels",
-                "teamB": "NRG Esports",
-                "map": "Sunset",
-                "predicted_winner": "Sentinels",
-                "confidence": 0.58,
-                "model": "live_cache"
-            },
-            {
-                "timestamp": datetime.now() - timedelta(minutes=18),
-                "teamA": "GIANTX",
-                "teamB": "Sentinels",
-                "map": "Bind",
-                "predicted_winner": "Sentinels",
-                "confidence": 0.72,
-                "model": "advanced"
-            },
-            {
-                "timestamp": datetime.now() - timedelta(minutes=25),
-                "teamA": "Edward Gaming",
-                "teamB": "Bilibili Gaming",
-                "map": "Lotus",
-                "predicted_winner": "Edward Gaming",
-                "confidence": 0.61,
-                "model": "symmetric_realistic"
-            }
-        ]
-        
-        return {
-            "recent_predictions": recent_predictions[:limit],
-            "total_today": 47,
-            "most_predicted_teams": ["Sentinels", "G2 Esports", "Edward Gaming"],
-            "most_predicted_maps": ["Ascent", "Bind", "Sunset"]
+    # Mock recent predictions based on logged activity
+    recent_predictions = [
+        {
+            "timestamp": datetime.now() - timedelta(minutes=5),
+            "teamA": "G2 Esports",
+            "teamB": "Sentinels",
+            "map": "Ascent",
+            "predicted_winner": "G2 Esports",
+            "confidence": 0.65,
+            "model": "symmetric_realistic"
+        },
+        {
+            "timestamp": datetime.now() - timedelta(minutes=12),
+            "teamA": "Sentinels",
+            "teamB": "NRG Esports",
+            "map": "Sunset",
+            "predicted_winner": "Sentinels",
+            "confidence": 0.58,
+            "model": "live_cache"
+        },
+        {
+            "timestamp": datetime.now() - timedelta(minutes=18),
+            "teamA": "GIANTX",
+            "teamB": "Sentinels",
+            "map": "Bind",
+            "predicted_winner": "Sentinels",
+            "confidence": 0.72,
+            "model": "advanced"
+        },
+        {
+            "timestamp": datetime.now() - timedelta(minutes=25),
+            "teamA": "Edward Gaming",
+            "teamB": "Bilibili Gaming",
+            "map": "Lotus",
+            "predicted_winner": "Edward Gaming",
+            "confidence": 0.61,
+            "model": "symmetric_realistic"
         }
-        
-    except Exception as e:
-        logger.error(f"Failed to get recent predictions: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get recent predictions: {str(e)}")
+    ]
+    
+    return {
+        "recent_predictions": recent_predictions[:limit],
+        "total_today": 47,
+        "most_predicted_teams": ["Sentinels", "G2 Esports", "Edward Gaming"],
+        "most_predicted_maps": ["Ascent", "Bind", "Sunset"]
+    }
 
 @router.get("/metrics/performance/live")
 async def get_live_performance():
     """Get real-time performance metrics."""
-    try:
-        return {
-            "current_load": 0.23,
-            "active_connections": 3,
-            "avg_response_time_ms": 420,
-            "memory_usage_mb": 156.7,
-            "cache_operations_per_minute": 12,
-            "api_calls_last_hour": 89,
-            "error_rate_percent": 0.8,
-            "system_health": "Excellent",
-            "last_model_update": datetime.now() - timedelta(hours=18),
-            "next_scheduled_retrain": datetime.now() + timedelta(hours=6)
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get live performance: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get live performance: {str(e)}")
+    return {
+        "current_load": 0.23,
+        "active_connections": 3,
+        "avg_response_time_ms": 420,
+        "memory_usage_mb": 156.7,
+        "cache_operations_per_minute": 12,
+        "api_calls_last_hour": 89,
+        "error_rate_percent": 0.8,
+        "system_health": "Excellent",
+        "last_model_update": datetime.now() - timedelta(hours=18),
+        "next_scheduled_retrain": datetime.now() + timedelta(hours=6)
+    }
 
 @router.get("/metrics/maps")
 async def get_map_analytics():
     """Get map-specific prediction analytics."""
-    try:
-        maps_data = [
-            {"map": "Ascent", "predictions": 67, "avg_confidence": 0.72, "accuracy": 0.65},
-            {"map": "Bind", "predictions": 58, "avg_confidence": 0.68, "accuracy": 0.62},
-            {"map": "Sunset", "predictions": 54, "avg_confidence": 0.64, "accuracy": 0.59},
-            {"map": "Haven", "predictions": 45, "avg_confidence": 0.61, "accuracy": 0.67},
-            {"map": "Lotus", "predictions": 43, "avg_confidence": 0.58, "accuracy": 0.64},
-            {"map": "Split", "predictions": 39, "avg_confidence": 0.66, "accuracy": 0.61},
-            {"map": "Icebox", "predictions": 32, "avg_confidence": 0.55, "accuracy": 0.56},
-            {"map": "Breeze", "predictions": 28, "avg_confidence": 0.52, "accuracy": 0.54},
-            {"map": "Abyss", "predictions": 24, "avg_confidence": 0.49, "accuracy": 0.58}
-        ]
-        
-        return {
-            "map_analytics": maps_data,
-            "most_predictable": "Ascent",
-            "least_predictable": "Abyss",
-            "total_map_predictions": sum(m["predictions"] for m in maps_data)
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get map analytics: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get map analytics: {str(e)}")
+    maps_data = [
+        {"map": "Ascent", "predictions": 67, "avg_confidence": 0.72, "accuracy": 0.65},
+        {"map": "Bind", "predictions": 58, "avg_confidence": 0.68, "accuracy": 0.62},
+        {"map": "Sunset", "predictions": 54, "avg_confidence": 0.64, "accuracy": 0.59},
+        {"map": "Haven", "predictions": 45, "avg_confidence": 0.61, "accuracy": 0.67},
+        {"map": "Lotus", "predictions": 43, "avg_confidence": 0.58, "accuracy": 0.64},
+        {"map": "Split", "predictions": 39, "avg_confidence": 0.66, "accuracy": 0.61},
+        {"map": "Icebox", "predictions": 32, "avg_confidence": 0.55, "accuracy": 0.56},
+        {"map": "Breeze", "predictions": 28, "avg_confidence": 0.52, "accuracy": 0.54},
+        {"map": "Abyss", "predictions": 24, "avg_confidence": 0.49, "accuracy": 0.58}
+    ]
+    
+    return {
+        "map_analytics": maps_data,
+        "most_predictable": "Ascent",
+        "least_predictable": "Abyss",
+        "total_map_predictions": sum(m["predictions"] for m in maps_data)
+    }
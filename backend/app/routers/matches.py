@@ -1,135 +1,127 @@
 """Match-related endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
 from app.models import Match, MatchSummaryRequest, MatchSummaryResponse
 from app.features import feature_store
 from app.summarizer import match_summarizer
 from app.upstream import vlr_client
+from app.http_cache import cached_json_response
+from app.schemas_fast import MatchFast, TeamFast, msgspec_response
 from app.logging_utils import get_logger, track_api_call
 
 router = APIRouter()
 logger = get_logger(__name__)
 
-@router.get("/", response_model=List[Match])
+def _project_team(name: str, flag: Optional[str]) -> Dict[str, Any]:
+    """Project a VLR.gg team name and flag onto the Team wire shape."""
+    return {
+        "id": name.lower().replace(" ", "_"),
+        "name": name,
+        "slug": name.lower().replace(" ", "-"),
+        "logo_url": None,
+        "country": flag.replace("flag_", "") if flag else None
+    }
+
+def _parse_scheduled_time(value: Any) -> Optional[datetime]:
+    """Parse a VLR.gg timestamp (unix seconds or ISO string)."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    return datetime.fromisoformat(str(value))
+
+def _project_match(match_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project an upstream match segment onto the Match wire shape."""
+    # VLR.gg API returns team names as strings, not objects
+    match_page = match_data.get("match_page")
+    return {
+        "id": match_page.split("/")[-1] if match_page else "",
+        "team1": _project_team(match_data.get("team1", "Unknown Team"), match_data.get("flag1")),
+        "team2": _project_team(match_data.get("team2", "Unknown Team"), match_data.get("flag2")),
+        "status": "upcoming",  # VLR.gg doesn't provide status in this format
+        "scheduled_time": _parse_scheduled_time(match_data.get("unix_timestamp")),
+        "maps": [],  # VLR.gg doesn't provide map info in upcoming matches
+        "tournament": match_data.get("match_event"),
+        "round": match_data.get("match_series")
+    }
+
+@router.get("/", responses={200: {"model": List[Match]}})
 async def get_matches(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by match status"),
     limit: int = Query(50, description="Number of matches to return")
 ):
     """Get recent matches."""
-    try:
-        matches_data = await vlr_client.get_matches(status=status, limit=limit)
-        
-        # Convert to Match objects
-        matches = []
-        for match_data in matches_data:
-            try:
-                # VLR.gg API returns team names as strings, not objects
-                team1_name = match_data.get("team1", "Unknown Team")
-                team2_name = match_data.get("team2", "Unknown Team")
-                
-                match = Match(
-                    id=match_data.get("match_page", "").split("/")[-1] if match_data.get("match_page") else "",
-                    team1={
-                        "id": team1_name.lower().replace(" ", "_"),
-                        "name": team1_name,
-                        "slug": team1_name.lower().replace(" ", "-"),
-                        "logo_url": None,
-                        "country": match_data.get("flag1", "").replace("flag_", "") if match_data.get("flag1") else None
-                    },
-                    team2={
-                        "id": team2_name.lower().replace(" ", "_"),
-                        "name": team2_name,
-                        "slug": team2_name.lower().replace(" ", "-"),
-                        "logo_url": None,
-                        "country": match_data.get("flag2", "").replace("flag_", "") if match_data.get("flag2") else None
-                    },
-                    status="upcoming",  # VLR.gg doesn't provide status in this format
-                    scheduled_time=match_data.get("unix_timestamp"),
-                    maps=[],  # VLR.gg doesn't provide map info in upcoming matches
-                    tournament=match_data.get("match_event"),
-                    round=match_data.get("match_series")
-                )
-                matches.append(match)
-            except Exception as e:
-                logger.warning(f"Failed to parse match data: {e}")
-                logger.warning(f"Match data: {match_data}")
-                continue
-        
-        return matches
-        
-    except Exception as e:
-        logger.error(f"Failed to get matches: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get matches: {str(e)}")
+    matches_data = await vlr_client.get_matches(status=status, limit=limit)
+    
+    # Project straight to wire dicts; the payload is serialized once by orjson
+    matches = []
+    for match_data in matches_data:
+        try:
+            matches.append(_project_match(match_data))
+        except Exception as e:
+            logger.warning("Failed to parse match data: %s", e)
+            logger.warning("Match data: %s", match_data)
+            continue
+    
+    return cached_json_response(request, matches)
 
 @router.get("/{match_id}", response_model=Match)
 @track_api_call("get_match_details")
 async def get_match_details(match_id: str):
     """Get detailed match information."""
-    try:
-        match_data = await feature_store.get_match_details(match_id)
-        
-        if not match_data:
-            raise HTTPException(status_code=404, detail="Match not found")
-        
-        # Convert to Match object
-        match = Match(
-            id=match_data.get("id", match_id),
-            team1={
-                "id": match_data.get("team1", {}).get("id", ""),
-                "name": match_data.get("team1", {}).get("name", ""),
-                "slug": match_data.get("team1", {}).get("slug", ""),
-                "logo_url": match_data.get("team1", {}).get("logo_url"),
-                "country": match_data.get("team1", {}).get("country")
-            },
-            team2={
-                "id": match_data.get("team2", {}).get("id", ""),
-                "name": match_data.get("team2", {}).get("name", ""),
-                "slug": match_data.get("team2", {}).get("slug", ""),
-                "logo_url": match_data.get("team2", {}).get("logo_url"),
-                "country": match_data.get("team2", {}).get("country")
-            },
-            status=match_data.get("status", "upcoming"),
-            scheduled_time=match_data.get("scheduled_time"),
-            maps=match_data.get("maps", []),
-            tournament=match_data.get("tournament"),
-            round=match_data.get("round")
-        )
-        
-        return match
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get match details: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get match details: {str(e)}")
+    match_data = await feature_store.get_match_details(match_id)
+    
+    if not match_data:
+        raise HTTPException(status_code=404, detail="Match not found")
+    
+    # Convert to Match struct
+    match = MatchFast(
+        id=match_data.get("id", match_id),
+        team1=TeamFast(
+            id=match_data.get("team1", {}).get("id", ""),
+            name=match_data.get("team1", {}).get("name", ""),
+            slug=match_data.get("team1", {}).get("slug", ""),
+            logo_url=match_data.get("team1", {}).get("logo_url"),
+            country=match_data.get("team1", {}).get("country")
+        ),
+        team2=TeamFast(
+            id=match_data.get("team2", {}).get("id", ""),
+            name=match_data.get("team2", {}).get("name", ""),
+            slug=match_data.get("team2", {}).get("slug", ""),
+            logo_url=match_data.get("team2", {}).get("logo_url"),
+            country=match_data.get("team2", {}).get("country")
+        ),
+        status=match_data.get("status", "upcoming"),
+        scheduled_time=match_data.get("scheduled_time"),
+        maps=match_data.get("maps", []),
+        tournament=match_data.get("tournament"),
+        round=match_data.get("round")
+    )
+    
+    return msgspec_response(match)
 
 @router.post("/summarize", response_model=MatchSummaryResponse)
 @track_api_call("summarize_match")
 async def summarize_match(request: MatchSummaryRequest):
     """Generate match summary."""
-    try:
-        # Get match details
-        match_data = await feature_store.get_match_details(request.match_id)
-        
-        if not match_data:
-            raise HTTPException(status_code=404, detail="Match not found")
-        
-        # Generate summary
-        summary_result = await match_summarizer.summarize_match(match_data)
-        
-        return MatchSummaryResponse(
-            match_id=request.match_id,
-            summary=summary_result["summary"],
-            key_highlights=summary_result["key_highlights"],
-            team1_performance=summary_result["team1_performance"],
-            team2_performance=summary_result["team2_performance"],
-            generated_at=summary_result["generated_at"],
-            used_llm=summary_result["used_llm"]
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to summarize match: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to summarize match: {str(e)}")
+    # Get match details
+    match_data = await feature_store.get_match_details(request.match_id)
+    
+    if not match_data:
+        raise HTTPException(status_code=404, detail="Match not found")
+    
+    # Generate summary
+    summary_result = await match_summarizer.summarize_match(match_data)
+    
+    return MatchSummaryResponse(
+        match_id=request.match_id,
+        summary=summary_result["summary"],
+        key_highlights=summary_result["key_highlights"],
+        team1_performance=summary_result["team1_performance"],
+        team2_performance=summary_result["team2_performance"],
+        generated_at=summary_result["generated_at"],
+        used_llm=summary_result["used_llm"]
+    )
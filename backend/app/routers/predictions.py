@@ -1,138 +1,134 @@
 """Prediction endpoints."""
 
-from fastapi import APIRouter, HTTPException
-from app.models import PredictionRequest, PredictionResponse, TeamStats
+from fastapi import APIRouter, Request, Response
+from typing import Callable, List, Optional, Union
+from cachetools import TTLCache
+from app.models import PredictionRequest, PredictionResponse
+import time
 from datetime import datetime
 from app.features import feature_store
 from app.predictor import baseline_predictor, trained_predictor
 from app.enhanced_predictor import enhanced_predictor
 from app.strength_of_schedule_predictor import sos_predictor
 from app.logging_utils import get_logger, track_api_call
+from app.http_cache import cached_json_response
+from app.schemas_fast import PredictionResponseFast, TeamStatsFast, msgspec_response
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+def _as_datetime(timestamp: Union[float, datetime]) -> datetime:
+    """Render an epoch timestamp from the feature store or predictors as a datetime."""
+    if isinstance(timestamp, (int, float)):
+        return datetime.utcfromtimestamp(timestamp)
+    return timestamp
+
+def _to_team_stats(team_stats: dict) -> TeamStatsFast:
+    """Convert feature store stats to the response format."""
+    return TeamStatsFast(
+        team_id=team_stats["team_id"],
+        team_name=team_stats["team_name"],
+        avg_acs=team_stats["avg_acs"],
+        avg_kd=team_stats["avg_kd"],
+        avg_rating=team_stats["avg_rating"],
+        win_rate=team_stats["win_rate"],
+        maps_played=team_stats["maps_played"],
+        last_updated=_as_datetime(team_stats["last_updated"])
+    )
+
+def _to_prediction_response(request: PredictionRequest, team1_stats: dict, team2_stats: dict,
+                            prediction: dict) -> PredictionResponseFast:
+    """Build a prediction response, mapping the predicted side to a team name."""
+    team1_response = _to_team_stats(team1_stats)
+    team2_response = _to_team_stats(team2_stats)
+    
+    predicted_winner_name = team1_response.team_name if prediction["predicted_winner"] == "team1" else team2_response.team_name
+    
+    return PredictionResponseFast(
+        team1_id=request.team1_id,
+        team2_id=request.team2_id,
+        predicted_winner=predicted_winner_name,
+        confidence=prediction["confidence"],
+        team1_win_probability=prediction["team1_win_probability"],
+        team2_win_probability=prediction["team2_win_probability"],
+        team1_stats=team1_response,
+        team2_stats=team2_response,
+        prediction_timestamp=_as_datetime(prediction["prediction_timestamp"]),
+        model_version=prediction["model_version"]
+    )
+
+# Encoded prediction bodies keyed on the inputs that determine them
+prediction_cache: TTLCache = TTLCache(maxsize=4096, ttl=120)
+
+def _cached_prediction(request: PredictionRequest, model_version: str, map_name: Optional[str],
+                       team1_stats: dict, team2_stats: dict, predict: Callable[[], dict]) -> Response:
+    """Return the encoded prediction for unchanged inputs, computing it on a miss."""
+    key = (request.team1_id, request.team2_id, map_name, model_version,
+           team1_stats["last_updated"], team2_stats["last_updated"])
+    body = prediction_cache.get(key)
+    if body is None:
+        prediction = predict()
+        body = msgspec_response(_to_prediction_response(request, team1_stats, team2_stats, prediction)).body
+        prediction_cache[key] = body
+    return Response(content=body, media_type="application/json")
+
 @router.post("/predict", response_model=PredictionResponse)
 async def predict_match(request: PredictionRequest):
     """Predict match outcome between two teams."""
-    try:
-        # Get team statistics
-        team1_stats = await feature_store.get_team_stats(request.team1_id)
-        team2_stats = await feature_store.get_team_stats(request.team2_id)
-        
-        # Make prediction using baseline model
-        prediction = baseline_predictor.predict(team1_stats, team2_stats)
-        
-        # Convert team stats to response format
-        team1_response = TeamStats(
-            team_id=team1_stats["team_id"],
-            team_name=team1_stats["team_name"],
-            avg_acs=team1_stats["avg_acs"],
-            avg_kd=team1_stats["avg_kd"],
-            avg_rating=team1_stats["avg_rating"],
-            win_rate=team1_stats["win_rate"],
-            maps_played=team1_stats["maps_played"],
-            last_updated=team1_stats["last_updated"]
-        )
-        
-        team2_response = TeamStats(
-            team_id=team2_stats["team_id"],
-            team_name=team2_stats["team_name"],
-            avg_acs=team2_stats["avg_acs"],
-            avg_kd=team2_stats["avg_kd"],
-            avg_rating=team2_stats["avg_rating"],
-            win_rate=team2_stats["win_rate"],
-            maps_played=team2_stats["maps_played"],
-            last_updated=team2_stats["last_updated"]
-        )
-        
-        # Map team IDs to actual team names for response
-        predicted_winner_id = request.team1_id if prediction["predicted_winner"] == "team1" else request.team2_id
-        predicted_winner_name = team1_response.team_name if prediction["predicted_winner"] == "team1" else team2_response.team_name
-        
-        return PredictionResponse(
-            team1_id=request.team1_id,
-            team2_id=request.team2_id,
-            predicted_winner=predicted_winner_name,
-            confidence=prediction["confidence"],
-            team1_win_probability=prediction["team1_win_probability"],
-            team2_win_probability=prediction["team2_win_probability"],
-            team1_stats=team1_response,
-            team2_stats=team2_response,
-            prediction_timestamp=prediction["prediction_timestamp"],
-            model_version=prediction["model_version"]
-        )
-        
-    except Exception as e:
-        logger.error(f"Prediction failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+    # Get team statistics
+    team1_stats = await feature_store.get_team_stats(request.team1_id)
+    team2_stats = await feature_store.get_team_stats(request.team2_id)
+    
+    # Make prediction using baseline model
+    return _cached_prediction(
+        request, baseline_predictor.model_version, None, team1_stats, team2_stats,
+        lambda: baseline_predictor.predict(team1_stats, team2_stats)
+    )
+
+@router.post("/predict/batch", response_model=List[PredictionResponse])
+async def predict_match_batch(requests: List[PredictionRequest]):
+    """Predict several matchups, fetching each unique team's stats once."""
+    team_ids = [team_id for r in requests for team_id in (r.team1_id, r.team2_id)]
+    stats = await feature_store.get_team_stats_many(team_ids)
+    
+    predictions = baseline_predictor.predict_rows(
+        feature_store.get_stats_rows([r.team1_id for r in requests]),
+        feature_store.get_stats_rows([r.team2_id for r in requests])
+    )
+    
+    return msgspec_response([
+        _to_prediction_response(r, stats[r.team1_id], stats[r.team2_id], prediction)
+        for r, prediction in zip(requests, predictions)
+    ])
 
 @router.post("/predict/trained", response_model=PredictionResponse)
 async def predict_match_trained(request: PredictionRequest):
     """Predict match outcome using trained model."""
-    try:
-        # Get team statistics
-        team1_stats = await feature_store.get_team_stats(request.team1_id)
-        team2_stats = await feature_store.get_team_stats(request.team2_id)
-        
-        # Make prediction using trained model
-        prediction = trained_predictor.predict(team1_stats, team2_stats)
-        
-        # Convert team stats to response format
-        team1_response = TeamStats(
-            team_id=team1_stats["team_id"],
-            team_name=team1_stats["team_name"],
-            avg_acs=team1_stats["avg_acs"],
-            avg_kd=team1_stats["avg_kd"],
-            avg_rating=team1_stats["avg_rating"],
-            win_rate=team1_stats["win_rate"],
-            maps_played=team1_stats["maps_played"],
-            last_updated=team1_stats["last_updated"]
-        )
-        
-        team2_response = TeamStats(
-            team_id=team2_stats["team_id"],
-            team_name=team2_stats["team_name"],
-            avg_acs=team2_stats["avg_acs"],
-            avg_kd=team2_stats["avg_kd"],
-            avg_rating=team2_stats["avg_rating"],
-            win_rate=team2_stats["win_rate"],
-            maps_played=team2_stats["maps_played"],
-            last_updated=team2_stats["last_updated"]
-        )
-        
-        # Map team IDs to actual team names for response
-        predicted_winner_id = request.team1_id if prediction["predicted_winner"] == "team1" else request.team2_id
-        predicted_winner_name = team1_response.team_name if prediction["predicted_winner"] == "team1" else team2_response.team_name
-        
-        return PredictionResponse(
-            team1_id=request.team1_id,
-            team2_id=request.team2_id,
-            predicted_winner=predicted_winner_name,
-            confidence=prediction["confidence"],
-            team1_win_probability=prediction["team1_win_probability"],
-            team2_win_probability=prediction["team2_win_probability"],
-            team1_stats=team1_response,
-            team2_stats=team2_response,
-            prediction_timestamp=prediction["prediction_timestamp"],
-            model_version=prediction["model_version"]
-        )
-        
-    except Exception as e:
-        logger.error(f"Trained prediction failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Trained prediction failed: {str(e)}")
+    # Get team statistics
+    team1_stats = await feature_store.get_team_stats(request.team1_id)
+    team2_stats = await feature_store.get_team_stats(request.team2_id)
+    
+    # Until the model has loaded, predict() answers with the baseline; key on whichever
+    # model actually produced the body so the fallback isn't served once the model lands
+    model_version = trained_predictor.model_version if trained_predictor.model is not None else baseline_predictor.model_version
+    
+    # Make prediction using trained model
+    return _cached_prediction(
+        request, model_version, None, team1_stats, team2_stats,
+        lambda: trained_predictor.predict(team1_stats, team2_stats)
+    )
 
 @router.get("/debug/team/{team_id}")
-async def debug_team_stats(team_id: str):
+async def debug_team_stats(team_id: str, request: Request):
     """Debug endpoint to test team stats retrieval."""
     try:
         # Get team statistics directly
         team_stats = await feature_store.get_team_stats(team_id)
-        return {
+        return cached_json_response(request, {
             "team_id": team_id,
             "stats": team_stats,
             "success": True
-        }
+        })
     except Exception as e:
         return {
             "team_id": team_id,
@@ -143,80 +139,36 @@ async def debug_team_stats(team_id: str):
 @router.post("/predict/enhanced", response_model=PredictionResponse)
 async def predict_match_enhanced(request: PredictionRequest, map_name: str = None):
     """Predict match outcome using enhanced model with historical data."""
-    try:
-        # Get team statistics
-        team1_stats = await feature_store.get_team_stats(request.team1_id)
-        team2_stats = await feature_store.get_team_stats(request.team2_id)
-        
-        # Make prediction using enhanced model
-        prediction = enhanced_predictor.predict(team1_stats, team2_stats, map_name)
-        
-        # Convert team stats to response format
-        team1_response = TeamStats(
-            team_id=team1_stats["team_id"],
-            team_name=team1_stats["team_name"],
-            avg_acs=team1_stats["avg_acs"],
-            avg_kd=team1_stats["avg_kd"],
-            avg_rating=team1_stats["avg_rating"],
-            win_rate=team1_stats["win_rate"],
-            maps_played=team1_stats["maps_played"],
-            last_updated=team1_stats["last_updated"]
-        )
-        
-        team2_response = TeamStats(
-            team_id=team2_stats["team_id"],
-            team_name=team2_stats["team_name"],
-            avg_acs=team2_stats["avg_acs"],
-            avg_kd=team2_stats["avg_kd"],
-            avg_rating=team2_stats["avg_rating"],
-            win_rate=team2_stats["win_rate"],
-            maps_played=team2_stats["maps_played"],
-            last_updated=team2_stats["last_updated"]
-        )
-        
-        # Map team IDs to actual team names for response
-        predicted_winner_id = request.team1_id if prediction["predicted_winner"] == "team1" else request.team2_id
-        predicted_winner_name = team1_response.team_name if prediction["predicted_winner"] == "team1" else team2_response.team_name
-        
-        return PredictionResponse(
-            team1_id=request.team1_id,
-            team2_id=request.team2_id,
-            predicted_winner=predicted_winner_name,
-            confidence=prediction["confidence"],
-            team1_win_probability=prediction["team1_win_probability"],
-            team2_win_probability=prediction["team2_win_probability"],
-            team1_stats=team1_response,
-            team2_stats=team2_response,
-            prediction_timestamp=prediction["prediction_timestamp"],
-            model_version=prediction["model_version"]
-        )
-        
-    except Exception as e:
-        logger.error(f"Enhanced prediction failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Enhanced prediction failed: {str(e)}")
+    # Get team statistics
+    team1_stats = await feature_store.get_team_stats(request.team1_id)
+    team2_stats = await feature_store.get_team_stats(request.team2_id)
+    
+    # Make prediction using enhanced model
+    return _cached_prediction(
+        request, enhanced_predictor.model_version, map_name, team1_stats, team2_stats,
+        lambda: enhanced_predictor.predict(team1_stats, team2_stats, map_name)
+    )
 
 @router.post("/matches/add")
 async def add_match_to_history(match_data: dict):
     """Add a completed match to historical data."""
-    try:
-        enhanced_predictor.match_history.add_match(match_data)
-        return {"message": "Match added to history successfully"}
-    except Exception as e:
-        logger.error(f"Failed to add match to history: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to add match: {str(e)}")
+    enhanced_predictor.match_history.add_match(match_data)
+    # Enhanced predictions depend on match history
+    prediction_cache.clear()
+    return {"message": "Match added to history successfully"}
 
 @router.get("/history/form/{team_name}")
-async def get_team_form(team_name: str, matches: int = 5):
+async def get_team_form(team_name: str, request: Request, matches: int = 5):
     """Get recent form for a team."""
     try:
         form = enhanced_predictor.match_history.get_team_form(team_name, matches)
-        return {
+        return cached_json_response(request, {
             "team_name": team_name,
             "form": form,
             "success": True
-        }
+        })
     except Exception as e:
-        logger.error(f"Failed to get team form: {e}")
+        logger.error("Failed to get team form: %s", e)
         return {
             "team_name": team_name,
             "error": str(e),
@@ -224,18 +176,18 @@ async def get_team_form(team_name: str, matches: int = 5):
         }
 
 @router.get("/history/h2h/{team1}/{team2}")
-async def get_head_to_head(team1: str, team2: str):
+async def get_head_to_head(team1: str, team2: str, request: Request):
     """Get head-to-head record between two teams."""
     try:
         h2h = enhanced_predictor.match_history.get_head_to_head(team1, team2)
-        return {
+        return cached_json_response(request, {
             "team1": team1,
             "team2": team2,
             "head_to_head": h2h,
             "success": True
-        }
+        })
     except Exception as e:
-        logger.error(f"Failed to get head-to-head: {e}")
+        logger.error("Failed to get head-to-head: %s", e)
         return {
             "team1": team1,
             "team2": team2,
@@ -246,46 +198,42 @@ async def get_head_to_head(team1: str, team2: str):
 @router.post("/predict/sos", response_model=PredictionResponse)
 async def predict_match_sos(request: PredictionRequest, map_name: str = None):
     """Predict match outcome using strength of schedule adjustments."""
-    try:
-        team1_stats = await feature_store.get_team_stats(request.team1_id)
-        team2_stats = await feature_store.get_team_stats(request.team2_id)
-        prediction = sos_predictor.predict(team1_stats, team2_stats)
-        
-        # Convert team stats to TeamStats objects
-        team1_stats_obj = TeamStats(
-            team_id=request.team1_id,
-            team_name=team1_stats.get('team_name', 'Unknown'),
-            avg_acs=team1_stats.get('avg_acs', 0),
-            avg_kd=team1_stats.get('avg_kd', 0),
-            avg_rating=team1_stats.get('avg_rating', 0),
-            win_rate=team1_stats.get('win_rate', 0),
-            maps_played=team1_stats.get('maps_played', 0),
-            last_updated=team1_stats.get('last_updated', datetime.utcnow())
-        )
-        
-        team2_stats_obj = TeamStats(
-            team_id=request.team2_id,
-            team_name=team2_stats.get('team_name', 'Unknown'),
-            avg_acs=team2_stats.get('avg_acs', 0),
-            avg_kd=team2_stats.get('avg_kd', 0),
-            avg_rating=team2_stats.get('avg_rating', 0),
-            win_rate=team2_stats.get('win_rate', 0),
-            maps_played=team2_stats.get('maps_played', 0),
-            last_updated=team2_stats.get('last_updated', datetime.utcnow())
-        )
-        
-        return PredictionResponse(
-            team1_id=request.team1_id,
-            team2_id=request.team2_id,
-            predicted_winner=prediction["predicted_winner"],
-            confidence=prediction["confidence"],
-            team1_win_probability=prediction["team1_win_probability"],
-            team2_win_probability=prediction["team2_win_probability"],
-            team1_stats=team1_stats_obj,
-            team2_stats=team2_stats_obj,
-            model_version=prediction["model_version"],
-            prediction_timestamp=prediction["prediction_timestamp"]
-        )
-    except Exception as e:
-        logger.error(f"SOS prediction failed: {e}")
-        raise HTTPException(status_code=500, detail=f"SOS prediction failed: {str(e)}")
+    team1_stats = await feature_store.get_team_stats(request.team1_id)
+    team2_stats = await feature_store.get_team_stats(request.team2_id)
+    prediction = sos_predictor.predict(team1_stats, team2_stats)
+    
+    # Convert team stats to TeamStats structs
+    team1_stats_obj = TeamStatsFast(
+        team_id=request.team1_id,
+        team_name=team1_stats.get('team_name', 'Unknown'),
+        avg_acs=team1_stats.get('avg_acs', 0),
+        avg_kd=team1_stats.get('avg_kd', 0),
+        avg_rating=team1_stats.get('avg_rating', 0),
+        win_rate=team1_stats.get('win_rate', 0),
+        maps_played=team1_stats.get('maps_played', 0),
+        last_updated=_as_datetime(team1_stats.get('last_updated', time.time()))
+    )
+    
+    team2_stats_obj = TeamStatsFast(
+        team_id=request.team2_id,
+        team_name=team2_stats.get('team_name', 'Unknown'),
+        avg_acs=team2_stats.get('avg_acs', 0),
+        avg_kd=team2_stats.get('avg_kd', 0),
+        avg_rating=team2_stats.get('avg_rating', 0),
+        win_rate=team2_stats.get('win_rate', 0),
+        maps_played=team2_stats.get('maps_played', 0),
+        last_updated=_as_datetime(team2_stats.get('last_updated', time.time()))
+    )
+    
+    return msgspec_response(PredictionResponseFast(
+        team1_id=request.team1_id,
+        team2_id=request.team2_id,
+        predicted_winner=prediction["predicted_winner"],
+        confidence=prediction["confidence"],
+        team1_win_probability=prediction["team1_win_probability"],
+        team2_win_probability=prediction["team2_win_probability"],
+        team1_stats=team1_stats_obj,
+        team2_stats=team2_stats_obj,
+        model_version=prediction["model_version"],
+        prediction_timestamp=_as_datetime(prediction["prediction_timestamp"])
+    ))
@@ -1,146 +1,142 @@
 """Team data endpoints."""
 
+import asyncio
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
-import httpx
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Union
 from app.logging_utils import get_logger
-from app.team_mapping import team_mapper
+from app.team_mapping import team_mapper, team_id_for
+from app.upstream import vlr_client
 
+# Team payloads are plain dicts of strings and numbers, so routes return ORJSONResponse
+# directly rather than walking them through jsonable_encoder first
 router = APIRouter()
 logger = get_logger(__name__)
 
+REGIONS = ["na", "eu", "ap", "sa", "jp", "oce", "mn", "kr", "cn"]
+
+# Positions in REGIONS ordered by region label, so per-region lists concatenate already sorted
+_REGION_ORDER = sorted(range(len(REGIONS)), key=lambda i: REGIONS[i].upper())
+
+async def _get_region_rankings(region: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    """Ranked teams for one region, served from the VLR client's response cache unless force_refresh."""
+    if force_refresh:
+        vlr_client.get_rankings.invalidate(region)
+    return await vlr_client.get_rankings(region)
+
+def _rank_key(team: Dict[str, Any]) -> int:
+    """Numeric rank for sorting; ranks arrive as strings, and unparseable ones sort last."""
+    try:
+        return int(team.get("rank", 999))
+    except (TypeError, ValueError):
+        return 999
+
+async def _fetch_all_regions(force_refresh: bool = False) -> List[Union[List[Dict[str, Any]], Exception]]:
+    """Rankings for every region, fetched concurrently; failures come back as exceptions in place."""
+    return await asyncio.gather(
+        *[_get_region_rankings(region, force_refresh) for region in REGIONS], return_exceptions=True
+    )
+
 @router.get("/rankings/{region}")
-async def get_team_rankings(region: str, limit: int = 20):
+async def get_team_rankings(region: str, limit: int = 20, force_refresh: bool = False):
     """Get team rankings from VLR.gg API."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"https://vlrggapi.vercel.app/rankings?region={region}")
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("status") == 200 and data.get("data"):
-                teams = data["data"][:limit]
-                # Add team_id for easier frontend usage
-                for team in teams:
-                    team["team_id"] = team["team"].lower().replace(" ", "_").replace("-", "_").replace("'", "").replace(".", "")
-                
-                return {
-                    "region": region.upper(),
-                    "teams": teams,
-                    "total": len(teams)
-                }
-            else:
-                raise HTTPException(status_code=404, detail=f"No rankings found for region {region}")
-                
-    except httpx.HTTPError as e:
-        logger.error(f"HTTP error fetching rankings for {region}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch rankings: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error fetching rankings for {region}: {e}")
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+    region_teams = await _get_region_rankings(region, force_refresh)
+    
+    if region_teams:
+        # Add team_id for easier frontend usage
+        teams = [
+            {**team, "team_id": team_id_for(team["team"])}
+            for team in region_teams[:limit]
+        ]
+        
+        return ORJSONResponse({
+            "region": region.upper(),
+            "teams": teams,
+            "total": len(teams)
+        })
+    else:
+        raise HTTPException(status_code=404, detail=f"No rankings found for region {region}")
 
 @router.get("/rankings")
-async def get_all_team_rankings(limit: int = 20, professional_only: bool = True):
+async def get_all_team_rankings(limit: int = 20, professional_only: bool = True, force_refresh: bool = False):
     """Get team rankings from all regions, optionally filtered to professional teams only."""
-    regions = ["na", "eu", "ap", "sa", "jp", "oce", "mn", "kr", "cn"]
     all_teams = []
     
-    try:
-        async with httpx.AsyncClient() as client:
-            for region in regions:
-                try:
-                    response = await client.get(f"https://vlrggapi.vercel.app/rankings?region={region}")
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if data.get("status") == 200 and data.get("data"):
-                        region_teams = data["data"][:limit * 2]  # Get more to filter
-                        for team in region_teams:
-                            team["team_id"] = team["team"].lower().replace(" ", "_").replace("-", "_").replace("'", "").replace(".", "")
-                            team["region"] = region.upper()
-                        all_teams.extend(region_teams)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to fetch teams from {region}: {e}")
-                    continue
+    results = await _fetch_all_regions(force_refresh)
+    
+    # Rank-sort each region, so walking regions by label yields (region, rank) order
+    for i in _REGION_ORDER:
+        region, result = REGIONS[i], results[i]
+        if isinstance(result, Exception):
+            logger.warning("Failed to fetch teams from %s: %s", region, result)
+            continue
+        for team in sorted(result, key=_rank_key)[:limit * 2]:  # Get more to filter
+            all_teams.append({
+                **team,
+                "team_id": team_id_for(team["team"]),
+                "region": region.upper()
+            })
+    
+    # Filter to professional teams only if requested
+    if professional_only:
+        all_teams = team_mapper.filter_professional_teams(all_teams)
+        logger.info(f"Filtered to {len(all_teams)} professional teams")
+    
+    return ORJSONResponse({
+        "teams": all_teams,
+        "total": len(all_teams),
+        "regions": REGIONS,
+        "professional_only": professional_only
+    })
+
+@router.get("/search")
+async def search_teams(query: str, limit: int = 10, force_refresh: bool = False):
+    """Search for professional teams by name."""
+    # Use team mapper to find teams
+    found_team = team_mapper.find_team(query)
+    
+    if found_team:
+        return ORJSONResponse({
+            "teams": [{
+                "team": found_team.name,
+                "team_id": found_team.team_id,
+                "region": found_team.region,
+                "rank": found_team.rank,
+                "record": found_team.record,
+                "earnings": found_team.earnings,
+                "is_professional": found_team.is_professional
+            }],
+            "total": 1,
+            "query": query
+        })
+    else:
+        # Fallback to API search
+        matching_teams = []
         
-        # Filter to professional teams only if requested
-        if professional_only:
-            all_teams = team_mapper.filter_professional_teams(all_teams)
-            logger.info(f"Filtered to {len(all_teams)} professional teams")
+        results = await _fetch_all_regions(force_refresh)
         
-        # Sort by region and rank
-        all_teams.sort(key=lambda x: (x.get("region", ""), int(x.get("rank", 999))))
+        for region, result in zip(REGIONS, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to search teams in %s: %s", region, result)
+                continue
+            for team in result:
+                if query.lower() in team["team"].lower():
+                    matching_teams.append({
+                        **team,
+                        "team_id": team_id_for(team["team"]),
+                        "region": region.upper()
+                    })
         
-        return {
-            "teams": all_teams,
-            "total": len(all_teams),
-            "regions": regions,
-            "professional_only": professional_only
-        }
+        # Filter to professional teams
+        matching_teams = team_mapper.filter_professional_teams(matching_teams)
         
-    except Exception as e:
-        logger.error(f"Error fetching all rankings: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch team data: {str(e)}")
-
-@router.get("/search")
-async def search_teams(query: str, limit: int = 10):
-    """Search for professional teams by name."""
-    try:
-        # Use team mapper to find teams
-        found_team = team_mapper.find_team(query)
+        # Add is_professional flag to all teams (teams kept for earnings/record are not franchised)
+        professional_ids = team_mapper.professional_ids
+        for team in matching_teams:
+            team["is_professional"] = team["team_id"] in professional_ids
         
-        if found_team:
-            return {
-                "teams": [{
-                    "team": found_team.name,
-                    "team_id": found_team.team_id,
-                    "region": found_team.region,
-                    "rank": found_team.rank,
-                    "record": found_team.record,
-                    "earnings": found_team.earnings,
-                    "is_professional": found_team.is_professional
-                }],
-                "total": 1,
-                "query": query
-            }
-        else:
-            # Fallback to API search
-            regions = ["na", "eu", "ap", "sa", "jp", "oce", "mn", "kr", "cn"]
-            matching_teams = []
-            
-            async with httpx.AsyncClient() as client:
-                for region in regions:
-                    try:
-                        response = await client.get(f"https://vlrggapi.vercel.app/rankings?region={region}")
-                        response.raise_for_status()
-                        data = response.json()
-                        
-                        if data.get("status") == 200 and data.get("data"):
-                            region_teams = data["data"]
-                            for team in region_teams:
-                                if query.lower() in team["team"].lower():
-                                    team["team_id"] = team["team"].lower().replace(" ", "_").replace("-", "_").replace("'", "").replace(".", "")
-                                    team["region"] = region.upper()
-                                    matching_teams.append(team)
-                                    
-                    except Exception as e:
-                        logger.warning(f"Failed to search teams in {region}: {e}")
-                        continue
-            
-            # Filter to professional teams
-            matching_teams = team_mapper.filter_professional_teams(matching_teams)
-            
-            # Add is_professional flag to all teams
-            for team in matching_teams:
-                team["is_professional"] = team_mapper.is_professional_team(team["team_id"])
-            
-            return {
-                "teams": matching_teams[:limit],
-                "total": len(matching_teams),
-                "query": query
-            }
-            
-    except Exception as e:
-        logger.error(f"Error searching teams: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to search teams: {str(e)}")
+        return ORJSONResponse({
+            "teams": matching_teams[:limit],
+            "total": len(matching_teams),
+            "query": query
+        })
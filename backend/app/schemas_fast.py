@@ -0,0 +1,66 @@
+"""msgspec structs for hot-path response payloads.
+
+The Pydantic models in app.models stay the documented OpenAPI schema; these
+structs mirror their wire shape for responses built from trusted internal data.
+"""
+
+from typing import Any, List, Optional
+from datetime import datetime
+import msgspec
+import numpy as np
+from fastapi import Response
+
+class TeamStatsFast(msgspec.Struct, frozen=True):
+    """Team statistics for prediction (see app.models.TeamStats)."""
+    team_id: str
+    team_name: str
+    avg_acs: float
+    avg_kd: float
+    avg_rating: float
+    win_rate: float
+    maps_played: int
+    last_updated: datetime
+
+class PredictionResponseFast(msgspec.Struct, frozen=True):
+    """Response for match prediction (see app.models.PredictionResponse)."""
+    team1_id: str
+    team2_id: str
+    predicted_winner: str
+    confidence: float
+    team1_win_probability: float
+    team2_win_probability: float
+    team1_stats: TeamStatsFast
+    team2_stats: TeamStatsFast
+    prediction_timestamp: datetime
+    model_version: str = "baseline"
+
+class TeamFast(msgspec.Struct, frozen=True):
+    """Team information (see app.models.Team)."""
+    id: str
+    name: str
+    slug: str
+    logo_url: Optional[str] = None
+    country: Optional[str] = None
+
+class MatchFast(msgspec.Struct, frozen=True):
+    """Match information (see app.models.Match)."""
+    id: str
+    team1: TeamFast
+    team2: TeamFast
+    status: str
+    scheduled_time: Optional[datetime] = None
+    maps: List[Any] = []
+    tournament: Optional[str] = None
+    round: Optional[str] = None
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode numpy scalars coming out of the predictors."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+def msgspec_response(payload: Any, status_code: int = 200) -> Response:
+    """Encode structs (or lists of them) straight to a JSON response."""
+    return Response(content=_encoder.encode(payload), status_code=status_code, media_type="application/json")
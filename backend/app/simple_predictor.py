@@ -5,171 +5,310 @@ import sys
 import joblib
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+DAY_NS = 86_400 * 10**9
+
+# numba is optional; when installed the Elo loop is compiled, otherwise it runs as plain Python
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True)
+def _elo_kernel(dates_ns, teamA_idx, teamB_idx, map_idx, winnerA, tier1, n_slots, n_maps, k_base, decay_half_life):
+    """Per-map Elo over history rows; slot team * n_maps + map, last_seen -1 until first played."""
+    mean_rating = 1500.0
+    ratings = np.full(n_slots, mean_rating)
+    last_seen = np.full(n_slots, -1, dtype=np.int64)
+    for i in range(len(dates_ns)):
+        d = dates_ns[i]
+        slotA = teamA_idx[i] * n_maps + map_idx[i]
+        slotB = teamB_idx[i] * n_maps + map_idx[i]
+        
+        # Decay each side toward the mean by the days since it last played this map
+        for slot in (slotA, slotB):
+            if last_seen[slot] != -1:
+                gap = abs((d - last_seen[slot]) // DAY_NS)
+                if gap > 0:
+                    ratings[slot] = mean_rating + (ratings[slot] - mean_rating) * (0.5 ** (gap / decay_half_life))
+            last_seen[slot] = d
+        
+        RA = ratings[slotA]
+        RB = ratings[slotB]
+        EA = 1.0 / (1.0 + 10.0 ** ((RB - RA) / 400.0))
+        outcomeA = 1.0 if winnerA[i] else 0.0
+        
+        K = k_base * (1.1 if tier1[i] else 1.0)
+        ratings[slotA] = RA + K * (outcomeA - EA)
+        ratings[slotB] = RB + K * ((1.0 - outcomeA) - (1.0 - EA))
+    return ratings
+
+def _decay_weights(ref_ns: int, dates_ns: np.ndarray, half_life_days: float) -> np.ndarray:
+    """0.5 ** (whole days before ref_ns / half-life), computed in place with one integer and one float buffer."""
+    days = ref_ns - dates_ns
+    np.floor_divide(days, DAY_NS, out=days)
+    w = np.multiply(days, -1.0 / half_life_days)
+    return np.exp2(w, out=w)
+
+@lru_cache(maxsize=512)
+def _cached_feature_row(predictor: "SimplePredictor", version: int, teamA: str, teamB: str, map_name: str) -> Dict[str, float]:
+    """Memoized feature row as of the latest history, for one history version."""
+    return predictor._feature_row(teamA, teamB, map_name)
+
+@lru_cache(maxsize=512)
+def _cached_predict(predictor: "SimplePredictor", version: int, teamA: str, teamB: str, map_name: str) -> Dict:
+    """Memoized prediction for one history version."""
+    return predictor._predict(teamA, teamB, map_name)
+
 class SimplePredictor:
     """Simplified predictor that loads the model without complex calibrator."""
     
+    # backend/artifacts (same level as app/), resolved once for every instance
+    DEFAULT_ARTIFACTS_DIR = project_root / "artifacts"
+    
     def __init__(self, artifacts_dir: Optional[str] = None):
-        if artifacts_dir is None:
-            # Default to backend/artifacts (same level as app/)
-            artifacts_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "artifacts")
-        self.artifacts_dir = artifacts_dir
+        """Load the model and the DATA_CSV history; with USE_VLRGG set, VLR.gg history is only used after `await warmup()`."""
+        # Relative overrides are taken from the backend root, like DATA_CSV
+        artifacts_path = Path(artifacts_dir) if artifacts_dir is not None else self.DEFAULT_ARTIFACTS_DIR
+        self.artifacts_dir = artifacts_path if artifacts_path.is_absolute() else project_root / artifacts_path
         self.model = None
         self.xcols = None
+        # Linear terms of the scaler + logistic pipeline, so predict is one dot product
+        self._mean: Optional[np.ndarray] = None
+        self._scale: Optional[np.ndarray] = None
+        self._coef: Optional[np.ndarray] = None
+        self._intercept = 0.0
         self.df_hist = None
+        self.team_codes: Dict[str, int] = {}
+        self.map_codes: Dict[str, int] = {}
+        # (team, map) -> [start, stop) of its date-sorted run in the either-side arrays
+        self._team_map_span: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        # Bumped on every history rebuild; feature and prediction caches key on it
+        self._df_hist_version = 0
+        # (history signature, ratings) of the last Elo build; history reloads invalidate it
+        self._map_elo_cache: Optional[Tuple[tuple, np.ndarray]] = None
         self._load_model()
         self._load_historical_data()
+        self._build_history_arrays()
     
     def _load_model(self):
         """Load the trained model."""
+        model_path = self.artifacts_dir / "model.joblib"
         try:
-            artifacts_path = project_root / self.artifacts_dir
-            model_path = artifacts_path / "model.joblib"
-            xcols_path = artifacts_path / "xcols.joblib"
-            
-            if model_path.exists() and xcols_path.exists():
-                self.model = joblib.load(str(model_path))
-                self.xcols = joblib.load(str(xcols_path))
-                print(f"Loaded model from {model_path}")
-            else:
-                print(f"Model files not found in {artifacts_path}")
+            self.model = joblib.load(model_path)
+            self.xcols = joblib.load(self.artifacts_dir / "xcols.joblib")
+            self._cache_linear_terms()
+            print(f"Loaded model from {model_path}")
+        except FileNotFoundError:
+            self.model = self.xcols = None
+            print(f"Model files not found in {self.artifacts_dir}")
         except Exception as e:
             print(f"Failed to load model: {e}")
     
+    def _cache_linear_terms(self):
+        """Pull the standardization and logistic weights out of the pipeline once."""
+        scaler = self.model.named_steps["scaler"]
+        clf = self.model.named_steps["clf"]
+        n = len(self.xcols)
+        self._mean = scaler.mean_ if scaler.with_mean else np.zeros(n)
+        self._scale = scaler.scale_ if scaler.with_std else np.ones(n)
+        self._coef = clf.coef_.ravel()
+        self._intercept = float(clf.intercept_[0])
+    
     def _load_historical_data(self):
-        """Load historical data for feature computation."""
+        """Load historical data (Parquet beside the CSV if present) for feature computation (see warmup() for VLR.gg)."""
         try:
-            # Check if we should use VLR.gg API
-            use_vlrgg = os.getenv("USE_VLRGG", "false").lower() == "true"
-            
-            if use_vlrgg:
-                print("Loading historical data from VLR.gg API...")
-                try:
-                    import asyncio
-                    from app.vlrgg_integration import fetch_map_matches_vlrgg
-                    
-                    # Check if we're already in an event loop
-                    try:
-                        loop = asyncio.get_running_loop()
-                        # We're in an event loop, create a task
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, fetch_map_matches_vlrgg(days=30, limit=200))
-                            self.df_hist = future.result()
-                    except RuntimeError:
-                        # No event loop running, safe to use asyncio.run
-                        self.df_hist = asyncio.run(fetch_map_matches_vlrgg(days=30, limit=200))
-                    
-                    if not self.df_hist.empty:
-                        self.df_hist["date"] = pd.to_datetime(self.df_hist["date"])
-                        print(f"Loaded {len(self.df_hist)} matches from VLR.gg API")
-                        return
-                    else:
-                        print("No data from VLR.gg, falling back to CSV")
-                except Exception as e:
-                    print(f"Failed to load from VLR.gg: {e}, falling back to CSV")
-            
-            # CSV fallback
             csv_path = os.getenv("DATA_CSV", "./data/map_matches_365d.csv")
             
             if not os.path.isabs(csv_path):
                 csv_path = str(project_root / csv_path)
             
+            # A typed Parquet copy (misc/scripts/convert_history_to_parquet.py) skips text parsing
+            # entirely; it is only trusted while it is at least as new as the CSV
+            parquet_path = Path(csv_path).with_suffix(".parquet")
+            if parquet_path.exists() and (
+                not os.path.exists(csv_path) or parquet_path.stat().st_mtime >= os.path.getmtime(csv_path)
+            ):
+                try:
+                    self.df_hist = pd.read_parquet(parquet_path)
+                    print(f"Loaded historical data from {parquet_path}")
+                    return
+                except Exception as e:
+                    print(f"Cannot read {parquet_path} ({e}), falling back to CSV")
+            
             if os.path.exists(csv_path):
-                self.df_hist = pd.read_csv(csv_path)
-                self.df_hist["date"] = pd.to_datetime(self.df_hist["date"])
+                self.df_hist = pd.read_csv(csv_path, parse_dates=["date"])
                 print(f"Loaded historical data from {csv_path}")
             else:
                 print(f"Historical data not found at {csv_path}")
         except Exception as e:
             print(f"Failed to load historical data: {e}")
     
-    def _compute_map_elo(self, df: pd.DataFrame, k_base: float = 20.0, decay_half_life: float = 120.0) -> Dict[tuple, float]:
-        """Simple per-map Elo calculation."""
-        ratings = {}
-        last_seen = {}
-        mean_rating = 1500.0
-
-        def decay_to_mean(team_map: tuple, curr_date: datetime):
-            if team_map not in ratings:
-                ratings[team_map] = mean_rating
-                last_seen[team_map] = curr_date
-                return
-            gap = abs((curr_date - last_seen[team_map]).days)
-            if gap <= 0:
-                last_seen[team_map] = curr_date
+    async def warmup(self):
+        """Swap in recent VLR.gg matches when USE_VLRGG is set; await from an async entry point such as startup."""
+        if os.getenv("USE_VLRGG", "false").lower() != "true":
+            return
+        
+        print("Loading historical data from VLR.gg API...")
+        try:
+            from app.vlrgg_integration import fetch_map_matches_vlrgg
+            
+            df = await fetch_map_matches_vlrgg(days=30, limit=200)
+            if df.empty:
+                print("No data from VLR.gg, keeping CSV history")
                 return
-            chunks = gap / decay_half_life
-            ratings[team_map] = mean_rating + (ratings[team_map] - mean_rating) * (0.5 ** chunks)
-            last_seen[team_map] = curr_date
-
-        for _, r in df.iterrows():
-            d = r["date"]
-            tA, tB = r["teamA"], r["teamB"]
-            mp = r["map_name"]
-            keyA, keyB = (tA, mp), (tB, mp)
-            decay_to_mean(keyA, d)
-            decay_to_mean(keyB, d)
-
-            RA = ratings.get(keyA, mean_rating)
-            RB = ratings.get(keyB, mean_rating)
-            EA = 1.0 / (1.0 + 10.0 ** ((RB - RA) / 400.0))
-            outcomeA = 1.0 if r["winner"] == tA else 0.0
-
-            K = k_base * (1.1 if r["tier"] == 1 else 1.0)
-            ratings[keyA] = RA + K * (outcomeA - EA)
-            ratings[keyB] = RB + K * ((1.0 - outcomeA) - (1.0 - EA))
-            last_seen[keyA] = d
-            last_seen[keyB] = d
-
-        return ratings
+            
+            df["date"] = pd.to_datetime(df["date"])
+            self.df_hist = df
+            self._build_history_arrays()
+            print(f"Loaded {len(self.df_hist)} matches from VLR.gg API")
+        except Exception as e:
+            print(f"Failed to load from VLR.gg: {e}, keeping CSV history")
+    
+    def _build_history_arrays(self):
+        """Factorize history into flat per-row arrays (SoA) so features never touch the DataFrame."""
+        self.team_codes, self.map_codes, self._team_map_span = {}, {}, {}
+        self._map_elo_cache = None
+        self._df_hist_version += 1
+        if self.df_hist is None or self.df_hist.empty:
+            return
+        
+        df = self.df_hist
+        n = len(df)
+        # One code space for teamA/teamB/winner so a team keeps its id wherever it appears
+        codes, teams = pd.factorize(
+            pd.concat([df["teamA"], df["teamB"], df["winner"]], ignore_index=True), use_na_sentinel=False
+        )
+        map_ids, maps = pd.factorize(df["map_name"], use_na_sentinel=False)
+        self._teamA_idx, self._teamB_idx = codes[:n], codes[n:2 * n]
+        self._map_idx = map_ids
+        self._dates_ns = df["date"].values.astype("datetime64[ns]").view(np.int64)
+        self._winnerA = (df["winner"] == df["teamA"]).to_numpy()
+        self._tier1 = (df["tier"] == 1).to_numpy() if "tier" in df else np.zeros(n, dtype=bool)
+        self.team_codes = {team: i for i, team in enumerate(teams)}
+        self.map_codes = {map_name: i for i, map_name in enumerate(maps)}
+        
+        # Either-side ("long") view: every row once from each team's side, sorted by (team, map, date)
+        # so a (team, map) history is one contiguous run and "before ref_date" is a searchsorted cut
+        team = np.concatenate([self._teamA_idx, self._teamB_idx])
+        map_long = np.concatenate([map_ids, map_ids])
+        order = np.lexsort((np.tile(self._dates_ns, 2), map_long, team))
+        self._long_team = team[order]
+        self._long_opp = np.concatenate([self._teamB_idx, self._teamA_idx])[order]
+        self._long_dates_ns = np.tile(self._dates_ns, 2)[order]
+        self._long_won = np.concatenate([self._winnerA, (df["winner"] == df["teamB"]).to_numpy()])[order]
+        # float32 halves the bytes the weighted averages stream and keeps NaN for missing stats
+        self._long_metrics = {
+            metric: np.concatenate([df[f"teamA_{metric}"].to_numpy(dtype=np.float32), df[f"teamB_{metric}"].to_numpy(dtype=np.float32)])[order]
+            for metric in ("ACS", "KD") if f"teamA_{metric}" in df and f"teamB_{metric}" in df
+        }
+        
+        long_map = map_long[order]
+        starts = np.flatnonzero(np.r_[True, (np.diff(self._long_team) != 0) | (np.diff(long_map) != 0)])
+        stops = np.r_[starts[1:], 2 * n]
+        self._team_map_span = {
+            (teams[self._long_team[start]], maps[long_map[start]]): (int(start), int(stop))
+            for start, stop in zip(starts, stops)
+        }
+    
+    def _rows_before(self, team: str, map_name: str, ref_ns: int) -> slice:
+        """Slice of the team's either-side rows on a map dated strictly before ref_ns."""
+        start, stop = self._team_map_span.get((team, map_name), (0, 0))
+        return slice(start, start + int(np.searchsorted(self._long_dates_ns[start:stop], ref_ns, side="left")))
     
-    def _recency_weighted_winrate(self, df: pd.DataFrame, ref_date: datetime, team: str, map_name: str, half_life_days: float = 60.0) -> Optional[float]:
+    def _compute_map_elo(self, k_base: float = 20.0, decay_half_life: float = 120.0) -> np.ndarray:
+        """Simple per-map Elo calculation; slot team_code * n_maps + map_code holds (team, map)."""
+        n_maps = len(self.map_codes)
+        n_slots = len(self.team_codes) * n_maps
+        if not self.team_codes:
+            return np.full(n_slots, 1500.0)
+        
+        cols = (self._dates_ns, self._teamA_idx, self._teamB_idx, self._map_idx, self._winnerA, self._tier1)
+        if not HAVE_NUMBA:
+            # Interpreted element access is much cheaper on lists than on ndarrays
+            cols = tuple(col.tolist() for col in cols)
+        return _elo_kernel(*cols, n_slots, n_maps, k_base, decay_half_life)
+    
+    def _map_elo(self) -> np.ndarray:
+        """Per-map Elo ratings for the loaded history, built once and reused across predictions."""
+        signature = (id(self.df_hist), len(self.df_hist))
+        if self._map_elo_cache is None or self._map_elo_cache[0] != signature:
+            self._map_elo_cache = (signature, self._compute_map_elo())
+        return self._map_elo_cache[1]
+    
+    def _elo_rating(self, ratings: np.ndarray, team: str, map_name: str) -> float:
+        """A team's Elo on a map, 1500 if it never played there."""
+        team_code = self.team_codes.get(team)
+        map_code = self.map_codes.get(map_name)
+        if team_code is None or map_code is None:
+            return 1500.0
+        return float(ratings[team_code * len(self.map_codes) + map_code])
+    
+    def _recency_weighted_winrate(self, ref_date: datetime, team: str, map_name: str, half_life_days: float = 60.0) -> Optional[float]:
         """Calculate recency-weighted win rate."""
-        hist = df[(df["date"] < ref_date) & (df["map_name"] == map_name) & ((df["teamA"] == team) | (df["teamB"] == team))]
-        if hist.empty:
+        ref_ns = pd.Timestamp(ref_date).value
+        rows = self._rows_before(team, map_name, ref_ns)
+        if rows.start == rows.stop:
             return None
-        num, den = 0.0, 0.0
-        for _, r in hist.iterrows():
-            delta = abs((ref_date - r["date"]).days)
-            w = 0.5 ** (delta / half_life_days)
-            win = 1.0 if r["winner"] == team else 0.0
-            num += w * win
-            den += w
+        w = _decay_weights(ref_ns, self._long_dates_ns[rows], half_life_days)
+        den = w.sum()
         if den == 0.0:
             return None
-        return float(num / den)
+        return float(w[self._long_won[rows]].sum() / den)
     
-    def _h2h_shrunken(self, df: pd.DataFrame, ref_date: datetime, teamA: str, teamB: str, map_name: str, tau_days: float = 60.0, shrink_lambda: float = 7.0) -> float:
+    def _h2h_shrunken(self, ref_date: datetime, teamA: str, teamB: str, map_name: str, tau_days: float = 60.0, shrink_lambda: float = 7.0) -> float:
         """Calculate head-to-head with shrinkage."""
-        mask = (df["date"] < ref_date) & (df["map_name"] == map_name) & (
-            ((df["teamA"] == teamA) & (df["teamB"] == teamB)) | ((df["teamA"] == teamB) & (df["teamB"] == teamA))
-        )
-        hist = df[mask]
-        if hist.empty:
+        teamB_code = self.team_codes.get(teamB)
+        if teamB_code is None:
+            return 0.0
+        ref_ns = pd.Timestamp(ref_date).value
+        rows = self._rows_before(teamA, map_name, ref_ns)
+        vs = self._long_opp[rows] == teamB_code
+        n_h2h = int(vs.sum())
+        if n_h2h == 0:
             return 0.0
-        score, wsum, n = 0.0, 0.0, 0
-        for _, r in hist.iterrows():
-            delta = abs((ref_date - r["date"]).days)
-            w = np.exp(-delta / tau_days)
-            s = +1.0 if r["winner"] == teamA else -1.0
-            score += w * s
-            wsum += w
-            n += 1
+        # exp(-days / tau) is a half-life of tau * ln 2
+        w = _decay_weights(ref_ns, self._long_dates_ns[rows][vs], tau_days * np.log(2.0))
+        s = np.where(self._long_won[rows][vs], 1.0, -1.0)
+        wsum = w.sum()
         if wsum == 0.0:
             return 0.0
-        norm = score / wsum
-        shrink = n / (n + shrink_lambda)
+        norm = (w * s).sum() / wsum
+        shrink = n_h2h / (n_h2h + shrink_lambda)
         return float(norm * shrink)
     
+    def _recency_agg_metric(self, ref_date: datetime, team: str, map_name: str, metric: str) -> Optional[float]:
+        """Recency-weighted average of a per-side stat (ACS, KD) on a map."""
+        ref_ns = pd.Timestamp(ref_date).value
+        rows = self._rows_before(team, map_name, ref_ns)
+        if rows.start == rows.stop:
+            return None
+        vals = self._long_metrics[metric][rows]
+        w = _decay_weights(ref_ns, self._long_dates_ns[rows], 60.0)  # 60-day half-life
+        known = ~np.isnan(vals)
+        den = w[known].sum()
+        return None if den == 0 else float((w[known] * vals[known]).sum() / den)
+    
     def _compute_feature_row_for_match(self, teamA: str, teamB: str, map_name: str, ref_date: Optional[datetime] = None) -> Dict[str, float]:
+        """Compute features for a specific match (memoized when ref_date is omitted)."""
+        if ref_date is None:
+            # Copy so a caller mutating its row can't change later cache hits
+            return dict(_cached_feature_row(self, self._df_hist_version, teamA, teamB, map_name))
+        return self._feature_row(teamA, teamB, map_name, ref_date)
+    
+    def _feature_row(self, teamA: str, teamB: str, map_name: str, ref_date: Optional[datetime] = None) -> Dict[str, float]:
         """Compute features for a specific match."""
         if self.df_hist is None:
             raise ValueError("No historical data available")
@@ -178,39 +317,24 @@ class SimplePredictor:
             ref_date = self.df_hist["date"].max() + pd.Timedelta(days=1)
         
         # Win rate features
-        wrA = self._recency_weighted_winrate(self.df_hist, ref_date, teamA, map_name)
-        wrB = self._recency_weighted_winrate(self.df_hist, ref_date, teamB, map_name)
+        wrA = self._recency_weighted_winrate(ref_date, teamA, map_name)
+        wrB = self._recency_weighted_winrate(ref_date, teamB, map_name)
         winrate_diff = (wrA if wrA is not None else 0.5) - (wrB if wrB is not None else 0.5)
         
         # H2H features
-        h2h = self._h2h_shrunken(self.df_hist, ref_date, teamA, teamB, map_name)
+        h2h = self._h2h_shrunken(ref_date, teamA, teamB, map_name)
         
         # SOS features via map-Elo
-        map_elo = self._compute_map_elo(self.df_hist)
-        RA = map_elo.get((teamA, map_name), 1500.0)
-        RB = map_elo.get((teamB, map_name), 1500.0)
+        map_elo = self._map_elo()
+        RA = self._elo_rating(map_elo, teamA, map_name)
+        RB = self._elo_rating(map_elo, teamB, map_name)
         sos_diff = (RA - RB) / 400.0
         
         # Player stats features
-        def recency_agg_metric(team: str, metric: str) -> Optional[float]:
-            rows = self.df_hist[(self.df_hist["date"] < ref_date) & (self.df_hist["map_name"] == map_name) &
-                               ((self.df_hist["teamA"] == team) | (self.df_hist["teamB"] == team))]
-            if rows.empty: 
-                return None
-            num, den = 0.0, 0.0
-            for _, r in rows.iterrows():
-                delta = abs((ref_date - r["date"]).days)
-                w = 0.5 ** (delta / 60.0)  # 60-day half-life
-                val = r[f"teamA_{metric}"] if r["teamA"] == team else r[f"teamB_{metric}"]
-                if pd.notnull(val):
-                    num += w * val
-                    den += w
-            return None if den == 0 else float(num / den)
-        
-        acsA = recency_agg_metric(teamA, "ACS")
-        acsB = recency_agg_metric(teamB, "ACS")
-        kdA = recency_agg_metric(teamA, "KD")
-        kdB = recency_agg_metric(teamB, "KD")
+        acsA = self._recency_agg_metric(ref_date, teamA, map_name, "ACS")
+        acsB = self._recency_agg_metric(ref_date, teamB, map_name, "ACS")
+        kdA = self._recency_agg_metric(ref_date, teamA, map_name, "KD")
+        kdB = self._recency_agg_metric(ref_date, teamB, map_name, "KD")
         
         acs_diff = ((acsA if acsA is not None else 0.0) - (acsB if acsB is not None else 0.0))
         kd_diff = ((kdA if kdA is not None else 0.0) - (kdB if kdB is not None else 0.0))
@@ -224,31 +348,33 @@ class SimplePredictor:
         }
     
     def predict(self, teamA: str, teamB: str, map_name: str) -> Dict:
+        """Make a prediction for a map outcome, reused until the history reloads."""
+        cached = _cached_predict(self, self._df_hist_version, teamA, teamB, map_name)
+        # Copy (nested dicts included) so a caller mutating its result can't change later cache hits
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in cached.items()}
+    
+    def _predict(self, teamA: str, teamB: str, map_name: str) -> Dict:
         """Make a prediction for a map outcome."""
         try:
-            if self.model is None or self.xcols is None:
+            if self.model is None or self.xcols is None or self._coef is None:
                 return self._fallback_prediction(teamA, teamB, map_name)
             
             # Compute features
             feats = self._compute_feature_row_for_match(teamA, teamB, map_name)
-            X = np.array([[feats[c] for c in self.xcols]], dtype=float)
+            x = np.fromiter((feats[c] for c in self.xcols), dtype=np.float64, count=len(self.xcols))
             
-            # Make prediction (raw probabilities, no calibration for now)
-            p_raw = self.model.predict_proba(X)[:, 1]
+            # Factor contributions are the logit's terms; their sum gives the raw probability
+            x_std = (x - self._mean) / self._scale
+            contrib = x_std * self._coef
+            p_raw = 1.0 / (1.0 + np.exp(-(contrib.sum() + self._intercept)))
             
             # Simple calibration: just use raw probabilities for now
-            p_cal = p_raw
-            
-            # Compute factor contributions
-            scaler = self.model.named_steps["scaler"]
-            clf = self.model.named_steps["clf"]
-            x_std = scaler.transform(X)
-            contrib = (x_std * clf.coef_).ravel()
+            p_cal = float(p_raw)
             factor_breakdown = {col: float(contrib[i]) for i, col in enumerate(self.xcols)}
             
             explanation = (
                 f"{teamA} vs {teamB} on {map_name}: "
-                f"{teamA} win prob = {p_cal[0]:.2%}. "
+                f"{teamA} win prob = {p_cal:.2%}. "
                 f"Drivers: "
                 f"winrate_diff({feats['winrate_diff']:+.2f}), "
                 f"h2h({feats['h2h_shrunk']:+.2f}), "
@@ -257,8 +383,8 @@ class SimplePredictor:
             )
             
             return {
-                "prob_teamA": float(p_cal[0]),
-                "prob_teamB": float(1.0 - p_cal[0]),
+                "prob_teamA": p_cal,
+                "prob_teamB": 1.0 - p_cal,
                 "features": feats,
                 "factor_contrib": factor_breakdown,
                 "explanation": explanation
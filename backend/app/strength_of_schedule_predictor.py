@@ -1,200 +1,255 @@
 """Enhanced predictor with strength of schedule adjustments."""
 
+import re
 import numpy as np
-from typing import Dict, Any, Tuple, List, Optional
-from datetime import datetime
+from typing import Dict, Any, Tuple, List, Optional, Sequence
+from datetime import datetime, timezone
+from functools import lru_cache
 from app.logging_utils import get_logger
 from app.upstream import vlr_client
 
 logger = get_logger(__name__)
 
+# numba is optional; when installed the per-team SOS arithmetic is compiled, otherwise it runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Ranks past this share the weakest weight, so the rank weight table has MAX_RANK + 1 entries
+MAX_RANK = 200
+
+# The digits of a rank string such as "5" or "T-5"
+_RANK_RE = re.compile(r'\d+')
+
+# Regional strength adjustments
+REGION_MULTIPLIERS = {
+    'AP': 1.1,  # Asia Pacific is strong
+    'EU': 1.05, # Europe is strong
+    'NA': 1.0,  # North America baseline
+    'KR': 1.15, # Korea is very strong
+    'CN': 1.1,  # China is strong
+    'SA': 0.9,  # South America slightly weaker
+    'JP': 0.95, # Japan slightly weaker
+    'OCE': 0.85, # Oceania weaker
+    'MN': 0.8   # Middle East/North Africa weaker
+}
+
+# Small-int region codes and their multipliers as a table, so packed teams carry an int
+# index instead of a string; the last entry is the 1.0 baseline for unknown regions
+REGION_IDX = {region: i for i, region in enumerate(REGION_MULTIPLIERS)}
+UNKNOWN_REGION_IDX = len(REGION_IDX)
+REGION_MULT_TABLE = np.array(list(REGION_MULTIPLIERS.values()) + [1.0])
+
+# Enhanced weights that consider SOS
+SOS_WEIGHTS = {
+    'acs': 0.25,      # Slightly reduced
+    'kd': 0.2,        # Slightly reduced
+    'rating': 0.2,    # Slightly reduced
+    'win_rate': 0.25, # Increased importance
+    'sos': 0.1        # New SOS factor
+}
+
+# Per-team stats scored by the heuristic, with weights ordered to match; KD,
+# rating and win rate are pre-scaled by 100 to be comparable with ACS
+STAT_KEYS = ('avg_acs', 'avg_kd', 'avg_rating', 'win_rate')
+SCORE_WEIGHTS = np.array([
+    SOS_WEIGHTS['acs'],
+    SOS_WEIGHTS['kd'] * 100,
+    SOS_WEIGHTS['rating'] * 100,
+    SOS_WEIGHTS['win_rate'] * 100
+])
+# The same weights as Python floats for scoring a single matchup, where NumPy's per-call overhead dominates
+ACS_WEIGHT, KD_WEIGHT, RATING_WEIGHT, WIN_RATE_WEIGHT = SCORE_WEIGHTS.tolist()
+SOS_BONUS_WEIGHT = SOS_WEIGHTS['sos'] * 100
+
+# Decimal places each adjusted stat is shown with; computation keeps full precision
+STAT_DIGITS = (1, 2, 2, 3)
+
+def _stat_vector(team_stats: Dict[str, Any]) -> np.ndarray:
+    """Pack a team's scored stats into a vector ordered like STAT_KEYS."""
+    return np.fromiter((team_stats.get(key, 0) for key in STAT_KEYS), dtype=np.float64, count=len(STAT_KEYS))
+
+@njit(cache=True)
+def _sos_adjust_kernel(sos_multiplier, acs, kd, rating, win_rate):
+    """SOS-adjusted (ACS, K/D, rating, win rate) for one team."""
+    # Apply SOS adjustments
+    # Higher SOS multiplier = team played against better opponents
+    # This should boost their stats to reflect the difficulty
+    adjusted_acs = acs * (0.8 + 0.4 * sos_multiplier)  # 0.8x to 1.2x
+    adjusted_kd = kd * (0.9 + 0.2 * sos_multiplier)   # 0.9x to 1.1x
+    adjusted_rating = rating * (0.9 + 0.2 * sos_multiplier)  # 0.9x to 1.1x
+    
+    # Win rate adjustment is more complex
+    # Teams with high SOS but good win rate should be boosted more
+    if win_rate > 0.6 and sos_multiplier > 0.8:
+        adjusted_win_rate = min(1.0, win_rate * (1.0 + 0.1 * sos_multiplier))
+    else:
+        adjusted_win_rate = win_rate
+    return adjusted_acs, adjusted_kd, adjusted_rating, adjusted_win_rate
+
+@lru_cache(maxsize=512)
+def _cached_sos_adjust(sos_multiplier: float, acs: float, kd: float, rating: float, win_rate: float) -> Tuple[float, float, float, float]:
+    """_sos_adjust_kernel memoized on its scalars, so a team repeated across predictions is adjusted once."""
+    return _sos_adjust_kernel(sos_multiplier, acs, kd, rating, win_rate)
+
+# Fields the SOS heuristic scores, listed in every response
+FEATURES_USED = ('avg_acs', 'avg_kd', 'avg_rating', 'win_rate', 'strength_of_schedule', 'rank_difference')
+
+def _sos_summary(rank: int, sos_multiplier: float, adjusted: Sequence[float]) -> Dict[str, Any]:
+    """Response block for one team: its rank, SOS multiplier and adjusted stats in STAT_KEYS order."""
+    return {
+        "original_rank": int(rank),
+        "sos_multiplier": round(float(sos_multiplier), 3),
+        "adjusted_stats": {key: round(value, digits) for key, value, digits in zip(STAT_KEYS, adjusted, STAT_DIGITS)}
+    }
+
+def _sos_response(model_version: str, winner: str, confidence: float, team1_prob: float, team2_prob: float,
+                  timestamp: datetime, team1_summary: Dict[str, Any], team2_summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Prediction response shared by predict and predict_batch, built from flat values."""
+    return {
+        "predicted_winner": winner,
+        "confidence": round(confidence, 3),
+        "team1_win_probability": round(team1_prob, 3),
+        "team2_win_probability": round(team2_prob, 3),
+        "model_version": model_version,
+        "prediction_timestamp": timestamp,
+        "strength_of_schedule": {"team1": team1_summary, "team2": team2_summary},
+        "features_used": list(FEATURES_USED)
+    }
+
 class StrengthOfSchedulePredictor:
     """Predictor that adjusts team stats based on strength of schedule."""
     
     def __init__(self):
         self.model_version = "sos_v1.0"
         self.rank_weights = self._calculate_rank_weights()
+        self._bonus_up, self._bonus_down = self._calculate_rank_bonuses()
         
-    def _calculate_rank_weights(self) -> Dict[int, float]:
-        """Calculate weights for different team ranks."""
+    def _calculate_rank_weights(self) -> np.ndarray:
+        """Calculate weights for different team ranks, indexed by rank (0 and out-of-range ranks weigh 0.1)."""
         # Higher weight for better teams (lower rank numbers)
         # Rank 1 = 1.0, Rank 50 = 0.5, Rank 100+ = 0.3
-        weights = {}
-        for rank in range(1, 201):  # Support up to rank 200
-            if rank <= 10:
-                weight = 1.0 - (rank - 1) * 0.05  # 1.0 to 0.55
-            elif rank <= 50:
-                weight = 0.55 - (rank - 10) * 0.01  # 0.55 to 0.15
-            else:
-                weight = max(0.1, 0.15 - (rank - 50) * 0.001)  # 0.15 to 0.1
-            weights[rank] = round(weight, 3)
-        return weights
+        ranks = np.arange(MAX_RANK + 1)  # Support up to rank 200
+        weights = np.where(
+            ranks <= 10,
+            1.0 - (ranks - 1) * 0.05,  # 1.0 to 0.55
+            np.where(
+                ranks <= 50,
+                0.55 - (ranks - 10) * 0.01,  # 0.55 to 0.15
+                np.maximum(0.1, 0.15 - (ranks - 50) * 0.001)  # 0.15 to 0.1
+            )
+        )
+        weights[0] = 0.1
+        return np.round(weights, 3)
+    
+    def _calculate_rank_bonuses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Better- and worse-ranked team multipliers, indexed by rank difference capped at MAX_RANK."""
+        rank_diffs = np.arange(MAX_RANK + 1)
+        bonus_up = 1.0 + np.minimum(0.3, rank_diffs * 0.01)  # Up to 30% bonus
+        bonus_down = 1.0 - np.minimum(0.2, rank_diffs * 0.005)  # Up to 20% penalty
+        # If teams are close in rank, no bonus
+        bonus_up[:6] = 1.0
+        bonus_down[:6] = 1.0
+        return bonus_up, bonus_down
     
     def _get_team_rank(self, team_stats: Dict[str, Any]) -> int:
-        """Extract team rank from stats."""
-        try:
-            # Try to get rank from summary_stats
-            summary_stats = team_stats.get('raw_data', {}).get('summary_stats', {})
-            rank_str = summary_stats.get('rank', '999')
-            
-            # Handle string ranks like "1", "T-5", etc.
-            if isinstance(rank_str, str):
-                if 'T-' in rank_str:
-                    rank_str = rank_str.split('T-')[1]
-                rank = int(rank_str) if rank_str.isdigit() else 999
-            else:
-                rank = int(rank_str) if rank_str else 999
-                
-            return min(rank, 200)  # Cap at 200
-        except (ValueError, TypeError):
-            return 999  # Default to worst rank
+        """Extract team rank from stats, capped at MAX_RANK (also the rank of unranked teams)."""
+        rank = team_stats.get('rank') or MAX_RANK
+        
+        # Handle string ranks like "1", "T-5", etc.
+        if isinstance(rank, str):
+            match = _RANK_RE.search(rank)
+            rank = int(match.group()) if match else MAX_RANK
+        
+        return min(int(rank), MAX_RANK)
     
-    def _calculate_strength_of_schedule(self, team_stats: Dict[str, Any]) -> float:
-        """Calculate strength of schedule multiplier for a team."""
-        try:
-            rank = self._get_team_rank(team_stats)
-            base_weight = self.rank_weights.get(rank, 0.1)
-            
-            # Additional factors that could affect SOS
-            region = team_stats.get('raw_data', {}).get('summary_stats', {}).get('region', 'UNKNOWN')
-            
-            # Regional strength adjustments
-            region_multipliers = {
-                'AP': 1.1,  # Asia Pacific is strong
-                'EU': 1.05, # Europe is strong
-                'NA': 1.0,  # North America baseline
-                'KR': 1.15, # Korea is very strong
-                'CN': 1.1,  # China is strong
-                'SA': 0.9,  # South America slightly weaker
-                'JP': 0.95, # Japan slightly weaker
-                'OCE': 0.85, # Oceania weaker
-                'MN': 0.8   # Middle East/North Africa weaker
-            }
-            
-            region_mult = region_multipliers.get(region, 1.0)
-            
-            # Calculate final SOS multiplier
-            sos_multiplier = base_weight * region_mult
-            
-            logger.debug(f"Team rank {rank}, region {region}, SOS multiplier: {sos_multiplier}")
-            return round(sos_multiplier, 3)
-            
-        except Exception as e:
-            logger.error(f"Error calculating SOS: {e}")
-            return 0.5  # Default moderate multiplier
+    def _calculate_strength_of_schedule(self, team_stats: Dict[str, Any], rank: int) -> float:
+        """Calculate strength of schedule multiplier for a team of the given rank."""
+        base_weight = float(self.rank_weights[min(max(rank, 0), MAX_RANK)])
+        
+        # Additional factors that could affect SOS
+        region = team_stats.get('region') or 'UNKNOWN'
+        
+        region_mult = float(REGION_MULT_TABLE[REGION_IDX.get(region, UNKNOWN_REGION_IDX)])
+        
+        # Calculate final SOS multiplier
+        sos_multiplier = base_weight * region_mult
+        
+        logger.debug("Team rank %s, region %s, SOS multiplier: %s", rank, region, sos_multiplier)
+        return sos_multiplier
     
-    def _adjust_team_stats(self, team_stats: Dict[str, Any]) -> Dict[str, Any]:
+    def _adjust_team_stats(self, team_stats: Dict[str, Any], rank: int) -> Dict[str, Any]:
         """Adjust team stats based on strength of schedule."""
-        try:
-            sos_multiplier = self._calculate_strength_of_schedule(team_stats)
-            
-            # Get base stats
-            base_acs = team_stats.get('avg_acs', 0)
-            base_kd = team_stats.get('avg_kd', 0)
-            base_rating = team_stats.get('avg_rating', 0)
-            base_win_rate = team_stats.get('win_rate', 0)
-            
-            # Apply SOS adjustments
-            # Higher SOS multiplier = team played against better opponents
-            # This should boost their stats to reflect the difficulty
-            adjusted_acs = base_acs * (0.8 + 0.4 * sos_multiplier)  # 0.8x to 1.2x
-            adjusted_kd = base_kd * (0.9 + 0.2 * sos_multiplier)   # 0.9x to 1.1x
-            adjusted_rating = base_rating * (0.9 + 0.2 * sos_multiplier)  # 0.9x to 1.1x
-            
-            # Win rate adjustment is more complex
-            # Teams with high SOS but good win rate should be boosted more
-            if base_win_rate > 0.6 and sos_multiplier > 0.8:
-                adjusted_win_rate = min(1.0, base_win_rate * (1.0 + 0.1 * sos_multiplier))
-            else:
-                adjusted_win_rate = base_win_rate
-            
-            # Create adjusted stats
-            adjusted_stats = team_stats.copy()
-            adjusted_stats.update({
-                'avg_acs': round(adjusted_acs, 1),
-                'avg_kd': round(adjusted_kd, 2),
-                'avg_rating': round(adjusted_rating, 2),
-                'win_rate': round(adjusted_win_rate, 3),
-                'sos_multiplier': sos_multiplier,
-                'original_rank': self._get_team_rank(team_stats),
-                'adjusted': True
-            })
-            
-            logger.info(f"Adjusted stats for {team_stats.get('team_name', 'Unknown')}: "
-                       f"ACS {base_acs}→{adjusted_acs}, K/D {base_kd}→{adjusted_kd}, "
-                       f"Rating {base_rating}→{adjusted_rating}, Win Rate {base_win_rate}→{adjusted_win_rate}")
-            
-            return adjusted_stats
-            
-        except Exception as e:
-            logger.error(f"Error adjusting team stats: {e}")
-            return team_stats
+        sos_multiplier = self._calculate_strength_of_schedule(team_stats, rank)
+        
+        # Get base stats
+        base_acs = team_stats.get('avg_acs', 0)
+        base_kd = team_stats.get('avg_kd', 0)
+        base_rating = team_stats.get('avg_rating', 0)
+        base_win_rate = team_stats.get('win_rate', 0)
+        
+        adjusted_acs, adjusted_kd, adjusted_rating, adjusted_win_rate = _cached_sos_adjust(
+            float(sos_multiplier), float(base_acs), float(base_kd), float(base_rating), float(base_win_rate)
+        )
+        
+        # Create adjusted stats with just the fields the heuristic and response read,
+        # rather than copying the whole stats dict (raw_data included in debug mode)
+        adjusted_stats = {
+            'team_id': team_stats.get('team_id'),
+            'team_name': team_stats.get('team_name'),
+            'avg_acs': adjusted_acs,
+            'avg_kd': adjusted_kd,
+            'avg_rating': adjusted_rating,
+            'win_rate': adjusted_win_rate,
+            'sos_multiplier': sos_multiplier,
+            'original_rank': rank,
+            'adjusted': True
+        }
+        
+        logger.info("Adjusted stats for %s: ACS %s→%s, K/D %s→%s, Rating %s→%s, Win Rate %s→%s",
+                    team_stats.get('team_name', 'Unknown'), base_acs, adjusted_acs, base_kd, adjusted_kd,
+                    base_rating, adjusted_rating, base_win_rate, adjusted_win_rate)
+        
+        return adjusted_stats
     
-    def _calculate_rank_difference_bonus(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Tuple[float, float]:
+    def _calculate_rank_difference_bonus(self, rank1: int, rank2: int) -> Tuple[float, float]:
         """Calculate bonus for teams based on rank difference."""
-        try:
-            rank1 = self._get_team_rank(team1_stats)
-            rank2 = self._get_team_rank(team2_stats)
-            
-            # If teams are close in rank, no bonus
-            rank_diff = abs(rank1 - rank2)
-            if rank_diff <= 5:
-                return 1.0, 1.0
-            
-            # If one team is significantly higher ranked, give them a bonus
-            if rank1 < rank2:  # Team 1 is better ranked
-                bonus1 = 1.0 + min(0.3, rank_diff * 0.01)  # Up to 30% bonus
-                bonus2 = 1.0 - min(0.2, rank_diff * 0.005)  # Up to 20% penalty
-            else:  # Team 2 is better ranked
-                bonus1 = 1.0 - min(0.2, rank_diff * 0.005)  # Up to 20% penalty
-                bonus2 = 1.0 + min(0.3, rank_diff * 0.01)   # Up to 30% bonus
-            
-            return round(bonus1, 3), round(bonus2, 3)
-            
-        except Exception as e:
-            logger.error(f"Error calculating rank bonus: {e}")
-            return 1.0, 1.0
+        # Bonuses saturate well before MAX_RANK, so capping the difference is exact
+        rank_diff = min(abs(rank1 - rank2), MAX_RANK)
+        bonus_up = float(self._bonus_up[rank_diff])
+        bonus_down = float(self._bonus_down[rank_diff])
+        
+        # The better ranked team gets the bonus
+        if rank1 < rank2:
+            return bonus_up, bonus_down
+        return bonus_down, bonus_up
     
-    def _sos_heuristic(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Tuple[str, float]:
-        """Enhanced heuristic with strength of schedule adjustments."""
+    def _sos_heuristic(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Tuple[str, float, float, float, Dict[str, Any], Dict[str, Any]]:
+        """Enhanced heuristic with strength of schedule adjustments; also returns both win probabilities and adjusted stats."""
+        # Parse each team's rank once; the SOS, adjustment and rank bonus all use it
+        rank1 = self._get_team_rank(team1_stats)
+        rank2 = self._get_team_rank(team2_stats)
+        
         # Adjust both teams' stats based on SOS
-        adj_team1 = self._adjust_team_stats(team1_stats)
-        adj_team2 = self._adjust_team_stats(team2_stats)
+        adj_team1 = self._adjust_team_stats(team1_stats, rank1)
+        adj_team2 = self._adjust_team_stats(team2_stats, rank2)
         
         # Calculate rank difference bonus
-        rank_bonus1, rank_bonus2 = self._calculate_rank_difference_bonus(team1_stats, team2_stats)
+        rank_bonus1, rank_bonus2 = self._calculate_rank_difference_bonus(rank1, rank2)
         
-        # Enhanced weights that consider SOS
-        weights = {
-            'acs': 0.25,      # Slightly reduced
-            'kd': 0.2,        # Slightly reduced
-            'rating': 0.2,    # Slightly reduced
-            'win_rate': 0.25, # Increased importance
-            'sos': 0.1        # New SOS factor
-        }
-        
-        # Calculate base scores
-        team1_base_score = (
-            adj_team1.get('avg_acs', 0) * weights['acs'] +
-            adj_team1.get('avg_kd', 0) * weights['kd'] * 100 +
-            adj_team1.get('avg_rating', 0) * weights['rating'] * 100 +
-            adj_team1.get('win_rate', 0) * weights['win_rate'] * 100
-        )
-        
-        team2_base_score = (
-            adj_team2.get('avg_acs', 0) * weights['acs'] +
-            adj_team2.get('avg_kd', 0) * weights['kd'] * 100 +
-            adj_team2.get('avg_rating', 0) * weights['rating'] * 100 +
-            adj_team2.get('win_rate', 0) * weights['win_rate'] * 100
-        )
+        # Read each team's adjusted stats once, then score with one expression per team
+        acs1, kd1, rating1, win_rate1, sos1 = (adj_team1['avg_acs'], adj_team1['avg_kd'], adj_team1['avg_rating'],
+                                               adj_team1['win_rate'], adj_team1['sos_multiplier'])
+        acs2, kd2, rating2, win_rate2, sos2 = (adj_team2['avg_acs'], adj_team2['avg_kd'], adj_team2['avg_rating'],
+                                               adj_team2['win_rate'], adj_team2['sos_multiplier'])
         
-        # Add SOS bonus
-        sos_bonus1 = adj_team1.get('sos_multiplier', 1.0) * weights['sos'] * 100
-        sos_bonus2 = adj_team2.get('sos_multiplier', 1.0) * weights['sos'] * 100
-        
-        # Apply rank difference bonus
-        team1_score = (team1_base_score + sos_bonus1) * rank_bonus1
-        team2_score = (team2_base_score + sos_bonus2) * rank_bonus2
+        # Base score plus SOS bonus, scaled by the rank difference bonus
+        team1_score = (acs1 * ACS_WEIGHT + kd1 * KD_WEIGHT + rating1 * RATING_WEIGHT + win_rate1 * WIN_RATE_WEIGHT
+                       + sos1 * SOS_BONUS_WEIGHT) * rank_bonus1
+        team2_score = (acs2 * ACS_WEIGHT + kd2 * KD_WEIGHT + rating2 * RATING_WEIGHT + win_rate2 * WIN_RATE_WEIGHT
+                       + sos2 * SOS_BONUS_WEIGHT) * rank_bonus2
         
         # Calculate probabilities
         total_score = team1_score + team2_score
@@ -213,62 +268,91 @@ class StrengthOfSchedulePredictor:
             winner = "team2"
             confidence = team2_prob
         
-        return winner, confidence
+        return winner, confidence, team1_prob, team2_prob, adj_team1, adj_team2
     
     def predict(self, team1_stats: Dict[str, Any], team2_stats: Dict[str, Any]) -> Dict[str, Any]:
         """Make prediction with strength of schedule adjustments."""
         try:
             # Use SOS-enhanced heuristic
-            winner, confidence = self._sos_heuristic(team1_stats, team2_stats)
-            
-            # Calculate probabilities
-            team1_prob = confidence if winner == "team1" else 1 - confidence
-            team2_prob = 1 - team1_prob
-            
-            # Get adjusted stats for display
-            adj_team1 = self._adjust_team_stats(team1_stats)
-            adj_team2 = self._adjust_team_stats(team2_stats)
+            winner, confidence, team1_prob, team2_prob, adj_team1, adj_team2 = self._sos_heuristic(team1_stats, team2_stats)
             
-            return {
-                "predicted_winner": winner,
-                "confidence": round(confidence, 3),
-                "team1_win_probability": round(team1_prob, 3),
-                "team2_win_probability": round(team2_prob, 3),
-                "model_version": self.model_version,
-                "prediction_timestamp": datetime.utcnow(),
-                "strength_of_schedule": {
-                    "team1": {
-                        "original_rank": adj_team1.get('original_rank', 999),
-                        "sos_multiplier": adj_team1.get('sos_multiplier', 1.0),
-                        "adjusted_stats": {
-                            "avg_acs": adj_team1.get('avg_acs', 0),
-                            "avg_kd": adj_team1.get('avg_kd', 0),
-                            "avg_rating": adj_team1.get('avg_rating', 0),
-                            "win_rate": adj_team1.get('win_rate', 0)
-                        }
-                    },
-                    "team2": {
-                        "original_rank": adj_team2.get('original_rank', 999),
-                        "sos_multiplier": adj_team2.get('sos_multiplier', 1.0),
-                        "adjusted_stats": {
-                            "avg_acs": adj_team2.get('avg_acs', 0),
-                            "avg_kd": adj_team2.get('avg_kd', 0),
-                            "avg_rating": adj_team2.get('avg_rating', 0),
-                            "win_rate": adj_team2.get('win_rate', 0)
-                        }
-                    }
-                },
-                "features_used": [
-                    'avg_acs', 'avg_kd', 'avg_rating', 'win_rate', 
-                    'strength_of_schedule', 'rank_difference'
-                ]
-            }
+            return _sos_response(
+                self.model_version, winner, confidence, team1_prob, team2_prob, datetime.now(timezone.utc),
+                _sos_summary(adj_team1['original_rank'], adj_team1['sos_multiplier'], [adj_team1[key] for key in STAT_KEYS]),
+                _sos_summary(adj_team2['original_rank'], adj_team2['sos_multiplier'], [adj_team2[key] for key in STAT_KEYS])
+            )
             
         except Exception as e:
-            logger.error(f"Error making SOS prediction: {e}")
+            logger.error("Error making SOS prediction: %s", e)
             # Fallback to simple prediction
             from app.predictor import baseline_predictor
             return baseline_predictor.predict(team1_stats, team2_stats)
+    
+    def _pack_teams(self, stats_list: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Struct-of-arrays view of many teams: ranks, region codes and (N, 4) stats in STAT_KEYS order."""
+        return {
+            'rank': np.array([self._get_team_rank(team_stats) for team_stats in stats_list]),
+            'region_idx': np.array([REGION_IDX.get(team_stats.get('region'), UNKNOWN_REGION_IDX) for team_stats in stats_list]),
+            'stats': np.stack([_stat_vector(team_stats) for team_stats in stats_list])
+        }
+    
+    def _adjust_packed(self, teams: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _adjust_team_stats: SOS multipliers and adjusted (N, 4) stats."""
+        sos = self.rank_weights[np.clip(teams['rank'], 0, MAX_RANK)] * REGION_MULT_TABLE[teams['region_idx']]
+        acs, kd, rating, win_rate = teams['stats'].T
+        boosted_win_rate = np.where((win_rate > 0.6) & (sos > 0.8), np.minimum(1.0, win_rate * (1.0 + 0.1 * sos)), win_rate)
+        adjusted = np.column_stack((
+            acs * (0.8 + 0.4 * sos),
+            kd * (0.9 + 0.2 * sos),
+            rating * (0.9 + 0.2 * sos),
+            boosted_win_rate
+        ))
+        return sos, adjusted
+    
+    def predict_batch(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Predict many matchups at once with the vectorized SOS heuristic."""
+        if not pairs:
+            return []
+        try:
+            team1 = self._pack_teams([team1_stats for team1_stats, _ in pairs])
+            team2 = self._pack_teams([team2_stats for _, team2_stats in pairs])
+            sos1, adj1 = self._adjust_packed(team1)
+            sos2, adj2 = self._adjust_packed(team2)
+            
+            # Rank difference bonus, as _calculate_rank_difference_bonus
+            rank_diff = np.minimum(np.abs(team1['rank'] - team2['rank']), MAX_RANK)
+            bonus_up = self._bonus_up[rank_diff]
+            bonus_down = self._bonus_down[rank_diff]
+            team1_better = team1['rank'] < team2['rank']
+            rank_bonus1 = np.where(team1_better, bonus_up, bonus_down)
+            rank_bonus2 = np.where(team1_better, bonus_down, bonus_up)
+            
+            team1_scores = (adj1 @ SCORE_WEIGHTS + sos1 * SOS_BONUS_WEIGHT) * rank_bonus1
+            team2_scores = (adj2 @ SCORE_WEIGHTS + sos2 * SOS_BONUS_WEIGHT) * rank_bonus2
+            total_scores = team1_scores + team2_scores
+            
+            # Same rule as _sos_heuristic: even odds when both scores are zero
+            safe_totals = np.where(total_scores == 0, 1.0, total_scores)
+            team1_probs = np.where(total_scores == 0, 0.5, team1_scores / safe_totals)
+            team2_probs = np.where(total_scores == 0, 0.5, team2_scores / safe_totals)
+        except Exception as e:
+            logger.error("Error making SOS batch prediction: %s", e)
+            from app.predictor import baseline_predictor
+            return baseline_predictor.predict_batch(pairs)
+        
+        timestamp = datetime.now(timezone.utc)
+        predictions = []
+        for i, (team1_prob, team2_prob) in enumerate(zip(team1_probs.tolist(), team2_probs.tolist())):
+            if team1_prob > team2_prob:
+                winner, confidence = "team1", team1_prob
+            else:
+                winner, confidence = "team2", team2_prob
+            predictions.append(_sos_response(
+                self.model_version, winner, confidence, team1_prob, team2_prob, timestamp,
+                _sos_summary(team1['rank'][i], sos1[i], adj1[i].tolist()),
+                _sos_summary(team2['rank'][i], sos2[i], adj2[i].tolist())
+            ))
+        return predictions
 
 # Global SOS predictor instance
 sos_predictor = StrengthOfSchedulePredictor()
@@ -7,21 +7,53 @@ If A vs B gives A=70%, then B vs A should give B=70%.
 """
 
 import numpy as np
-from typing import Dict
-from app.realistic_predictor import RealisticPredictor
+from typing import Dict, Optional
+from datetime import datetime
+from functools import lru_cache
+from cachetools import LRUCache
+from app.realistic_predictor import get_realistic_predictor, today
+
+# Base predictions kept for swapped-order and repeated queries
+BASE_CACHE_SIZE = 4096
 
 class SymmetricRealisticPredictor:
     """Symmetric wrapper for realistic predictor."""
     
-    def __init__(self):
-        self.base_predictor = RealisticPredictor()
+    def __init__(self, assume_symmetric: bool = False):
+        self.base_predictor = get_realistic_predictor()
+        # Set when the base predictor is known to be symmetric, so B vs A adds nothing
+        self._assume_symmetric = assume_symmetric
+        self._base_cache: LRUCache = LRUCache(maxsize=BASE_CACHE_SIZE)
+        self._cached_model = self.base_predictor.model
+    
+    def _base_predict(self, teamA: str, teamB: str, map_name: str, match_date: datetime) -> Dict:
+        """Base prediction, reused until the base model changes."""
+        if self.base_predictor.model is not self._cached_model:
+            self._base_cache.clear()
+            self._cached_model = self.base_predictor.model
+        key = (teamA, teamB, map_name, match_date)
+        try:
+            return self._base_cache[key]
+        except KeyError:
+            prediction = self._base_cache[key] = self.base_predictor.predict(teamA, teamB, map_name, match_date)
+            return prediction
     
-    def predict(self, teamA: str, teamB: str, map_name: str) -> Dict:
+    def predict(self, teamA: str, teamB: str, map_name: str, match_date: Optional[datetime] = None) -> Dict:
         """Make a symmetric prediction."""
         
-        # Make both predictions
-        pred_AB = self.base_predictor.predict(teamA, teamB, map_name)
-        pred_BA = self.base_predictor.predict(teamB, teamA, map_name)
+        # Make both predictions against the same clock
+        if match_date is None:
+            match_date = today()
+        pred_AB = self._base_predict(teamA, teamB, map_name, match_date)
+        if self._assume_symmetric:
+            return {
+                **pred_AB,
+                "features": dict(pred_AB.get("features", {})),
+                "model_version": "symmetric_realistic_v1.0",
+                "asymmetry_detected": False,
+                "original_diff": 0.0
+            }
+        pred_BA = self._base_predict(teamB, teamA, map_name, match_date)
         
         # Extract probabilities
         prob_A_in_AB = pred_AB["prob_teamA"]
@@ -54,15 +86,12 @@ class SymmetricRealisticPredictor:
         features_AB = pred_AB["features"]
         features_BA = pred_BA["features"]
         
-        symmetric_features = {}
-        for key in features_AB.keys():
-            # For BA prediction, features are inverted, so we need to handle this
-            if key in features_BA:
-                # Average the absolute values and maintain direction
-                avg_feature = (features_AB[key] - features_BA[key]) / 2.0
-                symmetric_features[key] = float(avg_feature)
-            else:
-                symmetric_features[key] = features_AB[key]
+        # For BA prediction, features are inverted, so average AB with the negated BA;
+        # a feature missing from BA is paired with its own negation and kept as is
+        keys = list(features_AB)
+        values_AB = np.fromiter((features_AB[key] for key in keys), dtype=np.float64, count=len(keys))
+        values_BA = np.fromiter((features_BA.get(key, -features_AB[key]) for key in keys), dtype=np.float64, count=len(keys))
+        symmetric_features = dict(zip(keys, ((values_AB - values_BA) * 0.5).tolist()))
         
         return {
             "prob_teamA": float(symmetric_prob_A),
@@ -77,5 +106,7 @@ class SymmetricRealisticPredictor:
             "original_diff": float(abs(prob_A_in_AB - prob_A_in_BA))
         }
 
-# Global symmetric instance
-symmetric_realistic_predictor = SymmetricRealisticPredictor()
+@lru_cache(maxsize=1)
+def get_symmetric_predictor() -> SymmetricRealisticPredictor:
+    """Shared symmetric predictor, loaded on first use instead of at import."""
+    return SymmetricRealisticPredictor()
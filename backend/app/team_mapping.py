@@ -2,10 +2,22 @@
 
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from app.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Spaces and hyphens become underscores; apostrophes and dots are dropped
+_TEAM_ID_TABLE = str.maketrans({" ": "_", "-": "_", "'": None, ".": None})
+
+# Name fragments that mark joke/test teams in the rankings
+_MEME_INDICATORS = ('we have', 'at home', 'meme', 'joke', 'fake', 'test', 'demo')
+
+@lru_cache(maxsize=4096)
+def team_id_for(name: str) -> str:
+    """Team ID slug for a VLR.gg team name, e.g. "KRÜ Esports" -> "krü_esports"."""
+    return name.lower().translate(_TEAM_ID_TABLE)
+
 @dataclass
 class TeamInfo:
     """Professional team information."""
@@ -23,7 +35,10 @@ class TeamMapper:
     
     def __init__(self):
         self.professional_teams = self._build_professional_team_database()
+        self.professional_ids = frozenset(self.professional_teams)
         self.name_aliases = self._build_name_aliases()
+        self._build_indexes()
+        self._precomputed_stats = self._build_precomputed_stats()
         
     def _build_professional_team_database(self) -> Dict[str, TeamInfo]:
         """Build database of professional teams with their correct information."""
@@ -126,6 +141,19 @@ class TeamMapper:
             "xyz": TeamInfo("xyz", "xyz", "OCE", 10, True, "$158", "12–8", 1),
         }
     
+    def _build_indexes(self):
+        """Lowercase name/ID lookups for find_team, so queries don't lowercase every team name."""
+        self._name_lower_to_id: Dict[str, str] = {}
+        self._id_lower_to_id: Dict[str, str] = {}
+        # (lowercase name, lowercase ID, ID) in database order, for the partial-match fallback
+        self._partial_match_keys: List[Tuple[str, str, str]] = []
+        for team_id, team_info in self.professional_teams.items():
+            name_lower = team_info.name.lower()
+            id_lower = team_id.lower()
+            self._name_lower_to_id.setdefault(name_lower, team_id)
+            self._id_lower_to_id.setdefault(id_lower, team_id)
+            self._partial_match_keys.append((name_lower, id_lower, team_id))
+    
     def _build_name_aliases(self) -> Dict[str, str]:
         """Build aliases for common team name variations."""
         return {
@@ -193,23 +221,51 @@ class TeamMapper:
             "bilibili": "bilibili_gaming",
         }
     
+    def _build_precomputed_stats(self) -> Dict[str, Dict]:
+        """Derive rank-based prediction stats for every professional team once."""
+        return {
+            team_id: {
+                "team_id": team_id,
+                "team_name": team.name,
+                "avg_acs": 200.0 + (team.rank * -2),  # Better rank = higher ACS
+                "avg_kd": 1.0 + (team.rank * -0.01),  # Better rank = higher K/D
+                "avg_rating": 1.0 + (team.rank * -0.005),  # Better rank = higher rating
+                "win_rate": 0.5 + (team.rank * -0.002),  # Better rank = higher win rate
+                "maps_played": 30,
+                "rank": team.rank,
+                "region": team.region
+            }
+            for team_id, team in self.professional_teams.items()
+        }
+    
+    def get_precomputed_stats(self, team_id: str) -> Optional[Dict]:
+        """Get a copy of the precomputed stats for a professional team ID."""
+        stats = self._precomputed_stats.get(team_id)
+        return stats.copy() if stats is not None else None
+    
     def find_team(self, search_term: str) -> Optional[TeamInfo]:
         """Find a professional team by name or alias."""
         search_term = search_term.lower().strip()
         
         # First try exact match
-        if search_term in self.professional_teams:
-            return self.professional_teams[search_term]
+        team_id = self._id_lower_to_id.get(search_term)
+        if team_id is not None:
+            return self.professional_teams[team_id]
         
         # Try aliases
         if search_term in self.name_aliases:
             team_id = self.name_aliases[search_term]
             return self.professional_teams.get(team_id)
         
+        # Try exact team names
+        team_id = self._name_lower_to_id.get(search_term)
+        if team_id is not None:
+            return self.professional_teams[team_id]
+        
         # Try partial matches
-        for team_id, team_info in self.professional_teams.items():
-            if search_term in team_info.name.lower() or search_term in team_id.lower():
-                return team_info
+        for name_lower, id_lower, team_id in self._partial_match_keys:
+            if search_term in name_lower or search_term in id_lower:
+                return self.professional_teams[team_id]
         
         return None
     
@@ -227,7 +283,7 @@ class TeamMapper:
     
     def is_professional_team(self, team_id: str) -> bool:
         """Check if a team ID belongs to a professional team."""
-        return team_id in self.professional_teams
+        return team_id in self.professional_ids
     
     def get_team_by_id(self, team_id: str) -> Optional[TeamInfo]:
         """Get team information by team ID."""
@@ -236,20 +292,20 @@ class TeamMapper:
     def filter_professional_teams(self, teams_data: List[Dict]) -> List[Dict]:
         """Filter API response to only include professional teams."""
         professional_teams = []
+        professional_ids = self.professional_ids
         
         for team_data in teams_data:
             team_id = team_data.get('team_id', '')
             team_name = team_data.get('team', '')
             
             # Check if this is a professional team
-            if self.is_professional_team(team_id):
+            if team_id in professional_ids:
                 professional_teams.append(team_data)
                 logger.debug(f"Included professional team: {team_name} ({team_id})")
             else:
                 # Check for meme teams to exclude
-                if any(meme_indicator in team_name.lower() for meme_indicator in [
-                    'we have', 'at home', 'meme', 'joke', 'fake', 'test', 'demo'
-                ]):
+                lowered = team_name.lower()
+                if any(meme_indicator in lowered for meme_indicator in _MEME_INDICATORS):
                     logger.debug(f"Excluded meme team: {team_name} ({team_id})")
                     continue
                 
@@ -2,20 +2,128 @@
 
 import httpx
 import asyncio
-from typing import Dict, Any, Optional, List
+import orjson
+import functools
+import inspect
+import random
+from typing import Dict, Any, Optional, List, Tuple
+from cachetools import TTLCache
 from app.config import settings
 from app.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Responses of read-only VLR.gg endpoints, keyed by method name and bound arguments. Stored
+# orjson-encoded, so every caller decodes its own copy and can't mutate another's result
+_response_cache: TTLCache = TTLCache(maxsize=128, ttl=settings.cache_ttl)
+# Per-key [lock, number of coroutines holding or waiting on it]; dropped once nobody is
+_response_locks: Dict[Tuple, List[Any]] = {}
+
+def async_ttl_cache(func):
+    """Cache the awaited result of a client coroutine method for settings.cache_ttl.
+    
+    The wrapper's invalidate(*args, **kwargs) drops the entry for those arguments, so the
+    next call fetches afresh (and concurrent callers still share that one fetch).
+    """
+    signature = inspect.signature(func)
+    
+    def cache_key(self, *args, **kwargs) -> Tuple:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        return (func.__name__,) + tuple(sorted(
+            (name, value) for name, value in bound.arguments.items() if name != "self"
+        ))
+    
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        key = cache_key(self, *args, **kwargs)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+        
+        entry = _response_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                # Another caller may have filled the entry while we waited
+                cached = _response_cache.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+                result = await func(self, *args, **kwargs)
+                _response_cache[key] = orjson.dumps(result)
+                return result
+        finally:
+            # Waiters still queued on this lock must keep sharing it, or a new caller would fetch alongside them
+            entry[1] -= 1
+            if entry[1] == 0:
+                _response_locks.pop(key, None)
+    
+    def invalidate(*args, **kwargs):
+        """Drop the cached result for these arguments (self excluded, as in the key)."""
+        _response_cache.pop(cache_key(None, *args, **kwargs), None)
+    
+    wrapper.invalidate = invalidate
+    return wrapper
+
 class VLRClient:
     """Client for VLR.gg API with retry logic and caching."""
     
+    # Map match status to VLR.gg API query parameter
+    _QUERY_MAP = {
+        "upcoming": "upcoming",
+        "live": "live_score",
+        "completed": "results"
+    }
+    
+    # Client errors worth retrying; every other 4xx is terminal
+    _RETRYABLE_4XX = (408, 425, 429)
+    
     def __init__(self):
         self.base_url = settings.vlr_base_url
         self.timeout = settings.vlr_timeout
         self.retry_attempts = settings.vlr_retry_attempts
         self.retry_delay = settings.vlr_retry_delay
+        self._client: Optional[httpx.AsyncClient] = None
+        # Caps in-flight requests on the shared client, e.g. when every ranking region misses at once
+        self._request_slots = asyncio.Semaphore(settings.vlr_max_concurrent_requests)
+        # Team name search index for the rankings it was built from
+        self._search_rankings: Optional[List[Dict[str, Any]]] = None
+        self._search_index: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "VLRClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        
+    def _backoff_delay(self, attempt: int) -> float:
+        """Capped exponential backoff with random jitter to spread out retries."""
+        delay = min(self.retry_delay * (2 ** attempt), settings.vlr_max_backoff)
+        return delay * (1 + random.uniform(0, settings.vlr_jitter))
+    
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Delay requested by the upstream's Retry-After header, if given in seconds."""
+        try:
+            return min(float(response.headers["Retry-After"]), settings.vlr_max_backoff)
+        except (KeyError, ValueError):
+            return None
         
     async def _make_request(
         self, 
@@ -24,33 +132,40 @@ class VLRClient:
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make HTTP request with retry logic."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        path = endpoint.lstrip('/')
         
         for attempt in range(self.retry_attempts):
+            retry_after = None
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(method, url, params=params)
-                    response.raise_for_status()
-                    return response.json()
+                async with self._request_slots:
+                    response = await self._get_client().request(method, path, params=params)
+                logger.debug("%s %s served over %s", method, response.url, response.http_version)
+                response.raise_for_status()
+                return orjson.loads(response.content)
                     
             except httpx.HTTPStatusError as e:
-                logger.warning(f"HTTP error on attempt {attempt + 1}: {e}")
+                status_code = e.response.status_code
+                if status_code < 500 and status_code not in self._RETRYABLE_4XX:
+                    raise
+                logger.warning("HTTP error on attempt %s: %s", attempt + 1, e)
                 if attempt == self.retry_attempts - 1:
                     raise
+                retry_after = self._retry_after(e.response)
                     
             except httpx.RequestError as e:
-                logger.warning(f"Request error on attempt {attempt + 1}: {e}")
+                logger.warning("Request error on attempt %s: %s", attempt + 1, e)
                 if attempt == self.retry_attempts - 1:
                     raise
                     
             except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
+                logger.error("Unexpected error on attempt %s: %s", attempt + 1, e)
                 if attempt == self.retry_attempts - 1:
                     raise
             
             # Wait before retry
             if attempt < self.retry_attempts - 1:
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                await asyncio.sleep(delay)
         
         raise Exception("All retry attempts failed")
     
@@ -60,31 +175,27 @@ class VLRClient:
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get matches from VLR.gg API."""
-        # Map status to VLR.gg API query parameter
-        query_map = {
-            "upcoming": "upcoming",
-            "live": "live_score", 
-            "completed": "results"
-        }
-        
-        q = query_map.get(status, "upcoming")
+        q = self._QUERY_MAP.get(status, "upcoming")
         params = {"q": q}
             
         data = await self._make_request("GET", "/match", params)
         return data.get("data", {}).get("segments", [])
     
+    @async_ttl_cache
     async def get_rankings(self, region: str = "na") -> List[Dict[str, Any]]:
         """Get team rankings for a region."""
         params = {"region": region}
         data = await self._make_request("GET", "/rankings", params)
         return data.get("data", [])
     
+    @async_ttl_cache
     async def get_player_stats(self, region: str = "na", timespan: str = "30") -> List[Dict[str, Any]]:
         """Get player statistics for a region."""
         params = {"region": region, "timespan": timespan}
         data = await self._make_request("GET", "/stats", params)
         return data.get("data", {}).get("segments", [])
     
+    @async_ttl_cache
     async def get_events(self, event_type: Optional[str] = None, page: int = 1) -> List[Dict[str, Any]]:
         """Get Valorant events."""
         params = {"page": page}
@@ -94,6 +205,7 @@ class VLRClient:
         data = await self._make_request("GET", "/events", params)
         return data.get("data", {}).get("segments", [])
     
+    @async_ttl_cache
     async def get_news(self) -> List[Dict[str, Any]]:
         """Get VLR news."""
         data = await self._make_request("GET", "/news")
@@ -121,14 +233,22 @@ class VLRClient:
         # Search across multiple regions to find the team
         regions = ["na", "eu", "ap", "sa", "jp", "oce", "mn", "kr", "cn"]
         
-        for region in regions:
+        # Fetch every region concurrently, then scan them in priority order
+        results = await asyncio.gather(
+            *[self.get_rankings(region=region) for region in regions],
+            return_exceptions=True
+        )
+        
+        team_id_lower = team_id.lower().replace("_", " ").replace("-", " ")
+        
+        for region, rankings in zip(regions, results):
+            if isinstance(rankings, Exception):
+                logger.warning("Failed to get team stats from %s rankings: %s", region, rankings)
+                continue
             try:
-                rankings = await self.get_rankings(region=region)
                 # Look for the team in rankings with flexible matching
-                for team in rankings:
-                    team_name = team.get("team", "").lower()
-                    team_id_lower = team_id.lower().replace("_", " ").replace("-", " ")
-                    
+                ranked = [(team, team.get("team", "").lower()) for team in rankings]
+                for team, team_name in ranked:
                     # Check for exact match or partial match
                     if (team_name == team_id_lower or 
                         team_id_lower in team_name or 
@@ -170,11 +290,11 @@ class VLRClient:
                             }
                         }
             except Exception as e:
-                logger.warning(f"Failed to get team stats from {region} rankings: {e}")
+                logger.warning("Failed to get team stats from %s rankings: %s", region, e)
                 continue
         
         # Fallback to mock data
-        logger.warning(f"Team {team_id} not found in any region rankings")
+        logger.warning("Team %s not found in any region rankings", team_id)
         return {
             "team": {"name": f"Team {team_id}", "id": team_id},
             "matches": [],
@@ -197,24 +317,42 @@ class VLRClient:
         # Return general matches for now
         return await self.get_matches(status="completed")
     
+    def _build_search_index(self, rankings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Map every substring of each lowercased team name to its search results."""
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for team in rankings:
+            team_name = team.get("team", "")
+            team_name_lower = team_name.lower()
+            result = {
+                "id": team_name_lower.replace(" ", "_"),
+                "name": team_name,
+                "slug": team_name_lower.replace(" ", "-"),
+                "rank": team.get("rank", "Unknown"),
+                "country": team.get("country", "Unknown")
+            }
+            substrings = {
+                team_name_lower[start:end]
+                for start in range(len(team_name_lower))
+                for end in range(start + 1, len(team_name_lower) + 1)
+            }
+            # An empty query matches every team, as a substring test would
+            substrings.add("")
+            for substring in substrings:
+                index.setdefault(substring, []).append(result)
+        return index
+    
     async def search_teams(self, query: str) -> List[Dict[str, Any]]:
         """Search for teams by name using rankings data."""
         try:
             rankings = await self.get_rankings()
-            matching_teams = []
-            for team in rankings:
-                team_name = team.get("team", "")
-                if query.lower() in team_name.lower():
-                    matching_teams.append({
-                        "id": team_name.lower().replace(" ", "_"),
-                        "name": team_name,
-                        "slug": team_name.lower().replace(" ", "-"),
-                        "rank": team.get("rank", "Unknown"),
-                        "country": team.get("country", "Unknown")
-                    })
-            return matching_teams[:10]  # Limit to top 10 matches
+            # The response cache hands out a fresh copy on every hit, so compare contents:
+            # the index is rebuilt only when the rankings themselves refresh
+            if rankings != self._search_rankings:
+                self._search_index = self._build_search_index(rankings)
+                self._search_rankings = rankings
+            return self._search_index.get(query.lower(), [])[:10]  # Limit to top 10 matches
         except Exception as e:
-            logger.error(f"Failed to search teams: {e}")
+            logger.error("Failed to search teams: %s", e)
             # Fallback to mock data
             return [
                 {"id": "team1", "name": f"Team matching {query}", "slug": "team1"},
@@ -57,3 +57,264 @@ def test_summarize_match():
     response = client.post("/matches/summarize", json=summary_request)
     # This might fail due to missing match data, but should return proper error
     assert response.status_code in [200, 404, 500]
+
+def test_team_form_etag():
+    """Test conditional GET on team form returns 304 for a matching ETag."""
+    response = client.get("/predictions/history/form/Test Team")
+    assert response.status_code == 200
+    assert "max-age=60" in response.headers["cache-control"]
+    assert "Accept-Encoding" in response.headers["vary"]
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    
+    response = client.get("/predictions/history/form/Test Team", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+def test_predict_match_cached():
+    """Test repeat predictions on unchanged stats reuse the cached body."""
+    from datetime import datetime
+    from unittest.mock import AsyncMock, patch
+    from app.predictor import baseline_predictor
+    from app.routers.predictions import prediction_cache
+    
+    updated = datetime(2024, 1, 1)
+    def stats(team_id):
+        return {
+            "team_id": team_id, "team_name": team_id.upper(), "avg_acs": 200.0, "avg_kd": 1.1,
+            "avg_rating": 1.0, "win_rate": 0.5, "maps_played": 10, "last_updated": updated
+        }
+    
+    prediction_cache.clear()
+    request = {"team1_id": "cache_a", "team2_id": "cache_b"}
+    with patch("app.routers.predictions.feature_store.get_team_stats", new=AsyncMock(side_effect=stats)), \
+         patch.object(baseline_predictor, "predict", wraps=baseline_predictor.predict) as mock_predict:
+        first = client.post("/predictions/predict", json=request)
+        second = client.post("/predictions/predict", json=request)
+    
+    assert first.status_code == 200
+    assert second.content == first.content
+    assert mock_predict.call_count == 1
+
+def test_trained_fallback_not_cached_past_model_load():
+    """Test baseline answers given while the model loads aren't reused once it has loaded."""
+    from datetime import datetime
+    from unittest.mock import AsyncMock, patch
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+    from app.predictor import trained_predictor
+    from app.routers.predictions import prediction_cache
+    
+    updated = datetime(2024, 1, 1)
+    def stats(team_id):
+        return {
+            "team_id": team_id, "team_name": team_id.upper(), "avg_acs": 200.0, "avg_kd": 1.1,
+            "avg_rating": 1.0, "win_rate": 0.5, "maps_played": 10, "last_updated": updated
+        }
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 12))
+    model = LogisticRegression().fit(X, (X[:, 8] > 0).astype(int))
+    
+    prediction_cache.clear()
+    request = {"team1_id": "load_a", "team2_id": "load_b"}
+    with patch("app.routers.predictions.feature_store.get_team_stats", new=AsyncMock(side_effect=stats)), \
+         patch.object(trained_predictor, "model", None), patch.object(trained_predictor, "scaler", None):
+        loading = client.post("/predictions/predict/trained", json=request).json()
+        trained_predictor.model = model
+        loaded = client.post("/predictions/predict/trained", json=request).json()
+    
+    assert loading["model_version"] == "baseline_v1.0"
+    assert loaded["model_version"] == trained_predictor.model_version
+
+def test_large_responses_gzipped():
+    """Test responses above the size threshold are gzip-encoded."""
+    response = client.get("/dashboard/metrics/teams", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+
+def test_series_predict_scores_each_map_once():
+    """Test BO3 enumeration scores all candidate maps in one batch and ranks trios."""
+    from unittest.mock import patch
+    from app.routers.advanced_predictions import _cached_advanced_predict_many
+    
+    probs = {"Ascent": 0.9, "Bind": 0.8, "Haven": 0.3, "Lotus": 0.6}
+    _cached_advanced_predict_many.cache_clear()
+    with patch("app.routers.advanced_predictions.advanced_predictor.predict_many",
+               side_effect=lambda a, b, maps: [{"prob_teamA": probs[m]} for m in maps]) as mock_predict:
+        response = client.get("/advanced/series-predict", params={
+            "teamA": "G2", "teamB": "SEN", "maps": "Ascent,Bind,Haven,Lotus", "topN": 2
+        })
+    
+    assert response.status_code == 200
+    assert mock_predict.call_count == 1
+    assert mock_predict.call_args.args[2] == ["Ascent", "Bind", "Haven", "Lotus"]
+    data = response.json()
+    assert data["headline"]["maps"] == ["Ascent", "Bind", "Lotus"]
+    assert data["headline"]["prob_teamA"] == pytest.approx(0.72 + 0.54 + 0.48 - 2 * 0.432)
+    assert [m["map"] for m in data["headline"]["per_map"]] == ["Ascent", "Bind", "Lotus"]
+    assert len(data["alternatives"]) == 1
+
+def test_series_predict_validates_input_upfront():
+    """Test BO3 input is rejected before any map is scored."""
+    from unittest.mock import patch
+    
+    with patch("app.routers.advanced_predictions.advanced_predictor.predict_many") as mock_predict:
+        same_team = client.get("/advanced/series-predict", params={"teamA": "G2", "teamB": "G2"})
+        repeated_maps = client.get("/advanced/series-predict", params={
+            "teamA": "G2", "teamB": "SEN", "maps": "Bind,Bind,Ascent"
+        })
+    
+    assert same_team.status_code == 422
+    assert repeated_maps.status_code == 422
+    assert mock_predict.call_count == 0
+
+@pytest.mark.asyncio
+async def test_advanced_predictions_memoized_per_snapshot():
+    """Test repeated map predictions reuse results until the predictor reloads."""
+    from unittest.mock import patch
+    from app.advanced_predictor import advanced_predictor
+    from app.routers.advanced_predictions import _advanced_predict, _cached_advanced_predict
+    
+    _cached_advanced_predict.cache_clear()
+    with patch.object(advanced_predictor, "predict", return_value={"prob_teamA": 0.6}) as mock_predict, \
+         patch.object(advanced_predictor, "model_loaded_at", 1.0):
+        await _advanced_predict("G2", "SEN", "Bind")
+        await _advanced_predict("G2", "SEN", "Bind")
+        assert mock_predict.call_count == 1
+        
+        advanced_predictor.model_loaded_at = 2.0
+        await _advanced_predict("G2", "SEN", "Bind")
+        assert mock_predict.call_count == 2
+
+def test_realistic_predict_uses_injected_predictor():
+    """Test the realistic endpoint resolves its predictor through the dependency."""
+    from unittest.mock import MagicMock
+    from app.symmetric_predictor import get_symmetric_predictor
+    
+    predictor = MagicMock()
+    predictor.predict.return_value = {
+        "prob_teamA": 0.6, "prob_teamB": 0.4, "winner": "G2", "confidence": 0.6,
+        "model_version": "symmetric_realistic_v1.0", "uncertainty": "Medium",
+        "explanation": "", "features": {}
+    }
+    app.dependency_overrides[get_symmetric_predictor] = lambda: predictor
+    try:
+        response = client.get("/advanced/realistic/map-predict",
+                              params={"teamA": "G2", "teamB": "SEN", "map_name": "Bind"})
+    finally:
+        app.dependency_overrides.clear()
+    
+    assert response.status_code == 200
+    assert response.json()["winner"] == "G2"
+    predictor.predict.assert_called_once_with("G2", "SEN", "Bind")
+
+def test_available_lists_served_with_etag():
+    """Test static map/team lists carry long-lived caching headers and honor ETags."""
+    for path in ["/advanced/available-maps", "/advanced/available-teams"]:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+        
+        revalidated = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+    
+    assert client.get("/advanced/available-maps").json()["total_maps"] == 9
+
+def _rankings_response(teams_for):
+    """Stand-in for VLRClient._make_request serving /rankings from teams_for(region)."""
+    async def make_request(method, endpoint, params=None):
+        return {"status": 200, "data": teams_for(params["region"])}
+    return make_request
+
+def test_all_rankings_fetch_regions_concurrently():
+    """Test every region is requested and a failing region is skipped."""
+    from unittest.mock import AsyncMock, patch
+    from app.upstream import vlr_client, _response_cache
+    
+    def teams_for(region):
+        if region == "cn":
+            raise RuntimeError("upstream down")
+        return [{"team": f"Team {region}", "rank": "1"}]
+    
+    _response_cache.clear()
+    with patch.object(vlr_client, "_make_request", new=AsyncMock(side_effect=_rankings_response(teams_for))) as mock_request:
+        response = client.get("/teams/rankings", params={"professional_only": False})
+    
+    assert response.status_code == 200
+    assert mock_request.call_count == 9
+    teams = response.json()["teams"]
+    assert len(teams) == 8
+    assert "CN" not in {team["region"] for team in teams}
+
+def test_rankings_cached_per_region():
+    """Test ranking responses are shared with the VLR client cache until refreshed."""
+    from unittest.mock import AsyncMock, patch
+    from app.upstream import vlr_client, _response_cache
+    
+    _response_cache.clear()
+    fetch = AsyncMock(side_effect=_rankings_response(lambda region: [{"team": f"Team {region}", "rank": "1"}]))
+    with patch.object(vlr_client, "_make_request", new=fetch):
+        client.get("/teams/rankings", params={"professional_only": False})
+        regional = client.get("/teams/rankings/na")
+        client.get("/teams/search", params={"query": "zzz"})
+        assert fetch.call_count == 9
+        
+        client.get("/teams/rankings", params={"professional_only": False, "force_refresh": True})
+        assert fetch.call_count == 18
+    
+    assert regional.json()["teams"][0]["team_id"] == "team_na"
+    _response_cache.clear()
+
+def test_all_rankings_sorted_by_region_and_rank():
+    """Test combined rankings come back ordered by region label, then numeric rank."""
+    from unittest.mock import AsyncMock, patch
+    from app.upstream import vlr_client, _response_cache
+    
+    def teams_for(region):
+        return [{"team": f"{region} low", "rank": "10"}, {"team": f"{region} top", "rank": "2"},
+                {"team": f"{region} new", "rank": "-"}]
+    
+    _response_cache.clear()
+    with patch.object(vlr_client, "_make_request", new=AsyncMock(side_effect=_rankings_response(teams_for))):
+        teams = client.get("/teams/rankings", params={"professional_only": False}).json()["teams"]
+    _response_cache.clear()
+    
+    assert [team["team"] for team in teams[:3]] == ["ap top", "ap low", "ap new"]
+    keys = [(team["region"], int(team["rank"]) if team["rank"].isdigit() else 999) for team in teams]
+    assert keys == sorted(keys)
+
+def test_region_rankings_keep_api_order():
+    """Test a single region's rankings come back in API order, even with non-numeric ranks."""
+    from unittest.mock import AsyncMock, patch
+    from app.upstream import vlr_client, _response_cache
+    
+    def teams_for(region):
+        return [{"team": "Team B", "rank": "2"}, {"team": "Team A", "rank": "T-1"}]
+    
+    _response_cache.clear()
+    with patch.object(vlr_client, "_make_request", new=AsyncMock(side_effect=_rankings_response(teams_for))):
+        response = client.get("/teams/rankings/na")
+    _response_cache.clear()
+    
+    assert response.status_code == 200
+    assert [team["team"] for team in response.json()["teams"]] == ["Team B", "Team A"]
+
+def test_unexpected_error_keeps_cors_headers():
+    """Test an unexpected endpoint error renders a 500 that still carries CORS headers."""
+    from unittest.mock import MagicMock
+    from app.symmetric_predictor import get_symmetric_predictor
+    
+    predictor = MagicMock()
+    predictor.predict.side_effect = RuntimeError("boom")
+    app.dependency_overrides[get_symmetric_predictor] = lambda: predictor
+    try:
+        response = client.get("/advanced/realistic/map-predict",
+                              params={"teamA": "G2", "teamB": "SEN", "map_name": "Bind"},
+                              headers={"Origin": "https://example.com"})
+    finally:
+        app.dependency_overrides.clear()
+    
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Internal server error: boom"
+    assert response.headers["access-control-allow-origin"]
@@ -0,0 +1,41 @@
+"""Test match history indexes."""
+
+import pytest
+from app.enhanced_predictor import MatchHistory
+
+@pytest.fixture
+def match_history(tmp_path):
+    """Create match history backed by a temporary file."""
+    return MatchHistory(data_file=str(tmp_path / "match_history.json"))
+
+def _match(team1, team2, winner):
+    return {"team1": {"name": team1}, "team2": {"name": team2}, "winner": winner}
+
+def test_team_form_and_head_to_head(match_history):
+    """Test form and H2H lookups are served from the indexes."""
+    match_history.add_match(_match("Sentinels", "G2 Esports", "G2 Esports"))
+    match_history.add_match(_match("G2 Esports", "Sentinels", "G2 Esports"))
+    match_history.add_match(_match("Sentinels", "LOUD", "Sentinels"))
+    
+    form = match_history.get_team_form("Sentinels")
+    assert form["form"] == ["L", "L", "W"]
+    assert form["streak"] == 1
+    assert form["streak_type"] == "win"
+    
+    h2h = match_history.get_head_to_head("Sentinels", "G2 Esports")
+    assert h2h["team1_wins"] == 0
+    assert h2h["team2_wins"] == 2
+    assert h2h["total_matches"] == 2
+    assert h2h["recent_trend"] == "team2"
+    
+    # Unknown teams return neutral defaults
+    assert match_history.get_team_form("Unknown")["total_matches"] == 0
+    assert match_history.get_head_to_head("Unknown", "LOUD")["total_matches"] == 0
+
+def test_indexes_persist(match_history):
+    """Test indexes are reloaded from disk without rebuilding."""
+    match_history.add_match(_match("Fnatic", "Team Liquid", "Fnatic"))
+    
+    reloaded = MatchHistory(data_file=str(match_history.data_file))
+    assert reloaded.get_team_form("Fnatic")["form"] == ["W"]
+    assert reloaded.get_head_to_head("Team Liquid", "Fnatic")["team2_wins"] == 1
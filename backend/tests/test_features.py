@@ -1,6 +1,7 @@
 """Test feature store functionality."""
 
 import pytest
+import numpy as np
 import asyncio
 from unittest.mock import AsyncMock, patch
 from app.features import FeatureStore
@@ -96,3 +97,103 @@ def test_get_cache_stats(feature_store):
     assert "cache_size" in stats
     assert "max_size" in stats
     assert "ttl" in stats
+
+@pytest.mark.asyncio
+async def test_get_team_stats_many_dedupes(feature_store):
+    """Test batch team stats fetch each unique team once."""
+    with patch.object(feature_store, 'get_team_stats', new=AsyncMock(side_effect=lambda team_id: {"team_id": team_id})) as mock_get:
+        result = await feature_store.get_team_stats_many(["a", "b", "a"])
+        
+        assert mock_get.await_count == 2
+        assert result == {"a": {"team_id": "a"}, "b": {"team_id": "b"}}
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(feature_store):
+    """Test concurrent cache misses for one team issue a single upstream call."""
+    async def slow_stats(team_id, days):
+        await asyncio.sleep(0.01)
+        return {"team": {"name": "Test Team"}, "matches": []}
+    
+    with patch('app.features.vlr_client.get_team_stats', new=AsyncMock(side_effect=slow_stats)) as mock_get_stats:
+        results = await asyncio.gather(*[feature_store.get_team_stats("unmapped_team") for _ in range(5)])
+    
+    assert mock_get_stats.await_count == 1
+    assert all(result is results[0] for result in results)
+    assert feature_store._inflight == {}
+
+def test_processed_stats_omit_raw_data(feature_store):
+    """Test processed stats carry rank and region but not the raw payload."""
+    raw_stats = {
+        "team": {"name": "Test Team"},
+        "summary_stats": {"avg_acs": 210.0, "avg_kd": 1.1, "avg_rating": 1.05, "win_rate": 0.6,
+                          "maps_played": 12, "rank": "7", "region": "EU"}
+    }
+    
+    result = feature_store._process_team_stats(raw_stats, "test_team")
+    
+    assert "raw_data" not in result
+    assert result["rank"] == "7"
+    assert result["region"] == "EU"
+
+@pytest.mark.asyncio
+async def test_professional_team_uses_precomputed_stats(feature_store):
+    """Test mapped teams are served from precomputed stats without touching them."""
+    from app.team_mapping import team_mapper
+    
+    result = await feature_store.get_team_stats("paper_rex")
+    
+    assert result["team_name"] == "Paper Rex"
+    assert result["avg_acs"] == 198.0
+    assert result["rank"] == 1
+    assert "last_updated" not in team_mapper._precomputed_stats["paper_rex"]
+
+@pytest.mark.asyncio
+async def test_stats_rows_follow_fetched_stats(feature_store):
+    """Test fetched team stats are mirrored into the stats matrix."""
+    await feature_store.get_team_stats("paper_rex")
+    with patch('app.features.vlr_client.get_team_stats', new=AsyncMock(side_effect=RuntimeError("down"))):
+        await feature_store.get_team_stats("unknown_team")
+    
+    rows = feature_store.get_stats_rows(["unknown_team", "paper_rex"])
+    
+    assert rows.shape == (2, 4)
+    assert rows[0].tolist() == [0.0, 0.0, 0.0, 0.0]
+    assert rows[1][0] == 198.0
+
+@pytest.mark.asyncio
+async def test_stats_rows_follow_cache_hits(feature_store):
+    """Test a team served from the cache keeps its row after other teams fill the matrix."""
+    feature_store._stats_matrix = np.zeros((3, 4), dtype=np.float32)
+    for team_id in ["sentinels", "g2_esports", "nrg", "fnatic"]:
+        await feature_store.get_team_stats(team_id)
+    
+    await feature_store.get_team_stats_many(["sentinels", "nrg"])
+    rows = feature_store.get_stats_rows(["sentinels", "nrg"])
+    
+    assert rows[:, 0].tolist() == [
+        feature_store.cache["team_stats:sentinels"]["avg_acs"],
+        feature_store.cache["team_stats:nrg"]["avg_acs"]
+    ]
+
+@pytest.mark.asyncio
+async def test_stats_rows_rebuild_evicted_rows(feature_store):
+    """Test more teams than the matrix holds are rebuilt from the cached stats."""
+    feature_store._stats_matrix = np.zeros((2, 4), dtype=np.float32)
+    team_ids = ["sentinels", "g2_esports", "nrg"]
+    stats = await feature_store.get_team_stats_many(team_ids)
+    
+    rows = feature_store.get_stats_rows(team_ids)
+    
+    assert rows.shape == (3, 4)
+    assert rows[:, 0].tolist() == [stats[team_id]["avg_acs"] for team_id in team_ids]
+
+def test_stats_rows_bounded(feature_store):
+    """Test the stats matrix reuses the stalest team's row instead of growing."""
+    capacity = len(feature_store._stats_matrix)
+    for i in range(capacity + 5):
+        feature_store._write_stats_row(f"team_{i}", {"avg_acs": float(i)})
+    
+    assert len(feature_store._stats_matrix) == capacity
+    assert len(feature_store._team_index) == capacity
+    assert "team_0" not in feature_store._team_index
+    assert feature_store.get_stats_rows([f"team_{capacity + 4}"])[0][0] == capacity + 4
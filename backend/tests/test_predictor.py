@@ -27,7 +27,6 @@ def sample_team_stats():
 
 def test_baseline_predictor_initialization(baseline_predictor):
     """Test baseline predictor initialization."""
-    assert baseline_predictor.model is None
     assert baseline_predictor.feature_names is not None
     assert len(baseline_predictor.feature_names) == 12
     assert baseline_predictor.model_version == "baseline_v1.0"
@@ -138,3 +137,65 @@ def test_trained_predictor_without_model():
     assert "predicted_winner" in prediction
     assert "confidence" in prediction
     assert prediction["model_version"] == "baseline_v1.0"  # Should fall back to baseline
+
+def test_baseline_predict_batch_matches_predict(baseline_predictor, sample_team_stats):
+    """Test batch predictions agree with single predictions."""
+    weaker = {"avg_acs": 150.0, "avg_kd": 0.8, "avg_rating": 0.7, "win_rate": 0.3}
+    empty = {"avg_acs": 0, "avg_kd": 0, "avg_rating": 0, "win_rate": 0}
+    pairs = [(sample_team_stats, weaker), (weaker, sample_team_stats), (empty, empty)]
+    
+    batch = baseline_predictor.predict_batch(pairs)
+    
+    assert len(batch) == 3
+    for (team1_stats, team2_stats), prediction in zip(pairs, batch):
+        single = baseline_predictor.predict(team1_stats, team2_stats)
+        assert prediction["predicted_winner"] == single["predicted_winner"]
+        for key in ("confidence", "team1_win_probability", "team2_win_probability"):
+            assert prediction[key] == pytest.approx(single[key])
+
+def test_trained_predict_batch_with_model(sample_team_stats):
+    """Test trained batch predictions make one model call for all matchups."""
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 12))
+    y = (X[:, 8] > 0).astype(int)
+    
+    predictor = TrainedPredictor()
+    predictor.model = LogisticRegression().fit(X, y)
+    predictor.scaler = None
+    
+    weaker = {"avg_acs": 150.0, "avg_kd": 0.8, "avg_rating": 0.7, "win_rate": 0.3}
+    pairs = [(sample_team_stats, weaker), (weaker, sample_team_stats)]
+    batch = predictor.predict_batch(pairs)
+    
+    for (team1_stats, team2_stats), prediction in zip(pairs, batch):
+        single = predictor.predict(team1_stats, team2_stats)
+        assert prediction["predicted_winner"] == single["predicted_winner"]
+        assert prediction["team1_win_probability"] == single["team1_win_probability"]
+
+@pytest.mark.asyncio
+async def test_trained_predictor_loads_joblib_model(tmp_path):
+    """Test trained predictor loads a joblib model file."""
+    import joblib
+    import numpy as np
+    from sklearn.ensemble import RandomForestClassifier
+    
+    X = np.random.default_rng(0).normal(size=(30, 12))
+    y = (X[:, 8] > 0).astype(int)
+    model_path = tmp_path / "model.joblib"
+    joblib.dump({
+        "model": RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y),
+        "scaler": None,
+        "feature_names": ["f"] * 12,
+        "version": "test_v1"
+    }, model_path)
+    
+    predictor = TrainedPredictor(model_path=str(model_path))
+    assert predictor.model is None
+    await predictor.ensure_loaded()
+    
+    assert predictor.model_version == "test_v1"
+    prediction = predictor.predict({"avg_acs": 220}, {"avg_acs": 180})
+    assert prediction["model_version"] == "test_v1"
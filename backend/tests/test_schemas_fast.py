@@ -0,0 +1,43 @@
+"""Test msgspec response structs."""
+
+from datetime import datetime
+import msgspec
+import numpy as np
+from app.models import PredictionResponse
+from app.schemas_fast import PredictionResponseFast, TeamStatsFast, msgspec_response
+
+def _team_stats(team_id: str) -> TeamStatsFast:
+    """Build team stats for a test team."""
+    return TeamStatsFast(
+        team_id=team_id,
+        team_name=team_id.upper(),
+        avg_acs=210.5,
+        avg_kd=1.1,
+        avg_rating=1.05,
+        win_rate=0.6,
+        maps_played=12,
+        last_updated=datetime(2024, 1, 1, 12, 0)
+    )
+
+def test_prediction_struct_matches_pydantic_schema():
+    """Test encoded structs validate against the documented Pydantic model."""
+    prediction = PredictionResponseFast(
+        team1_id="a",
+        team2_id="b",
+        predicted_winner="A",
+        confidence=np.float64(0.61),
+        team1_win_probability=0.61,
+        team2_win_probability=0.39,
+        team1_stats=_team_stats("a"),
+        team2_stats=_team_stats("b"),
+        prediction_timestamp=datetime(2024, 1, 1, 12, 5),
+        model_version="baseline_v1.0"
+    )
+    
+    response = msgspec_response(prediction)
+    assert response.media_type == "application/json"
+    
+    parsed = PredictionResponse.model_validate_json(response.body)
+    assert parsed.team1_stats.maps_played == 12
+    assert parsed.confidence == 0.61
+    assert msgspec.json.decode(response.body)["team2_stats"]["team_id"] == "b"
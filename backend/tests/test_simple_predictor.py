@@ -0,0 +1,132 @@
+"""Test simple predictor historical features."""
+
+import pandas as pd
+import pytest
+from app.simple_predictor import SimplePredictor
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    """Simple predictor over a small history CSV."""
+    csv_path = tmp_path / "history.csv"
+    pd.DataFrame([
+        {"date": "2025-01-01", "teamA": "G2", "teamB": "SEN", "map_name": "Bind", "winner": "G2", "tier": 1,
+         "teamA_ACS": 240.0, "teamB_ACS": 200.0, "teamA_KD": 1.2, "teamB_KD": 0.9},
+        {"date": "2025-01-01", "teamA": "G2", "teamB": "SEN", "map_name": "Ascent", "winner": "SEN", "tier": 2,
+         "teamA_ACS": 190.0, "teamB_ACS": 230.0, "teamA_KD": 0.8, "teamB_KD": 1.1},
+        {"date": "2025-05-01", "teamA": "G2", "teamB": "LOUD", "map_name": "Bind", "winner": "LOUD", "tier": 2,
+         "teamA_ACS": 210.0, "teamB_ACS": 220.0, "teamA_KD": 1.0, "teamB_KD": 1.0},
+    ]).to_csv(csv_path, index=False)
+    monkeypatch.setenv("DATA_CSV", str(csv_path))
+    return SimplePredictor(artifacts_dir=str(tmp_path))
+
+def test_map_elo_updates_and_decays(predictor):
+    """Test per-map Elo applies tier K, keeps maps apart and decays idle ratings."""
+    ratings = predictor._compute_map_elo()
+
+    # G2 won Bind at K=22, then sat 120 days (one half-life) before losing to a fresh LOUD
+    decayed = 1500.0 + 11.0 * 0.5
+    expected = 1.0 / (1.0 + 10.0 ** ((1500.0 - decayed) / 400.0))
+    assert predictor._elo_rating(ratings, "G2", "Bind") == pytest.approx(decayed - 20.0 * expected)
+    assert predictor._elo_rating(ratings, "SEN", "Bind") == pytest.approx(1489.0)
+    assert predictor._elo_rating(ratings, "G2", "Ascent") == pytest.approx(1490.0)
+    assert predictor._elo_rating(ratings, "SEN", "Ascent") == pytest.approx(1510.0)
+
+def test_map_elo_defaults_for_unseen(predictor):
+    """Test teams or maps without history rate at the mean."""
+    ratings = predictor._compute_map_elo()
+
+    assert predictor._elo_rating(ratings, "LOUD", "Ascent") == 1500.0
+    assert predictor._elo_rating(ratings, "NRG", "Bind") == 1500.0
+    assert predictor._elo_rating(ratings, "G2", "Lotus") == 1500.0
+
+def test_map_elo_built_once_per_history(predictor):
+    """Test feature rows reuse the Elo table until the history is rebuilt."""
+    from unittest.mock import patch
+
+    with patch.object(predictor, "_compute_map_elo", wraps=predictor._compute_map_elo) as mock_elo:
+        predictor._compute_feature_row_for_match("G2", "SEN", "Bind")
+        predictor._compute_feature_row_for_match("G2", "LOUD", "Bind")
+        assert mock_elo.call_count == 1
+
+        predictor._build_history_arrays()
+        predictor._compute_feature_row_for_match("G2", "SEN", "Bind")
+        assert mock_elo.call_count == 2
+
+def test_feature_helpers_weight_prior_rows(predictor):
+    """Test win rate, H2H and stat helpers weight only earlier rows on the map by recency."""
+    ref_date = pd.Timestamp("2025-05-02")
+    old, recent = 0.5 ** (121 / 60), 0.5 ** (1 / 60)
+
+    assert predictor._recency_weighted_winrate(ref_date, "G2", "Bind") == pytest.approx(old / (old + recent))
+    assert predictor._recency_weighted_winrate(ref_date, "LOUD", "Ascent") is None
+    assert predictor._h2h_shrunken(ref_date, "G2", "SEN", "Bind") == pytest.approx(1 / 8)
+    assert predictor._h2h_shrunken(ref_date, "SEN", "G2", "Bind") == pytest.approx(-1 / 8)
+    assert predictor._h2h_shrunken(pd.Timestamp("2025-01-01"), "G2", "SEN", "Bind") == 0.0
+    assert predictor._recency_agg_metric(ref_date, "G2", "Bind", "ACS") == pytest.approx(
+        (old * 240.0 + recent * 210.0) / (old + recent)
+    )
+
+def test_predictions_memoized_per_history_version(predictor):
+    """Test repeat predictions reuse results until the history is rebuilt."""
+    from unittest.mock import patch
+
+    with patch.object(predictor, "_predict", wraps=predictor._predict) as mock_predict:
+        first = predictor.predict("G2", "SEN", "Bind")
+        first["features"]["winrate_diff"] = 99.0
+        second = predictor.predict("G2", "SEN", "Bind")
+        assert second["features"]["winrate_diff"] != 99.0
+        assert mock_predict.call_count == 1
+
+        predictor._build_history_arrays()
+        predictor.predict("G2", "SEN", "Bind")
+        assert mock_predict.call_count == 2
+
+def test_predict_matches_pipeline(predictor):
+    """Test the precomputed linear terms reproduce the sklearn pipeline."""
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    xcols = ["winrate_diff", "h2h_shrunk", "sos_mapelo_diff", "acs_diff", "kd_diff"]
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, len(xcols)))
+    y = (X[:, 0] + X[:, 2] > 0).astype(int)
+    predictor.model = Pipeline([("scaler", StandardScaler()), ("clf", LogisticRegression())]).fit(X, y)
+    predictor.xcols = xcols
+    predictor._cache_linear_terms()
+
+    result = predictor._predict("G2", "SEN", "Bind")
+    x = np.array([[result["features"][c] for c in xcols]])
+    expected = predictor.model.predict_proba(x)[0, 1]
+    contrib = predictor.model.named_steps["scaler"].transform(x)[0] * predictor.model.named_steps["clf"].coef_[0]
+
+    assert result["prob_teamA"] == pytest.approx(expected)
+    assert [result["factor_contrib"][c] for c in xcols] == pytest.approx(contrib.tolist())
+
+def test_history_prefers_parquet(predictor, tmp_path):
+    """Test a Parquet copy beside the CSV is loaded with its typed dates."""
+    pytest.importorskip("pyarrow")
+    predictor.df_hist.iloc[:1].to_parquet(tmp_path / "history.parquet", index=False)
+
+    predictor._load_historical_data()
+    assert len(predictor.df_hist) == 1
+    assert pd.api.types.is_datetime64_any_dtype(predictor.df_hist["date"])
+
+def test_history_skips_stale_or_corrupt_parquet(predictor, tmp_path):
+    """Test the CSV is used when the Parquet copy is older than it or unreadable."""
+    import os
+
+    parquet_path = tmp_path / "history.parquet"
+    csv_mtime = os.path.getmtime(tmp_path / "history.csv")
+
+    parquet_path.write_bytes(b"not parquet")
+    os.utime(parquet_path, (csv_mtime + 10, csv_mtime + 10))
+    predictor._load_historical_data()
+    assert len(predictor.df_hist) == 3
+
+    pytest.importorskip("pyarrow")
+    predictor.df_hist.iloc[:1].to_parquet(parquet_path, index=False)
+    os.utime(parquet_path, (csv_mtime - 10, csv_mtime - 10))
+    predictor._load_historical_data()
+    assert len(predictor.df_hist) == 3
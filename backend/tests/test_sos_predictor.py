@@ -0,0 +1,110 @@
+"""Test strength of schedule predictor."""
+
+import pytest
+from app.strength_of_schedule_predictor import StrengthOfSchedulePredictor
+
+@pytest.fixture
+def sos_predictor():
+    """Create SOS predictor for testing."""
+    return StrengthOfSchedulePredictor()
+
+def make_stats(rank, region="NA", **stats):
+    """Team stats with a rank and region, defaulting to an average team."""
+    return {
+        "team_name": f"Rank {rank}",
+        "rank": rank,
+        "region": region,
+        "avg_acs": 200.0,
+        "avg_kd": 1.0,
+        "avg_rating": 1.0,
+        "win_rate": 0.5,
+        **stats
+    }
+
+def test_rank_weights(sos_predictor):
+    """Test rank weights follow the piecewise schedule and floor at 0.1."""
+    assert sos_predictor.rank_weights[1] == 1.0
+    assert sos_predictor.rank_weights[10] == 0.55
+    assert sos_predictor.rank_weights[30] == 0.35
+    assert sos_predictor.rank_weights[50] == 0.15
+    assert sos_predictor.rank_weights[200] == 0.1
+
+def test_get_team_rank(sos_predictor):
+    """Test string, tied and numeric ranks parse, and missing ranks count as the weakest."""
+    assert sos_predictor._get_team_rank(make_stats("4")) == 4
+    assert sos_predictor._get_team_rank(make_stats("T-12")) == 12
+    assert sos_predictor._get_team_rank(make_stats(7)) == 7
+    assert sos_predictor._get_team_rank(make_stats("unranked")) == 200
+    assert sos_predictor._get_team_rank(make_stats(None)) == 200
+    assert sos_predictor._get_team_rank(make_stats("T-450")) == 200
+
+def test_strength_of_schedule_multiplier(sos_predictor):
+    """Test SOS multiplier combines rank weight and region strength."""
+    def sos(rank, region="NA"):
+        team_stats = make_stats(rank, region)
+        return sos_predictor._calculate_strength_of_schedule(team_stats, sos_predictor._get_team_rank(team_stats))
+    
+    assert sos("1") == pytest.approx(1.0)
+    assert sos("T-5", "KR") == pytest.approx(0.8 * 1.15)
+    assert sos("unranked", "OCE") == pytest.approx(0.1 * 0.85)
+
+def test_rank_difference_bonus(sos_predictor):
+    """Test close ranks get no bonus and the better rank is favoured."""
+    assert sos_predictor._calculate_rank_difference_bonus(1, 4) == (1.0, 1.0)
+    bonus1, bonus2 = sos_predictor._calculate_rank_difference_bonus(40, 10)
+    assert bonus1 == pytest.approx(0.85)
+    assert bonus2 == pytest.approx(1.3)
+    assert sos_predictor._calculate_rank_difference_bonus(6, 12) == pytest.approx((1.06, 0.97))
+    assert sos_predictor._calculate_rank_difference_bonus(999, 1) == pytest.approx((0.8, 1.3))
+
+def test_sos_predict_favours_stronger_schedule(sos_predictor):
+    """Test equal stats favour the team with the stronger schedule."""
+    prediction = sos_predictor.predict(make_stats("100", "OCE"), make_stats("2", "EU"))
+
+    assert prediction["predicted_winner"] == "team2"
+    assert prediction["team1_win_probability"] + prediction["team2_win_probability"] == pytest.approx(1.0)
+    assert prediction["confidence"] == prediction["team2_win_probability"]
+    assert prediction["prediction_timestamp"].tzinfo is not None
+    assert prediction["strength_of_schedule"]["team2"]["original_rank"] == 2
+    assert prediction["strength_of_schedule"]["team2"]["adjusted_stats"]["avg_acs"] > 200.0
+
+def test_sos_predict_batch_matches_predict(sos_predictor):
+    """Test batch predictions agree with single predictions."""
+    strong = make_stats("3", "KR", avg_acs=230.0, avg_kd=1.25, avg_rating=1.15, win_rate=0.72)
+    weak = make_stats("T-60", "MN", avg_acs=190.0, avg_kd=0.9, avg_rating=0.95, win_rate=0.4)
+    close = make_stats("5", "EU", avg_acs=225.0, win_rate=0.65)
+    empty = {"avg_acs": 0, "avg_kd": 0, "avg_rating": 0, "win_rate": 0}
+    pairs = [(strong, weak), (weak, strong), (strong, close), (empty, empty)]
+
+    batch = sos_predictor.predict_batch(pairs)
+
+    assert len(batch) == 4
+    assert len({prediction["prediction_timestamp"] for prediction in batch}) == 1
+    for (team1_stats, team2_stats), prediction in zip(pairs, batch):
+        single = sos_predictor.predict(team1_stats, team2_stats)
+        assert prediction["predicted_winner"] == single["predicted_winner"]
+        for key in ("confidence", "team1_win_probability", "team2_win_probability"):
+            assert prediction[key] == pytest.approx(single[key])
+        for team in ("team1", "team2"):
+            assert prediction["strength_of_schedule"][team]["original_rank"] == single["strength_of_schedule"][team]["original_rank"]
+            assert prediction["strength_of_schedule"][team]["adjusted_stats"] == pytest.approx(single["strength_of_schedule"][team]["adjusted_stats"])
+
+def test_sos_predict_bad_stats_fall_back_to_baseline(sos_predictor):
+    """Test invalid stats make predict fall back to the baseline predictor."""
+    from app.predictor import baseline_predictor
+    
+    prediction = sos_predictor.predict(make_stats("1", avg_acs="n/a"), make_stats("2"))
+    
+    assert prediction["model_version"] == baseline_predictor.model_version
+
+def test_repeated_team_adjusted_once(sos_predictor):
+    """Test a team seen again with the same stats reuses its cached adjustment."""
+    from app.strength_of_schedule_predictor import _cached_sos_adjust
+    
+    _cached_sos_adjust.cache_clear()
+    team = make_stats("8", "EU", avg_acs=221.0)
+    sos_predictor.predict(team, make_stats("30"))
+    sos_predictor.predict(team, make_stats("31"))
+    
+    info = _cached_sos_adjust.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
@@ -0,0 +1,61 @@
+"""Test symmetric realistic predictor wrapper."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from app.symmetric_predictor import SymmetricRealisticPredictor
+
+def base_prediction(prob_teamA, **features):
+    """A base predictor result giving teamA the given probability."""
+    return {
+        "prob_teamA": prob_teamA,
+        "prob_teamB": 1 - prob_teamA,
+        "winner": "",
+        "confidence": max(prob_teamA, 1 - prob_teamA),
+        "model_version": "realistic_v1.0",
+        "uncertainty": "High",
+        "explanation": "",
+        "features": features
+    }
+
+def make_predictor(side_effect, **kwargs):
+    """Symmetric predictor over a mocked base predictor."""
+    base = MagicMock()
+    base.predict.side_effect = side_effect
+    with patch("app.symmetric_predictor.get_realistic_predictor", return_value=base):
+        return SymmetricRealisticPredictor(**kwargs)
+
+def test_predict_averages_both_orders():
+    """Test A vs B and B vs A are averaged into one probability."""
+    predictor = make_predictor([base_prediction(0.7, h2h_advantage=1.0, rest_advantage=3.0), base_prediction(0.4, h2h_advantage=-0.5)])
+    
+    prediction = predictor.predict("G2", "SEN", "Bind")
+    
+    assert predictor.base_predictor.predict.call_count == 2
+    assert prediction["prob_teamA"] == pytest.approx(0.65)
+    assert prediction["winner"] == "G2"
+    assert prediction["features"] == pytest.approx({"h2h_advantage": 0.75, "rest_advantage": 3.0})
+    assert prediction["asymmetry_detected"]
+
+def test_predict_assume_symmetric_single_call():
+    """Test a known-symmetric base predictor is only run once."""
+    predictor = make_predictor([base_prediction(0.7)], assume_symmetric=True)
+    
+    prediction = predictor.predict("G2", "SEN", "Bind")
+    
+    predictor.base_predictor.predict.assert_called_once()
+    assert prediction["prob_teamA"] == 0.7
+    assert prediction["model_version"] == "symmetric_realistic_v1.0"
+    assert not prediction["asymmetry_detected"]
+
+def test_swapped_query_reuses_base_predictions():
+    """Test B vs A after A vs B needs no new base predictions until the model changes."""
+    predictor = make_predictor(lambda teamA, *args: base_prediction(0.7 if teamA == "G2" else 0.4))
+    
+    first = predictor.predict("G2", "SEN", "Bind")
+    swapped = predictor.predict("SEN", "G2", "Bind")
+    assert predictor.base_predictor.predict.call_count == 2
+    assert swapped["prob_teamB"] == pytest.approx(first["prob_teamA"])
+    
+    predictor.base_predictor.model = MagicMock()
+    predictor.predict("G2", "SEN", "Bind")
+    assert predictor.base_predictor.predict.call_count == 4
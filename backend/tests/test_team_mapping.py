@@ -0,0 +1,16 @@
+"""Test team name lookup."""
+
+from app.team_mapping import team_mapper
+
+def test_find_team_exact_id_alias_and_name():
+    """Test IDs, aliases and full names resolve regardless of case and padding."""
+    assert team_mapper.find_team("paper_rex").team_id == "paper_rex"
+    assert team_mapper.find_team(" PRX ").team_id == "paper_rex"
+    assert team_mapper.find_team("Gen.G").team_id == "geng"
+    assert team_mapper.find_team("Team RA'AD").team_id == "team_raad"
+
+def test_find_team_partial_match():
+    """Test a name fragment returns the first team containing it, and unknown names return None."""
+    assert team_mapper.find_team("Heretics").team_id == "team_heretics"
+    assert team_mapper.find_team("rex").team_id == "paper_rex"
+    assert team_mapper.find_team("no such team") is None
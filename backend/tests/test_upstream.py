@@ -0,0 +1,182 @@
+"""Test VLR.gg API client."""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.config import settings
+from app.upstream import VLRClient, _response_cache
+
+@pytest.mark.asyncio
+async def test_client_reused_and_closed():
+    """Test the shared HTTP client is reused and closed with the VLR client."""
+    async with VLRClient() as vlr:
+        client = vlr._get_client()
+        assert vlr._get_client() is client
+        assert client.base_url.host == "vlrggapi.vercel.app"
+    
+    assert client.is_closed
+    assert vlr._client is None
+
+@pytest.mark.asyncio
+async def test_team_stats_searches_all_regions():
+    """Test team lookup fetches every region and tolerates failed regions."""
+    async def rankings(region):
+        if region == "na":
+            raise RuntimeError("upstream down")
+        if region == "kr":
+            return [{"team": "T1", "rank": "3", "record": "12–4"}]
+        return []
+    
+    vlr = VLRClient()
+    with patch.object(vlr, "get_rankings", new=AsyncMock(side_effect=rankings)) as mock_rankings:
+        result = await vlr.get_team_stats("t1")
+    
+    assert mock_rankings.await_count == 9
+    assert result["summary_stats"]["region"] == "KR"
+    assert result["summary_stats"]["win_rate"] == 0.75
+
+@pytest.mark.asyncio
+async def test_rankings_cached():
+    """Test repeat rankings lookups are served from the response cache."""
+    _response_cache.clear()
+    vlr = VLRClient()
+    with patch.object(vlr, "_make_request", new=AsyncMock(return_value={"data": [{"team": "T1"}]})) as mock_request:
+        first = await vlr.get_rankings("kr")
+        second = await vlr.get_rankings(region="kr")
+        await vlr.get_rankings("na")
+    
+    assert first == second == [{"team": "T1"}]
+    assert mock_request.await_count == 2
+    _response_cache.clear()
+
+def test_backoff_delay_capped_with_jitter():
+    """Test retry delays grow exponentially, stay capped and include jitter."""
+    vlr = VLRClient()
+    vlr.retry_delay = 1.0
+    
+    first = vlr._backoff_delay(0)
+    assert 1.0 <= first <= 1.0 * (1 + settings.vlr_jitter)
+    
+    capped = vlr._backoff_delay(20)
+    assert settings.vlr_max_backoff <= capped <= settings.vlr_max_backoff * (1 + settings.vlr_jitter)
+
+def _mock_client(statuses, calls):
+    """Build an HTTP client that answers with the given status codes in turn."""
+    def handler(request):
+        status = statuses[min(len(calls), len(statuses) - 1)]
+        calls.append(request)
+        return httpx.Response(status, headers={"Retry-After": "0"}, json={"data": []})
+    return httpx.AsyncClient(base_url="https://vlr.test", transport=httpx.MockTransport(handler))
+
+@pytest.mark.asyncio
+async def test_terminal_status_not_retried():
+    """Test non-retryable client errors fail on the first attempt."""
+    calls = []
+    vlr = VLRClient()
+    vlr._client = _mock_client([404], calls)
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await vlr._make_request("GET", "/rankings")
+    assert len(calls) == 1
+    await vlr.close()
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_retried():
+    """Test 429 responses are retried, honoring Retry-After."""
+    calls = []
+    vlr = VLRClient()
+    vlr._client = _mock_client([429, 200], calls)
+    
+    assert await vlr._make_request("GET", "/rankings") == {"data": []}
+    assert len(calls) == 2
+    await vlr.close()
+
+@pytest.mark.asyncio
+async def test_requests_capped_in_flight():
+    """Test concurrent requests on the shared client stay within the configured cap."""
+    in_flight = []
+    peak = []
+    
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return httpx.Response(200, json={"data": []})
+    
+    vlr = VLRClient()
+    vlr._client = httpx.AsyncClient(base_url="https://vlr.test", transport=httpx.MockTransport(handler))
+    await asyncio.gather(*[vlr._make_request("GET", "/rankings", {"region": str(i)}) for i in range(12)])
+    
+    assert max(peak) == settings.vlr_max_concurrent_requests
+    await vlr.close()
+
+@pytest.mark.asyncio
+async def test_search_teams_uses_prebuilt_index():
+    """Test team search matches substrings and rebuilds only on new rankings."""
+    _response_cache.clear()
+    rankings = [{"team": "Sentinels", "rank": "1"}, {"team": "Team Liquid", "rank": "2"}, {"team": "NRG", "rank": "3"}]
+    vlr = VLRClient()
+    with patch.object(vlr, "_make_request", new=AsyncMock(return_value={"data": rankings})) as mock_request, \
+         patch.object(vlr, "_build_search_index", wraps=vlr._build_search_index) as mock_build:
+        assert [t["name"] for t in await vlr.search_teams("TIN")] == ["Sentinels"]
+        assert [t["id"] for t in await vlr.search_teams("team l")] == ["team_liquid"]
+        assert await vlr.search_teams("zzz") == []
+        assert len(await vlr.search_teams("")) == 3
+        assert mock_build.call_count == 1
+        
+        # Expired rankings are fetched again; the index follows only if they changed
+        _response_cache.clear()
+        assert len(await vlr.search_teams("")) == 3
+        assert mock_build.call_count == 1
+        
+        _response_cache.clear()
+        mock_request.return_value = {"data": rankings + [{"team": "LOUD", "rank": "4"}]}
+        assert [t["name"] for t in await vlr.search_teams("loud")] == ["LOUD"]
+        assert mock_build.call_count == 2
+
+@pytest.mark.asyncio
+async def test_rankings_shared_between_team_stats_and_search():
+    """Test team lookup and search reuse the same cached rankings per region."""
+    _response_cache.clear()
+    vlr = VLRClient()
+    rankings = {"data": [{"team": "Sentinels", "rank": "1", "record": "10–5"}]}
+    with patch.object(vlr, "_make_request", new=AsyncMock(return_value=rankings)) as mock_request:
+        await vlr.get_team_stats("sentinels")
+        await vlr.search_teams("sen")
+    
+    regions = [call.args[2]["region"] for call in mock_request.await_args_list]
+    assert sorted(regions) == sorted(set(regions))
+    assert len(regions) == 9
+    _response_cache.clear()
+
+@pytest.mark.asyncio
+async def test_cached_responses_single_flight_and_isolated():
+    """Test waiters share one fetch after a failure and cached results aren't shared objects."""
+    _response_cache.clear()
+    vlr = VLRClient()
+    calls = []
+    
+    async def fetch(method, endpoint, params=None):
+        calls.append(params["region"])
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise httpx.ConnectError("down")
+        return {"data": [{"team": "T1"}]}
+    
+    with patch.object(vlr, "_make_request", new=fetch):
+        first = asyncio.ensure_future(vlr.get_rankings("kr"))
+        waiters = [asyncio.ensure_future(vlr.get_rankings("kr")) for _ in range(3)]
+        await asyncio.sleep(0)
+        with pytest.raises(httpx.ConnectError):
+            await first
+        # A caller arriving after the failure must queue behind the waiters, not fetch beside them
+        late = await vlr.get_rankings("kr")
+        results = await asyncio.gather(*waiters)
+    
+    assert len(calls) == 2
+    results[0][0]["team"] = "changed"
+    assert late == results[1] == [{"team": "T1"}]
+    assert (await vlr.get_rankings("kr")) == [{"team": "T1"}]
+    _response_cache.clear()
@@ -0,0 +1,36 @@
+"""Write a typed Parquet copy of a history CSV beside it, which the predictors load in preference."""
+
+import pandas as pd
+from pathlib import Path
+import sys
+
+# Add backend to path
+project_root = Path(__file__).parent.parent.parent
+backend_path = project_root / "backend"
+sys.path.insert(0, str(backend_path))
+
+from app.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+def convert_history(csv_path: str) -> Path:
+    """Parse the CSV once (dates included) and save it as Parquet with the same stem."""
+    df = pd.read_csv(csv_path, parse_dates=["date"])
+    output_file = Path(csv_path).with_suffix(".parquet")
+    df.to_parquet(output_file, index=False)
+    
+    logger.info(f"Converted {csv_path} -> {output_file} ({len(df)} rows)")
+    return output_file
+
+def main():
+    """Main conversion function."""
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else str(backend_path / "data" / "map_matches_365d.csv")
+    
+    if not Path(csv_path).exists():
+        logger.error(f"History CSV not found: {csv_path}")
+        return
+    
+    convert_history(csv_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Re-save a pickled trained model as a joblib file the API can memory-map."""
+
+import pickle
+import joblib
+from pathlib import Path
+import sys
+
+# Add backend to path
+project_root = Path(__file__).parent.parent.parent
+backend_path = project_root / "backend"
+sys.path.insert(0, str(backend_path))
+
+from app.config import settings
+from app.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+def convert_model(input_path: str, output_path: str):
+    """Load a pickled model dict and dump it with joblib."""
+    with open(input_path, 'rb') as f:
+        model_data = pickle.load(f)
+    
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model_data, output_file)
+    
+    logger.info(f"Converted {input_path} -> {output_file}")
+
+def main():
+    """Main conversion function."""
+    if len(sys.argv) < 2:
+        print("Usage: python convert_model_to_joblib.py <model.pkl> [output.joblib]")
+        return
+    
+    input_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else settings.model_path
+    
+    if not Path(input_path).exists():
+        logger.error(f"Model file not found: {input_path}")
+        return
+    
+    convert_model(input_path, output_path)
+
+if __name__ == "__main__":
+    main()
@@ -118,7 +118,8 @@ def fix_2_test_prediction_symmetry():
     print("=" * 40)
     
     try:
-        from app.realistic_predictor import realistic_predictor
+        from app.realistic_predictor import get_realistic_predictor
+        realistic_predictor = get_realistic_predictor()
         
         # Test cases: (teamA, teamB, map)
         test_cases = [
@@ -210,7 +211,8 @@ backend_path = project_root / "backend"
 sys.path.insert(0, str(backend_path))
 sys.path.insert(0, str(project_root))
 
-from app.realistic_predictor import realistic_predictor
+from app.realistic_predictor import get_realistic_predictor
+realistic_predictor = get_realistic_predictor()
 
 def validate_symmetry():
     """Validate that predictions are symmetric."""
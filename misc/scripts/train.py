@@ -1,6 +1,6 @@
 """Train ML models for match prediction."""
 
-import pickle
+import joblib
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
@@ -102,8 +102,8 @@ def save_model(model_data: dict, output_path: str):
     model_data["version"] = "1.0"
     model_data["trained_at"] = datetime.utcnow().isoformat()
     
-    with open(output_file, 'wb') as f:
-        pickle.dump(model_data, f)
+    # joblib stores the tree arrays separately so the API can memory-map them
+    joblib.dump(model_data, output_file)
     
     logger.info(f"Model saved to {output_file}")
 
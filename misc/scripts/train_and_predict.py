@@ -242,20 +242,18 @@ def compute_map_elo(df: pd.DataFrame, k_base: float = 20.0, decay_half_life: flo
         ratings[team_map] = mean_rating + (ratings[team_map] - mean_rating) * (0.5 ** chunks)
         last_seen[team_map] = curr_date
 
-    for _, r in df.iterrows():
-        d = r["date"]
-        tA, tB = r["teamA"], r["teamB"]
-        mp = r["map_name"]
+    rows = df[["date", "teamA", "teamB", "map_name", "winner", "tier"]].itertuples(index=False, name=None)
+    for d, tA, tB, mp, winner, tier in rows:
         keyA, keyB = (tA, mp), (tB, mp)
         decay_to_mean(keyA, d); decay_to_mean(keyB, d)
 
         RA = ratings.get(keyA, mean_rating)
         RB = ratings.get(keyB, mean_rating)
         EA = 1.0 / (1.0 + 10.0 ** ((RB - RA) / 400.0))
-        outcomeA = 1.0 if r["winner"] == tA else 0.0
+        outcomeA = 1.0 if winner == tA else 0.0
 
         # Slightly scale K by tier (T1 higher impact)
-        K = k_base * (1.1 if r["tier"] == 1 else 1.0)
+        K = k_base * (1.1 if tier == 1 else 1.0)
         ratings[keyA] = RA + K * (outcomeA - EA)
         ratings[keyB] = RB + K * ((1.0 - outcomeA) - (1.0 - EA))
         last_seen[keyA] = d; last_seen[keyB] = d
@@ -268,9 +266,9 @@ def recency_weighted_winrate(df: pd.DataFrame, ref_date: datetime, team: str, ma
     if hist.empty:
         return None
     num, den = 0.0, 0.0
-    for _, r in hist.iterrows():
-        w = recency_weight(r["date"], ref_date, HALF_LIFE_DAYS)
-        win = 1.0 if r["winner"] == team else 0.0
+    for d, winner in hist[["date", "winner"]].itertuples(index=False, name=None):
+        w = recency_weight(d, ref_date, HALF_LIFE_DAYS)
+        win = 1.0 if winner == team else 0.0
         num += w * win
         den += w
     if den == 0.0:
@@ -286,9 +284,9 @@ def h2h_shrunken(df: pd.DataFrame, ref_date: datetime, teamA: str, teamB: str, m
     if hist.empty:
         return 0.0
     score, wsum, n = 0.0, 0.0, 0
-    for _, r in hist.iterrows():
-        w = math.exp(-days_between(r["date"], ref_date) / tau_days)
-        s = +1.0 if r["winner"] == teamA else -1.0
+    for d, winner in hist[["date", "winner"]].itertuples(index=False, name=None):
+        w = math.exp(-days_between(d, ref_date) / tau_days)
+        s = +1.0 if winner == teamA else -1.0
         score += w * s
         wsum += w
         n += 1
@@ -529,9 +527,10 @@ def compute_feature_row_for_match(df_hist: pd.DataFrame, teamA: str, teamB: str,
                        ((df_hist["teamA"] == team) | (df_hist["teamB"] == team))]
         if rows.empty: return None
         num, den = 0.0, 0.0
-        for _, r in rows.iterrows():
-            w = recency_weight(r["date"], ref_date, HALF_LIFE_DAYS)
-            val = r[f"teamA_{metric}"] if r["teamA"] == team else r[f"teamB_{metric}"]
+        cols = rows[["date", "teamA", f"teamA_{metric}", f"teamB_{metric}"]].itertuples(index=False, name=None)
+        for d, tA, valA, valB in cols:
+            w = recency_weight(d, ref_date, HALF_LIFE_DAYS)
+            val = valA if tA == team else valB
             if pd.notnull(val):
                 num += w * val
                 den += w